@@ -180,6 +180,8 @@ from vtkmodules.vtkCommonDataModel import (
     vtkCell,
     vtkCellArray,
     vtkCellLocator,
+    vtkCellLocatorStrategy,
+    vtkClosestPointStrategy,
     vtkColor3ub,
     vtkCompositeDataSet,
     vtkDataObject,
@@ -237,6 +239,7 @@ from vtkmodules.vtkFiltersCore import (
     vtkCleanPolyData,
     vtkClipPolyData,
     vtkConnectivityFilter,
+    vtkContour3DLinearGrid,
     vtkContourFilter,
     vtkCutter,
     vtkDecimatePro,
@@ -246,6 +249,7 @@ from vtkmodules.vtkFiltersCore import (
     vtkExplicitStructuredGridToUnstructuredGrid,
     vtkFeatureEdges,
     vtkFlyingEdges3D,
+    vtkFlyingEdgesPlaneCutter,
     vtkGlyph3D,
     vtkImplicitPolyDataDistance,
     vtkMarchingCubes,
@@ -264,7 +268,11 @@ from vtkmodules.vtkFiltersCore import (
     vtkWindowedSincPolyDataFilter,
 )
 from vtkmodules.vtkFiltersExtraction import vtkExtractGeometry, vtkExtractGrid, vtkExtractSelection
-from vtkmodules.vtkFiltersFlowPaths import vtkEvenlySpacedStreamlines2D, vtkStreamTracer
+from vtkmodules.vtkFiltersFlowPaths import (
+    vtkCompositeInterpolatedVelocityField,
+    vtkEvenlySpacedStreamlines2D,
+    vtkStreamTracer,
+)
 from vtkmodules.vtkFiltersGeneral import (
     vtkAxes,
     vtkBooleanOperationPolyDataFilter,
@@ -317,7 +325,13 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     # `vtkmodules.vtkFiltersParallelDIY2` is unavailable in some versions of `vtk` from conda-forge
     pass
-from vtkmodules.vtkFiltersPoints import vtkGaussianKernel, vtkPointInterpolator
+from vtkmodules.vtkFiltersPoints import (
+    vtkGaussianKernel,
+    vtkLinearKernel,
+    vtkPointInterpolator,
+    vtkShepardKernel,
+    vtkVoronoiKernel,
+)
 from vtkmodules.vtkFiltersSources import (
     vtkArcSource,
     vtkArrowSource,
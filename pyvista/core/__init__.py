@@ -1,7 +1,9 @@
 """Core routines."""
 
 from .dataset import DataSet, DataObject
+from .builder import MeshBuilder
 from .composite import MultiBlock
+from .pyramid import ImagePyramid
 from .datasetattributes import DataSetAttributes
 from .filters import (
     CompositeFilters,
@@ -11,6 +13,9 @@ from .filters import (
     UniformGridFilters,
 )
 from .grid import Grid, RectilinearGrid, UniformGrid
+from .implicit_points import ImplicitPoints
+from .sampler import Sampler
+from .sparse_grid import SparseVoxelGrid
 from .objects import Table, Texture
 from .pointset import (
     PointGrid,
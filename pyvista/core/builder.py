@@ -0,0 +1,404 @@
+"""Accumulator merging many meshes with a single concatenation."""
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from pyvista.utilities.cells import connected_point_labels, numpy_to_idarr
+from pyvista.utilities.spatial_hash import SpatialHash
+
+from .celltype import CellType
+
+_ARRAY_MODES = ('intersection', 'union', 'strict')
+
+
+def _cell_arrays(cells):
+    """Return the offsets and connectivity arrays of a ``vtkCellArray``."""
+    offsets = _vtk.vtk_to_numpy(cells.GetOffsetsArray())
+    connectivity = _vtk.vtk_to_numpy(cells.GetConnectivityArray())
+    if not offsets.size:
+        offsets = np.zeros(1, dtype=connectivity.dtype)
+    return offsets, connectivity
+
+
+def _polydata_celltypes(category, sizes):
+    """Return the cell types of the cells of one of the cell arrays of a PolyData."""
+    if category == 0:
+        return np.where(sizes == 1, CellType.VERTEX, CellType.POLY_VERTEX)
+    if category == 1:
+        return np.where(sizes == 2, CellType.LINE, CellType.POLY_LINE)
+    if category == 2:
+        celltypes = np.full(sizes.size, CellType.POLYGON)
+        celltypes[sizes == 3] = CellType.TRIANGLE
+        celltypes[sizes == 4] = CellType.QUAD
+        return celltypes
+    return np.full(sizes.size, CellType.TRIANGLE_STRIP)
+
+
+def _expand_ranges(starts, counts):
+    """Return the concatenation of ``range(start, start + count)`` for each pair."""
+    counts = np.asarray(counts, dtype=np.int64)
+    shift = np.repeat(np.asarray(starts, dtype=np.int64) - (np.cumsum(counts) - counts), counts)
+    return shift + np.arange(counts.sum())
+
+
+def _concatenate_cells(chunks, point_offsets):
+    """Concatenate ``(offsets, connectivity)`` chunks and offset their point ids."""
+    conn_sizes = np.array([conn.size for _, conn in chunks], dtype=np.int64)
+    n_cells = np.array([offsets.size - 1 for offsets, _ in chunks], dtype=np.int64)
+    conn_starts = np.cumsum(conn_sizes) - conn_sizes
+
+    connectivity = np.concatenate(
+        [np.empty(0, dtype=pyvista.ID_TYPE)] + [conn for _, conn in chunks]
+    ).astype(pyvista.ID_TYPE, copy=False)
+    connectivity += np.repeat(point_offsets, conn_sizes).astype(pyvista.ID_TYPE, copy=False)
+
+    offsets = np.concatenate(
+        [np.empty(0, dtype=pyvista.ID_TYPE)] + [offsets[:-1] for offsets, _ in chunks]
+    ).astype(pyvista.ID_TYPE, copy=False)
+    offsets += np.repeat(conn_starts - [offsets[0] for offsets, _ in chunks], n_cells).astype(
+        pyvista.ID_TYPE, copy=False
+    )
+    return np.append(offsets, connectivity.size).astype(pyvista.ID_TYPE), connectivity
+
+
+def _merge_labels(points, tolerance):
+    """Return the lowest index of the points merged with each point."""
+    if tolerance > 0:
+        pairs = SpatialHash(points, tolerance).pairs_within(tolerance)
+        offsets = np.arange(0, 2 * pairs.shape[0] + 1, 2)
+        return connected_point_labels(offsets, pairs.ravel(), points.shape[0])
+
+    # exact duplicates are adjacent once sorted lexicographically
+    order = np.lexsort(points.T[::-1])
+    sorted_points = points[order]
+    new_group = np.r_[True, np.any(sorted_points[1:] != sorted_points[:-1], axis=1)]
+    first = np.minimum.reduceat(order, np.flatnonzero(new_group))
+    labels = np.empty(points.shape[0], dtype=np.int64)
+    labels[order] = first[np.cumsum(new_group) - 1]
+    return labels
+
+
+class MeshBuilder:
+    """Accumulate meshes and merge them into a single mesh at once.
+
+    Merging meshes one at a time with :func:`DataSetFilters.merge` or
+    the ``+`` operator copies the growing result at every step, which is
+    quadratic in the number of meshes. The builder instead collects
+    the points, cells and arrays of each mesh, and concatenates them
+    with a single NumPy operation per array when :func:`build
+    <MeshBuilder.build>` is called.
+
+    The output is a :class:`pyvista.PolyData` when all meshes are
+    :class:`pyvista.PolyData`, and a :class:`pyvista.UnstructuredGrid`
+    otherwise.
+
+    Parameters
+    ----------
+    merge_points : bool, default: False
+        Merge the points shared between meshes. Points are merged into
+        the point with the lowest index, which keeps its point data.
+
+    tolerance : float, default: 0.0
+        Points closer than this distance are merged when
+        ``merge_points=True``. Points are hashed on a grid of cells of
+        this size, and chains of close points are merged together. By
+        default, only points with identical coordinates are merged.
+
+    arrays : str, default: 'intersection'
+        How point and cell arrays that differ between meshes are
+        reconciled:
+
+        * ``'intersection'``: only keep the arrays present in every
+          mesh with the same number of components, like
+          :func:`DataSetFilters.merge`.
+        * ``'union'``: keep every array, and fill the values of the
+          meshes missing it with ``fill_value``.
+        * ``'strict'``: raise a ``ValueError`` unless all meshes have
+          the same arrays with the same shapes and data types.
+
+        With ``'intersection'`` and ``'union'``, arrays of different
+        data types are cast to their common data type.
+
+    fill_value : optional
+        Value of the arrays missing from some meshes when
+        ``arrays='union'``. Defaults to ``nan`` for floating point
+        arrays and ``0`` for other arrays.
+
+    Notes
+    -----
+    The arrays of the appended meshes are referenced rather than
+    copied, so meshes modified before calling :func:`build
+    <MeshBuilder.build>` are merged with their modifications.
+
+    Examples
+    --------
+    Merge a thousand spheres.
+
+    >>> import pyvista
+    >>> builder = pyvista.MeshBuilder()
+    >>> for i in range(1000):
+    ...     _ = builder.append(pyvista.Sphere(center=(i, 0, 0)))
+    >>> mesh = builder.build()
+    >>> mesh.n_cells
+    1680000
+
+    Merge the shared points of two adjacent cubes.
+
+    >>> builder = pyvista.MeshBuilder(merge_points=True)
+    >>> _ = builder.extend([pyvista.Cube(), pyvista.Cube(center=(1, 0, 0))])
+    >>> builder.build().n_points
+    12
+
+    """
+
+    def __init__(self, merge_points=False, tolerance=0.0, arrays='intersection', fill_value=None):
+        """Initialize the builder."""
+        if arrays not in _ARRAY_MODES:
+            raise ValueError(f'`arrays` must be one of {_ARRAY_MODES}, not {arrays!r}.')
+        if tolerance < 0:
+            raise ValueError('`tolerance` must be non-negative.')
+        self.merge_points = merge_points
+        self.tolerance = tolerance
+        self.arrays = arrays
+        self.fill_value = fill_value
+        self.clear()
+
+    def clear(self):
+        """Remove all the meshes from the builder."""
+        self._points = []
+        # one list of (offsets, connectivity) chunks per PolyData cell
+        # array for PolyData meshes, a single chunk otherwise
+        self._cells = []
+        self._celltypes = []
+        self._point_data = []
+        self._cell_data = []
+        self._active_scalars = None
+
+    def __len__(self):
+        """Return the number of meshes in the builder."""
+        return len(self._points)
+
+    @property
+    def n_points(self):
+        """Return the number of points of the meshes before merging.
+
+        Returns
+        -------
+        int
+            Total number of points.
+
+        """
+        return sum(points.shape[0] for points in self._points)
+
+    @property
+    def n_cells(self):
+        """Return the number of cells of the meshes.
+
+        Returns
+        -------
+        int
+            Total number of cells.
+
+        """
+        return sum(
+            sum(offsets.size - 1 for offsets, _ in chunks) for chunks in self._cells
+        )
+
+    def append(self, mesh):
+        """Add a mesh to the builder.
+
+        Parameters
+        ----------
+        mesh : pyvista.DataSet
+            Mesh to add. Meshes that are neither :class:`pyvista.PolyData`
+            nor :class:`pyvista.UnstructuredGrid` are cast to an
+            unstructured grid first.
+
+        Returns
+        -------
+        pyvista.MeshBuilder
+            This builder.
+
+        """
+        if not pyvista.is_pyvista_dataset(mesh):
+            mesh = pyvista.wrap(mesh)
+        if isinstance(mesh, pyvista.PolyData):
+            chunks = [
+                _cell_arrays(cells)
+                for cells in (mesh.GetVerts(), mesh.GetLines(), mesh.GetPolys(), mesh.GetStrips())
+            ]
+            celltypes = None
+        else:
+            if not isinstance(mesh, pyvista.UnstructuredGrid):
+                mesh = mesh.cast_to_unstructured_grid()
+            celltypes = mesh.celltypes
+            if np.any(celltypes == CellType.POLYHEDRON):
+                raise ValueError('Meshes with polyhedral cells are not supported.')
+            chunks = [_cell_arrays(mesh.GetCells())]
+
+        points = mesh.points if mesh.GetPoints() is not None else np.empty((0, 3))
+        self._points.append(np.asarray(points))
+        self._cells.append(chunks)
+        self._celltypes.append(celltypes)
+        self._point_data.append({name: mesh.point_data[name] for name in mesh.point_data.keys()})
+        self._cell_data.append({name: mesh.cell_data[name] for name in mesh.cell_data.keys()})
+        if self._active_scalars is None and mesh.active_scalars_info.name is not None:
+            self._active_scalars = mesh.active_scalars_info
+        return self
+
+    def extend(self, meshes):
+        """Add several meshes to the builder.
+
+        Parameters
+        ----------
+        meshes : sequence[pyvista.DataSet]
+            Meshes to add.
+
+        Returns
+        -------
+        pyvista.MeshBuilder
+            This builder.
+
+        """
+        for mesh in meshes:
+            self.append(mesh)
+        return self
+
+    def _reconcile(self, arrays, sizes, index=None):
+        """Concatenate the arrays of each mesh into a dictionary of arrays.
+
+        ``index`` reorders the concatenated arrays.
+
+        """
+        names = []
+        for mesh_arrays in arrays:
+            names.extend(name for name in mesh_arrays if name not in names)
+
+        merged = {}
+        for name in names:
+            present = [mesh_arrays[name] for mesh_arrays in arrays if name in mesh_arrays]
+            shapes = {array.shape[1:] for array in present}
+            dtypes = {array.dtype for array in present}
+            if self.arrays == 'strict':
+                if len(present) < len(arrays) or len(shapes) > 1 or len(dtypes) > 1:
+                    raise ValueError(
+                        f'Array "{name}" is not present in every mesh with the same '
+                        'shape and data type.'
+                    )
+            elif len(shapes) > 1:
+                if self.arrays == 'union':
+                    raise ValueError(f'Array "{name}" has different shapes across meshes.')
+                continue
+            elif self.arrays == 'intersection' and len(present) < len(arrays):
+                continue
+
+            dtype = np.result_type(*dtypes)
+            shape = shapes.pop()
+            if self.fill_value is not None:
+                fill_value = self.fill_value
+            elif np.issubdtype(dtype, np.inexact):
+                fill_value = np.nan
+            else:
+                fill_value = 0
+            parts = [
+                np.asarray(mesh_arrays[name], dtype=dtype)
+                if name in mesh_arrays
+                else np.full((size,) + shape, fill_value, dtype=dtype)
+                for mesh_arrays, size in zip(arrays, sizes)
+            ]
+            array = np.concatenate(parts)
+            merged[name] = array if index is None else array[index]
+        return merged
+
+    def build(self):
+        """Concatenate the meshes into a single mesh.
+
+        Returns
+        -------
+        pyvista.PolyData or pyvista.UnstructuredGrid
+            Merged mesh. This is a :class:`pyvista.PolyData` when all
+            meshes are :class:`pyvista.PolyData`.
+
+        """
+        n_points = np.array([points.shape[0] for points in self._points], dtype=np.int64)
+        point_offsets = np.cumsum(n_points) - n_points
+        if self._points:
+            points = np.concatenate(self._points)
+        else:
+            points = np.empty((0, 3), dtype=np.float32)
+        all_polydata = all(celltypes is None for celltypes in self._celltypes)
+
+        if all_polydata:
+            # PolyData cells are ordered by cell array, then by mesh
+            cell_arrays = []
+            counts = np.zeros((len(self), 4), dtype=np.int64)
+            for category in range(4):
+                chunks = [cells[category] for cells in self._cells]
+                counts[:, category] = [offsets.size - 1 for offsets, _ in chunks]
+                cell_arrays.append(_concatenate_cells(chunks, point_offsets))
+            n_cells = counts.sum(axis=1)
+            starts = (np.cumsum(n_cells) - n_cells)[:, np.newaxis] + np.cumsum(counts, axis=1)
+            starts -= counts
+            cell_index = _expand_ranges(starts.T.ravel(), counts.T.ravel())
+        else:
+            chunks = []
+            celltypes = []
+            for cells, types in zip(self._cells, self._celltypes):
+                if types is None:
+                    for category, (offsets, connectivity) in enumerate(cells):
+                        chunks.append((offsets, connectivity))
+                        celltypes.append(_polydata_celltypes(category, np.diff(offsets)))
+                    continue
+                chunks.extend(cells)
+                celltypes.append(types)
+            chunk_offsets = np.repeat(point_offsets, [len(cells) for cells in self._cells])
+            cell_arrays = [_concatenate_cells(chunks, chunk_offsets)]
+            celltypes = np.concatenate([np.empty(0, dtype=np.uint8)] + celltypes).astype(np.uint8)
+            n_cells = np.array(
+                [sum(offsets.size - 1 for offsets, _ in cells) for cells in self._cells],
+                dtype=np.int64,
+            )
+            cell_index = None
+
+        point_data = self._reconcile(self._point_data, n_points)
+        cell_data = self._reconcile(self._cell_data, n_cells, cell_index)
+
+        if self.merge_points and points.shape[0]:
+            labels = _merge_labels(points, self.tolerance)
+            kept, inverse = np.unique(labels, return_inverse=True)
+            points = points[kept]
+            point_data = {name: array[kept] for name, array in point_data.items()}
+            inverse = inverse.astype(pyvista.ID_TYPE)
+            cell_arrays = [(offsets, inverse[conn]) for offsets, conn in cell_arrays]
+
+        vtk_cells = []
+        for offsets, connectivity in cell_arrays:
+            cells = _vtk.vtkCellArray()
+            cells.SetData(numpy_to_idarr(offsets, deep=True), numpy_to_idarr(connectivity, deep=True))
+            vtk_cells.append(cells)
+
+        if all_polydata:
+            mesh = pyvista.PolyData()
+            mesh.points = points
+            mesh.SetVerts(vtk_cells[0])
+            mesh.SetLines(vtk_cells[1])
+            mesh.SetPolys(vtk_cells[2])
+            mesh.SetStrips(vtk_cells[3])
+        else:
+            mesh = pyvista.UnstructuredGrid()
+            mesh.points = points
+            vtk_celltypes = _vtk.numpy_to_vtk(
+                celltypes, deep=True, array_type=_vtk.VTK_UNSIGNED_CHAR
+            )
+            mesh.SetCells(vtk_celltypes, vtk_cells[0])
+
+        for name, array in point_data.items():
+            mesh.point_data[name] = array
+        for name, array in cell_data.items():
+            mesh.cell_data[name] = array
+        if self._active_scalars is not None:
+            association, name = self._active_scalars
+            data = mesh.point_data if association.name == 'POINT' else mesh.cell_data
+            if name in data:
+                data.active_scalars_name = name
+        return mesh
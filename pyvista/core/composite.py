@@ -6,13 +6,14 @@ to VTK algorithms and PyVista filtering/plotting routines.
 import collections.abc
 from itertools import zip_longest
 import pathlib
-from typing import Any, Iterable, List, Optional, Set, Tuple, Union, cast, overload
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast, overload
 
 import numpy as np
 
 import pyvista
 from pyvista import _vtk
-from pyvista.utilities import FieldAssociation, is_pyvista_dataset, wrap
+from pyvista.utilities import FieldAssociation, get_array, is_pyvista_dataset, wrap
+from pyvista.utilities.arrays import _cached_describe
 
 from .._typing import BoundsLike
 from .dataset import DataObject, DataSet
@@ -276,6 +277,91 @@ class MultiBlock(
                 maxi = tma
         return mini, maxi
 
+    def _arrays_by_name(self, name, preference, allow_missing):
+        """Return the arrays of a given name of all blocks, recursively."""
+        arrays = []
+        for data in self:
+            if data is None:
+                continue
+            if isinstance(data, MultiBlock):
+                arrays.extend(data._arrays_by_name(name, preference, allow_missing))
+                continue
+            array = get_array(data, name, preference=preference, err=not allow_missing)
+            if array is not None:
+                arrays.append(array)
+        return arrays
+
+    def describe(
+        self,
+        name: str,
+        bins: int = 256,
+        quantiles: Sequence[float] = (0.01, 0.25, 0.5, 0.75, 0.99),
+        component: Optional[int] = None,
+        n_threads: int = 1,
+        preference: str = 'cell',
+        allow_missing: bool = False,
+    ) -> Dict[str, Any]:
+        """Compute the statistics of an array given its name across all blocks.
+
+        The values of the array in all blocks are described together,
+        in chunks processed by one or more threads. The statistics are
+        cached and computed again only when an array is modified. See
+        :func:`pyvista.DataSetAttributes.describe`, including how
+        in-place NumPy operations are detected.
+
+        Parameters
+        ----------
+        name : str
+            Name of the array.
+
+        bins : int, default: 256
+            Number of bins of the histogram.
+
+        quantiles : sequence[float], default: (0.01, 0.25, 0.5, 0.75, 0.99)
+            Quantiles to estimate, between 0 and 1.
+
+        component : int, optional
+            Component of a multi-component array to describe. By
+            default the magnitude of the tuples is described.
+
+        n_threads : int, default: 1
+            Number of threads processing the chunks.
+
+        preference : str, default: 'cell'
+            The preferred array type to search for in each block. Must
+            be either ``'point'``, ``'cell'``, or ``'field'``.
+
+        allow_missing : bool, default: False
+            Allow a block to be missing the named array.
+
+        Returns
+        -------
+        dict
+            Statistics of the values. See
+            :func:`pyvista.DataSetAttributes.describe`.
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> blocks = pv.MultiBlock([pv.Sphere(), pv.Sphere(center=(0, 0, 2))])
+        >>> for block in blocks:
+        ...     block['z'] = block.points[:, 2]
+        >>> stats = blocks.describe('z', preference='point')
+        >>> stats['count'], round(stats['min'], 3), round(stats['max'], 3)
+        (1684, -0.5, 2.5)
+
+        """
+        arrays = self._arrays_by_name(name, preference, allow_missing)
+        return _cached_describe(
+            self,
+            (preference, name),
+            arrays,
+            bins=bins,
+            quantiles=quantiles,
+            component=component,
+            n_threads=n_threads,
+        )
+
     def get_index_by_name(self, name: str) -> int:
         """Find the index number by block name.
 
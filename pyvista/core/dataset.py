@@ -1,6 +1,7 @@
 """Attributes common to PolyData and Grid Objects."""
 
 import collections.abc
+import contextlib
 from copy import deepcopy
 from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union, cast
 import warnings
@@ -95,6 +96,23 @@ class ActiveArrayInfo:
         return self.name == other.name and same_association
 
 
+class _PendingTransform:
+    """Composition of the in-place transforms deferred by a transform stack."""
+
+    def __init__(self):
+        """Initialize without any transform."""
+        self.matrix: Optional[np.ndarray] = None
+        self.transform_all_input_vectors = False
+
+    def push(self, matrix: np.ndarray, transform_all_input_vectors: bool):
+        """Compose a transform applied after the pending ones."""
+        if self.matrix is None:
+            self.matrix = matrix
+            self.transform_all_input_vectors = transform_all_input_vectors
+        else:
+            self.matrix = matrix @ self.matrix
+
+
 @abstract_class
 class DataSet(DataSetFilters, DataObject):
     """Methods in common to spatially referenced objects."""
@@ -102,6 +120,9 @@ class DataSet(DataSetFilters, DataObject):
     # Simply bind pyvista.plotting.plot to the object
     plot = pyvista.plot
 
+    # in-place transforms deferred by ``transform_stack``
+    _pending_transform: Optional[_PendingTransform] = None
+
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the common object."""
         super().__init__()
@@ -385,6 +406,7 @@ class DataSet(DataSetFilters, DataObject):
                          [ 1., -1.,  3.]], dtype=float32)
 
         """
+        self._apply_pending_transform()
         _points = self.GetPoints()
         try:
             _points = _points.GetData()
@@ -397,6 +419,7 @@ class DataSet(DataSetFilters, DataObject):
 
     @points.setter
     def points(self, points: Union[VectorArray, NumericArray, _vtk.vtkPoints]):
+        self._apply_pending_transform()
         pdata = self.GetPoints()
         if isinstance(points, pyvista_ndarray):
             # simply set the underlying data
@@ -422,6 +445,14 @@ class DataSet(DataSetFilters, DataObject):
         self.GetPoints().Modified()
         self.Modified()
 
+    @property
+    def _point_coordinates(self):
+        """Return the point coordinates supporting ``dtype`` and indexing (internal helper).
+
+        Grids override this to avoid building their implicit points.
+        """
+        return self.points
+
     @property
     def arrows(self) -> Optional['pyvista.PolyData']:
         """Return a glyph representation of the active vector data as arrows.
@@ -833,6 +864,71 @@ class DataSet(DataSetFilters, DataObject):
         # Use the array range
         return np.nanmin(arr), np.nanmax(arr)
 
+    @contextlib.contextmanager
+    def transform_stack(self):
+        """Defer the in-place transforms of this dataset and apply them at once.
+
+        Within the context, in-place transforms such as
+        :func:`rotate_z() <DataSet.rotate_z>`, :func:`translate()
+        <DataSet.translate>` or :func:`transform()
+        <DataSetFilters.transform>` with ``inplace=True`` are composed
+        into a single 4x4 matrix. The points and vectors are only
+        transformed once, when leaving the context or when
+        :attr:`points <DataSet.points>`, :attr:`bounds <DataSet.bounds>`
+        or :attr:`center <DataSet.center>` is accessed.
+
+        Other methods see the dataset without the pending transforms.
+        Transforms with ``inplace=False`` apply the pending transforms
+        first.
+
+        Yields
+        ------
+        pyvista.DataSet
+            This dataset.
+
+        Examples
+        --------
+        Rotate, scale and translate a mesh with a single pass over its
+        points.
+
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> with mesh.transform_stack():
+        ...     _ = mesh.rotate_z(45, inplace=True)
+        ...     _ = mesh.scale(2, inplace=True)
+        ...     _ = mesh.translate((0, 0, 1), inplace=True)
+        >>> mesh.bounds[4:]
+        (0.0, 2.0)
+
+        """
+        if self._pending_transform is not None:
+            # nested stacks are merged with the outer one
+            yield self
+            return
+        self._pending_transform = _PendingTransform()
+        try:
+            yield self
+        finally:
+            self._apply_pending_transform()
+            self._pending_transform = None
+
+    def _apply_pending_transform(self):
+        """Apply the transforms deferred by ``transform_stack`` (internal helper)."""
+        pending = self._pending_transform
+        if pending is None or pending.matrix is None:
+            return
+        # disable the stack while applying so the transform is not deferred again
+        self._pending_transform = None
+        try:
+            self.transform(
+                pending.matrix,
+                transform_all_input_vectors=pending.transform_all_input_vectors,
+                inplace=True,
+            )
+        finally:
+            pending.matrix = None
+            self._pending_transform = pending
+
     def rotate_x(
         self, angle: float, point=(0.0, 0.0, 0.0), transform_all_input_vectors=False, inplace=False
     ):
@@ -1594,6 +1690,7 @@ class DataSet(DataSetFilters, DataObject):
         (-0.5, 0.5, -0.5, 0.5, -0.5, 0.5)
 
         """
+        self._apply_pending_transform()
         return cast(BoundsLike, self.GetBounds())
 
     @property
@@ -1628,6 +1725,7 @@ class DataSet(DataSetFilters, DataObject):
         [1.0, 2.0, 0.0]
 
         """
+        self._apply_pending_transform()
         return list(self.GetCenter())
 
     @property
@@ -5,6 +5,7 @@ from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import numpy as np
 
 from pyvista import _vtk
+from pyvista.utilities.arrays import _cached_describe
 import pyvista.utilities.helpers as helpers
 from pyvista.utilities.helpers import FieldAssociation
 from pyvista.utilities.misc import copy_vtk_array
@@ -1037,6 +1038,104 @@ class DataSetAttributes(_vtk.VTKObjectWrapper):
         for name, array in array_dict.items():
             self[name] = array.copy()
 
+    def describe(
+        self,
+        name: Union[str, int],
+        bins: int = 256,
+        quantiles: Sequence[float] = (0.01, 0.25, 0.5, 0.75, 0.99),
+        component: Optional[int] = None,
+        n_threads: int = 1,
+    ) -> Dict[str, Any]:
+        """Compute the statistics of an array.
+
+        The array is read in chunks, so no temporary as large as the
+        array is created, even for memory-mapped arrays. The chunks
+        can be processed by several threads. The statistics are cached
+        on the dataset and computed again only when the array is
+        modified, so they are cheap to query repeatedly, for example
+        to set the color limits of a plot.
+
+        Non-finite values are ignored.
+
+        Parameters
+        ----------
+        name : str, int
+            The name or index of the array.
+
+        bins : int, default: 256
+            Number of bins of the histogram. The quantiles are
+            interpolated within the bins of the histogram, so they are
+            accurate to one bin width.
+
+        quantiles : sequence[float], default: (0.01, 0.25, 0.5, 0.75, 0.99)
+            Quantiles to estimate, between 0 and 1.
+
+        component : int, optional
+            Component of a multi-component array to describe. By
+            default the magnitude of the tuples is described.
+
+        n_threads : int, default: 1
+            Number of threads processing the chunks.
+
+        Returns
+        -------
+        dict
+            Dictionary with the following keys:
+
+            * ``'count'``: number of finite values.
+            * ``'min'``, ``'max'``: range of the values.
+            * ``'mean'``, ``'std'``: mean and standard deviation.
+            * ``'histogram'``: number of values in each bin.
+            * ``'bin_edges'``: ``bins + 1`` edges of the bins, like
+              :func:`numpy.histogram`.
+            * ``'quantiles'``: dictionary of the estimated value of
+              each quantile.
+
+        Raises
+        ------
+        KeyError
+            If the array does not exist.
+
+        TypeError
+            If the array is not numeric.
+
+        Notes
+        -----
+        Setting values with the ``[]`` operator marks the array as
+        modified, but in-place NumPy operations such as ``array += 1``
+        do not. Such changes are detected by comparing a strided sample
+        of the values, so changes to only some values, for example
+        through a view, may be missed. Call ``Modified()`` on the array
+        to make sure that the statistics are computed again.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> stats = mesh.point_data.describe('Normals', component=2)
+        >>> round(stats['min'], 3), round(stats['max'], 3)
+        (-1.0, 1.0)
+
+        Use the quantiles to set color limits robust to outliers.
+
+        >>> mesh['z'] = mesh.points[:, 2]
+        >>> stats = mesh.point_data.describe('z')
+        >>> clim = [stats['quantiles'][0.01], stats['quantiles'][0.99]]
+        >>> mesh.plot(scalars='z', clim=clim)
+
+        """
+        array = self.get_array(name)
+        key = (self.association, array.VTKObject.GetName() if isinstance(name, int) else name)
+        return _cached_describe(
+            self.dataset,
+            key,
+            [array],
+            bins=bins,
+            quantiles=quantiles,
+            component=component,
+            n_threads=n_threads,
+        )
+
     def _raise_index_out_of_bounds(self, index: Any):
         if isinstance(index, int):
             max_index = self.VTKObject.GetNumberOfArrays()
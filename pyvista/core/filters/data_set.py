@@ -1,5 +1,6 @@
 """Filters module with a class of common filters that can be applied to any vtkDataSet."""
 import collections.abc
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Sequence, Union
 import warnings
 
@@ -20,7 +21,11 @@ from pyvista.utilities import (
     transformations,
     wrap,
 )
-from pyvista.utilities.cells import numpy_to_idarr
+from pyvista.utilities.cells import get_offsets_connectivity, numpy_to_idarr
+
+# above this many isosurfaces vtkContourFilter is faster than
+# vtkContour3DLinearGrid on unstructured grids
+_CONTOUR_LINEAR_GRID_MAX_VALUES = 8
 
 
 @abstract_class
@@ -77,6 +82,7 @@ class DataSetFilters:
         return_clipped=False,
         progress_bar=False,
         crinkle=False,
+        pass_arrays=None,
     ):
         """Clip a dataset by a plane by specifying the origin and normal.
 
@@ -116,6 +122,10 @@ class DataSetFilters:
             attribute that tracks the original cell IDs of the original
             dataset.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays.
+
         Returns
         -------
         pyvista.PolyData or tuple(pyvista.PolyData)
@@ -153,7 +163,7 @@ class DataSetFilters:
         function = generate_plane(normal, origin)
         # run the clip
         result = DataSetFilters._clip_with_function(
-            self,
+            _with_arrays(self, pass_arrays),
             function,
             invert=invert,
             value=value,
@@ -335,14 +345,12 @@ class DataSetFilters:
         """
         function = _vtk.vtkImplicitPolyDataDistance()
         function.SetInput(surface)
-        points = pyvista.convert_array(self.points)
-        dists = _vtk.vtkDoubleArray()
-        function.FunctionValue(points, dists)
+        dists = _implicit_function_values(function, self)
         if inplace:
-            self.point_data['implicit_distance'] = pyvista.convert_array(dists)
+            self.point_data['implicit_distance'] = dists
             return self
         result = self.copy()
-        result.point_data['implicit_distance'] = pyvista.convert_array(dists)
+        result.point_data['implicit_distance'] = dists
         return result
 
     def clip_scalar(
@@ -502,10 +510,7 @@ class DataSetFilters:
         function = _vtk.vtkImplicitPolyDataDistance()
         function.SetInput(surface)
         if compute_distance:
-            points = pyvista.convert_array(self.points)
-            dists = _vtk.vtkDoubleArray()
-            function.FunctionValue(points, dists)
-            self['implicit_distance'] = pyvista.convert_array(dists)
+            self['implicit_distance'] = _implicit_function_values(function, self)
         # run the clip
         result = DataSetFilters._clip_with_function(
             self,
@@ -575,7 +580,13 @@ class DataSetFilters:
         return output
 
     def slice(
-        self, normal='x', origin=None, generate_triangles=False, contour=False, progress_bar=False
+        self,
+        normal='x',
+        origin=None,
+        generate_triangles=False,
+        contour=False,
+        progress_bar=False,
+        pass_arrays=None,
     ):
         """Slice a dataset by a plane at the specified origin and normal vector orientation.
 
@@ -603,6 +614,10 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays.
+
         Returns
         -------
         pyvista.PolyData
@@ -631,7 +646,7 @@ class DataSetFilters:
         # create the plane for clipping
         plane = generate_plane(normal, origin)
         return DataSetFilters.slice_implicit(
-            self,
+            _with_arrays(self, pass_arrays),
             plane,
             generate_triangles=generate_triangles,
             contour=contour,
@@ -639,7 +654,14 @@ class DataSetFilters:
         )
 
     def slice_orthogonal(
-        self, x=None, y=None, z=None, generate_triangles=False, contour=False, progress_bar=False
+        self,
+        x=None,
+        y=None,
+        z=None,
+        generate_triangles=False,
+        contour=False,
+        progress_bar=False,
+        pass_arrays=None,
     ):
         """Create three orthogonal slices through the dataset on the three cartesian planes.
 
@@ -667,11 +689,22 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays.
+
         Returns
         -------
         pyvista.PolyData
             Sliced dataset.
 
+        Notes
+        -----
+        The point data of a :class:`pyvista.UniformGrid` without cell
+        data is sliced with ``vtkFlyingEdgesPlaneCutter``, which only
+        visits the cells intersected by each plane. These slices are
+        always triangulated.
+
         Examples
         --------
         Slice the random hills dataset with three orthogonal planes.
@@ -696,37 +729,26 @@ class DataSetFilters:
             for i in range(self.n_blocks):
                 output.append(
                     self[i].slice_orthogonal(
-                        x=x, y=y, z=z, generate_triangles=generate_triangles, contour=contour
+                        x=x,
+                        y=y,
+                        z=z,
+                        generate_triangles=generate_triangles,
+                        contour=contour,
+                        pass_arrays=pass_arrays,
                     )
                 )
             return output
-        output.append(
-            self.slice(
-                normal='x',
-                origin=[x, y, z],
-                generate_triangles=generate_triangles,
-                progress_bar=progress_bar,
-            ),
-            'YZ',
-        )
-        output.append(
-            self.slice(
-                normal='y',
-                origin=[x, y, z],
-                generate_triangles=generate_triangles,
-                progress_bar=progress_bar,
-            ),
-            'XZ',
-        )
-        output.append(
-            self.slice(
-                normal='z',
-                origin=[x, y, z],
-                generate_triangles=generate_triangles,
-                progress_bar=progress_bar,
-            ),
-            'XY',
-        )
+        origin = [x, y, z]
+        dataset = _with_arrays(self, pass_arrays)
+        for index, label in enumerate(['YZ', 'XZ', 'XY']):
+            normal = np.zeros(3)
+            normal[index] = 1
+            output.append(
+                _slice_planes(
+                    dataset, normal, [origin[index]], generate_triangles, progress_bar=progress_bar
+                )[0],
+                label,
+            )
         return output
 
     def slice_along_axis(
@@ -739,6 +761,7 @@ class DataSetFilters:
         bounds=None,
         center=None,
         progress_bar=False,
+        pass_arrays=None,
     ):
         """Create many slices of the input dataset along a specified axis.
 
@@ -780,11 +803,24 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays.
+
         Returns
         -------
         pyvista.PolyData
             Sliced dataset.
 
+        Notes
+        -----
+        All the slices are computed in a single pass over the dataset
+        with the contour values of ``vtkCutter``. The point data of a
+        :class:`pyvista.UniformGrid` without cell data is instead sliced
+        with ``vtkFlyingEdgesPlaneCutter``, which only visits the cells
+        intersected by each plane. Slices of uniform grids are always
+        triangulated.
+
         Examples
         --------
         Slice the random hills dataset in the X direction.
@@ -826,7 +862,6 @@ class DataSetFilters:
         if tolerance is None:
             tolerance = (bounds[ax_index * 2 + 1] - bounds[ax_index * 2]) * 0.01
         rng = np.linspace(bounds[ax_index * 2] + tolerance, bounds[ax_index * 2 + 1] - tolerance, n)
-        center = list(center)
         # Make each of the slices
         output = pyvista.MultiBlock()
         if isinstance(self, pyvista.MultiBlock):
@@ -840,19 +875,22 @@ class DataSetFilters:
                         contour=contour,
                         bounds=bounds,
                         center=center,
+                        pass_arrays=pass_arrays,
                     )
                 )
             return output
-        for i in range(n):
-            center[ax_index] = rng[i]
-            slc = DataSetFilters.slice(
-                self,
-                normal=ax_label,
-                origin=center,
-                generate_triangles=generate_triangles,
-                contour=contour,
-                progress_bar=progress_bar,
-            )
+        normal = np.zeros(3)
+        normal[ax_index] = 1
+        slices = _slice_planes(
+            _with_arrays(self, pass_arrays),
+            normal,
+            rng,
+            generate_triangles,
+            progress_bar=progress_bar,
+        )
+        for i, slc in enumerate(slices):
+            if contour:
+                slc = slc.contour()
             output.append(slc, f'slice{i}')
         return output
 
@@ -941,6 +979,7 @@ class DataSetFilters:
         component=0,
         method='upper',
         progress_bar=False,
+        pass_arrays=None,
     ):
         """Apply a ``vtkThreshold`` filter to the input dataset.
 
@@ -1024,6 +1063,11 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays. The thresholded scalars are
+            always kept.
+
         Returns
         -------
         pyvista.UnstructuredGrid
@@ -1080,7 +1124,7 @@ class DataSetFilters:
         # Run a standard threshold algorithm
         alg = _vtk.vtkThreshold()
         alg.SetAllScalars(all_scalars)
-        alg.SetInputDataObject(self)
+        alg.SetInputDataObject(_with_arrays(self, pass_arrays, keep=[scalars]))
         alg.SetInputArrayToProcess(
             0, 0, 0, field.value, scalars
         )  # args: (idx, port, connection, field, name)
@@ -1124,6 +1168,7 @@ class DataSetFilters:
         preference='cell',
         method='upper',
         progress_bar=False,
+        pass_arrays=None,
     ):
         """Threshold the dataset by a percentage of its range on the active scalars array.
 
@@ -1172,6 +1217,11 @@ class DataSetFilters:
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays. The thresholded scalars are
+            always kept.
+
         Returns
         -------
         pyvista.UnstructuredGrid
@@ -1237,8 +1287,130 @@ class DataSetFilters:
             preference=preference,
             method=method,
             progress_bar=progress_bar,
+            pass_arrays=pass_arrays,
         )
 
+    def threshold_multi(
+        self,
+        criteria,
+        combine='and',
+        all_scalars=False,
+        progress_bar=False,
+        pass_arrays=None,
+    ):
+        """Threshold the dataset by several criteria in a single pass.
+
+        Each criterion selects cells like :func:`DataSetFilters.threshold`
+        and the selections are combined before the cells are extracted
+        once, instead of building an intermediate dataset per criterion.
+
+        Parameters
+        ----------
+        criteria : sequence[dict]
+            Criteria to combine. Each criterion is a ``dict`` with the
+            ``'scalars'`` key naming the array to threshold on and the
+            optional ``'value'``, ``'invert'``, ``'preference'``,
+            ``'component_mode'``, ``'component'`` and ``'method'`` keys
+            of :func:`DataSetFilters.threshold`, with the same defaults.
+
+        combine : str, default: 'and'
+            Keep the cells meeting all the criteria with ``'and'`` or
+            any of them with ``'or'``.
+
+        all_scalars : bool, default: False
+            If using scalars from point data, all points in a cell must
+            satisfy a criterion when this value is ``True``. When
+            ``False``, any point of the cell satisfying the criterion
+            selects the cell. Has no effect when using cell data.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress.
+
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays. The thresholded scalars are
+            always kept.
+
+        Returns
+        -------
+        pyvista.UnstructuredGrid
+            Dataset containing the cells that meet the criteria.
+
+        Examples
+        --------
+        Keep the cells of a beam with a high X coordinate and a low Z
+        coordinate.
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> beam = examples.load_hexbeam()
+        >>> beam['x'] = beam.points[:, 0]
+        >>> beam.cell_data['z'] = beam.cell_centers().points[:, 2]
+        >>> result = beam.threshold_multi(
+        ...     [
+        ...         {'scalars': 'x', 'value': 0.5},
+        ...         {'scalars': 'z', 'value': 2.0, 'method': 'lower'},
+        ...     ]
+        ... )
+        >>> result.n_cells
+        16
+
+        """
+        if isinstance(criteria, dict):
+            criteria = [criteria]
+        if not criteria:
+            raise ValueError('At least one criterion is required.')
+        if combine not in ('and', 'or'):
+            raise ValueError(f"`combine` must be 'and' or 'or', not '{combine}'.")
+
+        offsets = conn = None
+        selected = None
+        for criterion in criteria:
+            criterion = dict(criterion)
+            try:
+                scalars = criterion.pop('scalars')
+            except KeyError:
+                raise ValueError('Each criterion requires the `scalars` key.') from None
+            preference = criterion.pop('preference', 'cell')
+            field = get_array_association(self, scalars, preference=preference)
+            inside = _threshold_values(
+                get_array(self, scalars, preference=preference),
+                criterion.pop('value', None),
+                method=criterion.pop('method', 'upper'),
+                component_mode=criterion.pop('component_mode', 'all'),
+                component=criterion.pop('component', 0),
+            )
+            invert = criterion.pop('invert', False)
+            assert_empty_kwargs(**criterion)
+
+            if field == FieldAssociation.POINT:
+                if offsets is None:
+                    offsets, conn = get_offsets_connectivity(self)
+                inside = _cells_of_points(offsets, conn, inside, all_points=all_scalars)
+                # like vtkThreshold, cells without points are never kept
+                inside &= np.diff(offsets) > 0
+            if invert:
+                inside = ~inside
+
+            if selected is None:
+                selected = inside
+            elif combine == 'and':
+                selected &= inside
+            else:
+                selected |= inside
+
+        scalars = [criterion['scalars'] for criterion in criteria]
+        dataset = _with_arrays(self, pass_arrays, keep=scalars)
+        output = dataset.extract_cells(selected, progress_bar=progress_bar)
+        # match the output of vtkThreshold
+        for data, name in [
+            (output.point_data, 'vtkOriginalPointIds'),
+            (output.cell_data, 'vtkOriginalCellIds'),
+        ]:
+            if name in data:
+                data.remove(name)
+        return output
+
     def outline(self, generate_faces=False, progress_bar=False):
         """Produce an outline of the full extent for the input dataset.
 
@@ -1535,6 +1707,7 @@ class DataSetFilters:
         rng=None,
         preference='point',
         method='contour',
+        pass_arrays=None,
         progress_bar=False,
     ):
         """Contour an input self by an array.
@@ -1575,8 +1748,15 @@ class DataSetFilters:
 
         method : str, optional
             Specify to choose which vtk filter is used to create the contour.
-            Must be one of ``'contour'``, ``'marching_cubes'`` and
-            ``'flying_edges'``. Defaults to ``'contour'``.
+            Must be one of ``'auto'``, ``'contour'``, ``'marching_cubes'``
+            and ``'flying_edges'``. Defaults to ``'contour'``. See the
+            notes for how ``'auto'`` chooses the filter.
+
+        pass_arrays : sequence[str], optional
+            Names of the arrays to interpolate onto the contour. The
+            contoured scalars are always kept. Defaults to all the arrays
+            of the dataset. Restricting the arrays avoids interpolating
+            data that is not needed.
 
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
@@ -1586,6 +1766,21 @@ class DataSetFilters:
         pyvista.PolyData
             Contoured surface.
 
+        Notes
+        -----
+        With ``method='auto'``, the fastest filter that supports the
+        input is used:
+
+        * ``vtkFlyingEdges3D`` for a 3D :class:`pyvista.UniformGrid`.
+        * ``vtkContour3DLinearGrid`` for a :class:`pyvista.UnstructuredGrid`
+          made only of linear 3D cells, when gradients are not requested
+          and there are only a few isosurfaces.
+        * ``vtkContourFilter`` otherwise.
+
+        All isosurfaces are computed in a single pass and point data is
+        interpolated onto the contour like with ``method='contour'``,
+        although the triangulation of the surface may differ slightly.
+
         Examples
         --------
         Generate contours for the random hills dataset.
@@ -1627,18 +1822,25 @@ class DataSetFilters:
         ... )
         >>> out.plot(color='tan', smooth_shading=True)
 
+        Let the filter pick the fastest algorithm and only interpolate
+        the contoured scalars.
+
+        >>> import numpy as np
+        >>> grid = pv.UniformGrid(dimensions=(50, 50, 50))
+        >>> grid['dist'] = np.linalg.norm(grid.points - grid.center, axis=1)
+        >>> grid['other'] = grid.points[:, 0]
+        >>> out = grid.contour([10, 20], scalars='dist', method='auto', pass_arrays=[])
+        >>> out.point_data.keys()
+        ['dist']
+
         See :ref:`common_filter_example` or
         :ref:`marching_cubes_example` for more examples using this
         filter.
 
         """
-        if method is None or method == 'contour':
-            alg = _vtk.vtkContourFilter()
-        elif method == 'marching_cubes':
-            alg = _vtk.vtkMarchingCubes()
-        elif method == 'flying_edges':
-            alg = _vtk.vtkFlyingEdges3D()
-        else:
+        if method is None:
+            method = 'contour'
+        if method not in ('auto', 'contour', 'marching_cubes', 'flying_edges'):
             raise ValueError(f"Method '{method}' is not supported")
 
         if rng is not None:
@@ -1665,10 +1867,6 @@ class DataSetFilters:
         if self.n_arrays < 1:
             raise ValueError('Input dataset for the contour filter must have scalar.')
 
-        alg.SetInputDataObject(self)
-        alg.SetComputeNormals(compute_normals)
-        alg.SetComputeGradients(compute_gradients)
-        alg.SetComputeScalars(compute_scalars)
         # set the array to contour on
         if scalars is None:
             pyvista.set_default_active_scalars(self)
@@ -1678,6 +1876,24 @@ class DataSetFilters:
         # NOTE: only point data is allowed? well cells works but seems buggy?
         if field != FieldAssociation.POINT:
             raise TypeError('Contour filter only works on point data.')
+
+        if isinstance(isosurfaces, int):
+            n_contours = isosurfaces
+        elif isinstance(isosurfaces, (np.ndarray, collections.abc.Sequence)):
+            n_contours = len(isosurfaces)
+        else:
+            raise TypeError('isosurfaces not understood.')
+
+        dataset = _with_arrays(self, pass_arrays, keep=[scalars_name])
+        alg = _contour_algorithm(dataset, method, scalars_name, n_contours, compute_gradients)
+        if isinstance(alg, (_vtk.vtkFlyingEdges3D, _vtk.vtkContour3DLinearGrid)):
+            # vtkContourFilter always interpolates the point data
+            alg.SetInterpolateAttributes(method == 'auto' or pass_arrays is not None)
+        alg.SetInputDataObject(dataset)
+        alg.SetComputeNormals(compute_normals)
+        if compute_gradients:
+            alg.SetComputeGradients(compute_gradients)
+        alg.SetComputeScalars(compute_scalars)
         alg.SetInputArrayToProcess(
             0,
             0,
@@ -1691,12 +1907,12 @@ class DataSetFilters:
             if rng is None:
                 rng = self.get_data_range(scalars_name)
             alg.GenerateValues(isosurfaces, rng)
-        elif isinstance(isosurfaces, (np.ndarray, collections.abc.Sequence)):
+        else:
             alg.SetNumberOfContours(len(isosurfaces))
             for i, val in enumerate(isosurfaces):
                 alg.SetValue(i, val)
-        else:
-            raise TypeError('isosurfaces not understood.')
+        if isinstance(alg, _vtk.vtkFlyingEdges3D) and alg.GetInterpolateAttributes():
+            _sort_contour_values(alg, self.get_data_range(scalars_name))
         _update_alg(alg, progress_bar, 'Computing Contour')
         output = _get_output(alg)
 
@@ -2325,6 +2541,92 @@ class DataSetFilters:
 
         return bodies
 
+    def label_connected_regions(self):
+        """Label the connected bodies/volumes of the dataset without extracting them.
+
+        Unlike :func:`DataSetFilters.connectivity` and
+        :func:`DataSetFilters.split_bodies`, this does not create any new
+        dataset. The regions are computed with a vectorized union-find
+        over the points shared by the cells and returned as plain
+        arrays, so regions can be selected with masks, for example with
+        :func:`DataSetFilters.extract_cells`.
+
+        Cells that share at least one point belong to the same region,
+        matching the default behavior of ``vtkConnectivityFilter``.
+        Regions are numbered in the order of their first cell.
+
+        Returns
+        -------
+        cell_labels : numpy.ndarray
+            Region id of each cell. Cells without points are labeled
+            ``-1``.
+
+        point_labels : numpy.ndarray
+            Region id of each point. Points not used by any cell are
+            labeled ``-1``.
+
+        sizes : numpy.ndarray
+            Number of cells of each region.
+
+        bounds : numpy.ndarray
+            ``(n_regions, 6)`` array of the bounds ``(xmin, xmax, ymin,
+            ymax, zmin, zmax)`` of each region.
+
+        Examples
+        --------
+        Label the three bodies of a mesh and extract the largest one
+        with a mask.
+
+        >>> import pyvista
+        >>> mesh = (
+        ...     pyvista.Sphere()
+        ...     + pyvista.Sphere(center=(2, 0, 0), theta_resolution=60)
+        ...     + pyvista.Sphere(center=(4, 0, 0))
+        ... )
+        >>> cell_labels, point_labels, sizes, bounds = mesh.label_connected_regions()
+        >>> sizes
+        array([1680, 3360, 1680])
+        >>> largest = mesh.extract_cells(cell_labels == sizes.argmax())
+        >>> largest.n_cells
+        3360
+
+        """
+        offsets, connectivity = pyvista.utilities.cells.get_offsets_connectivity(self)
+        roots = pyvista.utilities.cells.connected_point_labels(offsets, connectivity, self.n_points)
+
+        # the region of a cell is the region of its first point
+        cell_roots = np.full(self.n_cells, -1, dtype=np.int64)
+        nonempty = np.diff(offsets) > 0
+        cell_roots[nonempty] = roots[connectivity[offsets[:-1][nonempty]]]
+        valid = cell_roots >= 0
+
+        # number the regions in the order of their first cell
+        unique_roots, first, inverse = np.unique(
+            cell_roots[valid], return_index=True, return_inverse=True
+        )
+        n_regions = unique_roots.size
+        rank = np.empty(n_regions, dtype=np.int64)
+        rank[np.argsort(first)] = np.arange(n_regions)
+        cell_labels = np.full(self.n_cells, -1, dtype=np.int64)
+        cell_labels[valid] = rank[inverse]
+
+        lookup = np.full(self.n_points, -1, dtype=np.int64)
+        lookup[unique_roots] = rank
+        point_labels = lookup[roots]
+
+        sizes = np.bincount(cell_labels[valid], minlength=n_regions)
+
+        bounds = np.empty((n_regions, 6))
+        if n_regions:
+            used = np.nonzero(point_labels >= 0)[0]
+            order = used[np.argsort(point_labels[used], kind='stable')]
+            starts = np.searchsorted(point_labels[order], np.arange(n_regions))
+            points = self._point_coordinates[order]
+            bounds[:, ::2] = np.minimum.reduceat(points, starts, axis=0)
+            bounds[:, 1::2] = np.maximum.reduceat(points, starts, axis=0)
+
+        return cell_labels, point_labels, sizes, bounds
+
     def warp_by_scalar(
         self, scalars=None, factor=1.0, normal=None, inplace=False, progress_bar=False, **kwargs
     ):
@@ -2481,7 +2783,7 @@ class DataSetFilters:
         else:
             return warped_mesh
 
-    def cell_data_to_point_data(self, pass_cell_data=False, progress_bar=False):
+    def cell_data_to_point_data(self, pass_cell_data=False, progress_bar=False, pass_arrays=None):
         """Transform cell data into point data.
 
         Point data are specified per node and cell data specified
@@ -2502,6 +2804,10 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to transform or pass to
+            the output. Defaults to all the arrays.
+
         Returns
         -------
         pyvista.DataSet
@@ -2528,13 +2834,14 @@ class DataSetFilters:
         >>> surf.plot(scalars='Area')
 
         """
+        dataset = _with_arrays(self, pass_arrays)
         alg = _vtk.vtkCellDataToPointData()
-        alg.SetInputDataObject(self)
+        alg.SetInputDataObject(dataset)
         alg.SetPassCellData(pass_cell_data)
         _update_alg(alg, progress_bar, 'Transforming cell data into point data.')
         active_scalars = None
-        if not isinstance(self, pyvista.MultiBlock):
-            active_scalars = self.active_scalars_name
+        if not isinstance(dataset, pyvista.MultiBlock):
+            active_scalars = dataset.active_scalars_name
         return _get_output(alg, active_scalars=active_scalars)
 
     def ctp(self, pass_cell_data=False, progress_bar=False, **kwargs):
@@ -2569,7 +2876,7 @@ class DataSetFilters:
             self, pass_cell_data=pass_cell_data, progress_bar=progress_bar, **kwargs
         )
 
-    def point_data_to_cell_data(self, pass_point_data=False, progress_bar=False):
+    def point_data_to_cell_data(self, pass_point_data=False, progress_bar=False, pass_arrays=None):
         """Transform point data into cell data.
 
         Point data are specified per node and cell data specified within cells.
@@ -2585,6 +2892,10 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to transform or pass to
+            the output. Defaults to all the arrays.
+
         Returns
         -------
         pyvista.DataSet
@@ -2615,13 +2926,14 @@ class DataSetFilters:
         >>> sphere.plot()
 
         """
+        dataset = _with_arrays(self, pass_arrays)
         alg = _vtk.vtkPointDataToCellData()
-        alg.SetInputDataObject(self)
+        alg.SetInputDataObject(dataset)
         alg.SetPassPointData(pass_point_data)
         _update_alg(alg, progress_bar, 'Transforming point data into cell data')
         active_scalars = None
-        if not isinstance(self, pyvista.MultiBlock):
-            active_scalars = self.active_scalars_name
+        if not isinstance(dataset, pyvista.MultiBlock):
+            active_scalars = dataset.active_scalars_name
         return _get_output(alg, active_scalars=active_scalars)
 
     def ptc(self, pass_point_data=False, progress_bar=False, **kwargs):
@@ -2931,6 +3243,7 @@ class DataSetFilters:
         pass_point_data=True,
         categorical=False,
         progress_bar=False,
+        pass_arrays=None,
     ):
         """Resample array data from a passed mesh onto this mesh.
 
@@ -2961,6 +3274,10 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays of ``target`` to sample.
+            Defaults to all the arrays.
+
         Returns
         -------
         pyvista.DataSet
@@ -2985,7 +3302,7 @@ class DataSetFilters:
         alg = _vtk.vtkResampleWithDataSet()  # Construct the ResampleWithDataSet object
         alg.SetInputData(self)  # Set the Input data (actually the source i.e. where to sample from)
         # Set the Source data (actually the target, i.e. where to sample to)
-        alg.SetSourceData(target)
+        alg.SetSourceData(_with_arrays(target, pass_arrays))
         alg.SetPassCellArrays(pass_cell_data)
         alg.SetPassPointArrays(pass_point_data)
         alg.SetCategoricalData(categorical)
@@ -3359,31 +3676,24 @@ class DataSetFilters:
         See the :ref:`streamlines_example` example.
 
         """
-        integration_direction = str(integration_direction).strip().lower()
-        if integration_direction not in ['both', 'back', 'backward', 'forward']:
-            raise ValueError(
-                "Integration direction must be one of:\n 'backward', "
-                f"'forward', or 'both' - not '{integration_direction}'."
-            )
-        if integrator_type not in [2, 4, 45]:
-            raise ValueError('Integrator type must be one of `2`, `4`, or `45`.')
-        if interpolator_type not in ['c', 'cell', 'p', 'point']:
-            raise ValueError("Interpolator type must be either 'cell' or 'point'")
-        if step_unit not in ['l', 'cl']:
-            raise ValueError("Step unit must be either 'l' or 'cl'")
-        step_unit = {
-            'cl': _vtk.vtkStreamTracer.CELL_LENGTH_UNIT,
-            'l': _vtk.vtkStreamTracer.LENGTH_UNIT,
-        }[step_unit]
-        if isinstance(vectors, str):
-            self.set_active_scalars(vectors)
-            self.set_active_vectors(vectors)
-        elif vectors is None:
-            pyvista.set_default_active_vectors(self)
-
-        if max_time is None:
-            max_velocity = self.get_data_range()[-1]
-            max_time = 4.0 * self.GetLength() / max_velocity
+        alg = _stream_tracer(
+            self,
+            vectors=vectors,
+            integrator_type=integrator_type,
+            integration_direction=integration_direction,
+            surface_streamlines=surface_streamlines,
+            initial_step_length=initial_step_length,
+            step_unit=step_unit,
+            min_step_length=min_step_length,
+            max_step_length=max_step_length,
+            max_steps=max_steps,
+            terminal_speed=terminal_speed,
+            max_error=max_error,
+            max_time=max_time,
+            compute_vorticity=compute_vorticity,
+            rotation_scale=rotation_scale,
+            interpolator_type=interpolator_type,
+        )
         if not isinstance(source, pyvista.DataSet):
             raise TypeError("source must be a pyvista.DataSet")
 
@@ -3391,48 +3701,173 @@ class DataSetFilters:
         # See: https://github.com/pyvista/pyvista/issues/1373
         if isinstance(self, pyvista.StructuredGrid) and isinstance(source, pyvista.StructuredGrid):
             source = source.cast_to_unstructured_grid()
-
-        # Build the algorithm
-        alg = _vtk.vtkStreamTracer()
-        # Inputs
-        alg.SetInputDataObject(self)
         alg.SetSourceData(source)
-
-        # general parameters
-        alg.SetComputeVorticity(compute_vorticity)
-        alg.SetInitialIntegrationStep(initial_step_length)
-        alg.SetIntegrationStepUnit(step_unit)
-        alg.SetMaximumError(max_error)
-        alg.SetMaximumIntegrationStep(max_step_length)
-        alg.SetMaximumNumberOfSteps(max_steps)
-        alg.SetMaximumPropagation(max_time)
-        alg.SetMinimumIntegrationStep(min_step_length)
-        alg.SetRotationScale(rotation_scale)
-        alg.SetSurfaceStreamlines(surface_streamlines)
-        alg.SetTerminalSpeed(terminal_speed)
-        # Model parameters
-        if integration_direction == 'forward':
-            alg.SetIntegrationDirectionToForward()
-        elif integration_direction in ['backward', 'back']:
-            alg.SetIntegrationDirectionToBackward()
-        else:
-            alg.SetIntegrationDirectionToBoth()
-        # set integrator type
-        if integrator_type == 2:
-            alg.SetIntegratorTypeToRungeKutta2()
-        elif integrator_type == 4:
-            alg.SetIntegratorTypeToRungeKutta4()
-        else:
-            alg.SetIntegratorTypeToRungeKutta45()
-        # set interpolator type
-        if interpolator_type in ['c', 'cell']:
-            alg.SetInterpolatorTypeToCellLocator()
-        else:
-            alg.SetInterpolatorTypeToDataSetPointLocator()
         # run the algorithm
         _update_alg(alg, progress_bar, 'Generating Streamlines')
         return _get_output(alg)
 
+    def streamlines_batched(self, seeds, vectors=None, n_threads=1, progress_bar=False, **kwargs):
+        """Integrate streamlines from many seeds into flat NumPy arrays.
+
+        The seeds are split between ``n_threads`` threads. All threads
+        share one locator of the dataset, built once, instead of each
+        integration building its own. The streamlines are returned as
+        compressed sparse row (CSR) arrays that can be analyzed directly
+        without traversing the lines of a :class:`pyvista.PolyData`:
+        the points of streamline ``i`` are
+        ``points[offsets[i]:offsets[i + 1]]``.
+
+        Parameters
+        ----------
+        seeds : pyvista.DataSet | numpy.ndarray
+            Starting points of the streamlines, either a ``(n, 3)`` array
+            or a dataset whose points are used.
+
+        vectors : str, optional
+            The string name of the active vector field to integrate across.
+
+        n_threads : int, default: 1
+            Number of threads integrating equal parts of the seeds.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress. Only used with
+            a single thread.
+
+        **kwargs : dict, optional
+            See :func:`pyvista.DataSetFilters.streamlines_from_source`.
+
+        Returns
+        -------
+        offsets : numpy.ndarray
+            ``(n_lines + 1,)`` array of the offset of the first point of
+            each streamline in ``points``.
+
+        points : numpy.ndarray
+            ``(n, 3)`` array of the points of all the streamlines.
+
+        integration_time : numpy.ndarray
+            Integration time of each point. Backward integration has
+            negative times.
+
+        termination : numpy.ndarray
+            Reason for termination of each streamline, using the codes
+            of ``vtkStreamTracer``: ``1`` out of domain, ``2`` not
+            initialized, ``3`` unexpected value, ``4`` out of length,
+            ``5`` out of steps, ``6`` stagnation and ``7`` fixed reached.
+
+        seed_ids : numpy.ndarray
+            Index of the seed of each streamline, in increasing order.
+            Integrating in both directions produces up to two
+            streamlines per seed, the forward one first.
+
+        Examples
+        --------
+        Integrate a rotating field forward from 100 seeds. Each
+        streamline starts at its seed.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(20, 20, 20))
+        >>> grid['vectors'] = np.cross(grid.points - grid.center, [0, 0, 1])
+        >>> seeds = np.random.default_rng(0).uniform(5, 15, size=(100, 3))
+        >>> offsets, points, time, reason, seed_ids = grid.streamlines_batched(
+        ...     seeds, integration_direction='forward', n_threads=2
+        ... )
+        >>> offsets.size - 1
+        100
+        >>> np.allclose(points[offsets[:-1]], seeds[seed_ids])
+        True
+
+        """
+        if pyvista.is_pyvista_dataset(seeds):
+            seeds = seeds.points
+        seeds = np.asarray(seeds, dtype=float)
+        if seeds.ndim != 2 or seeds.shape[1] != 3:
+            raise ValueError(f'`seeds` must be a (n, 3) array, not {seeds.shape}.')
+        if n_threads < 1:
+            raise ValueError('`n_threads` must be a positive integer.')
+        interpolator_type = kwargs.pop('interpolator_type', 'point')
+        if len(seeds) < n_threads:
+            n_threads = 1
+        # activate the vectors and resolve the maximum time on this thread,
+        # before building the locator: modifying the dataset later would
+        # make the threads rebuild the shared locator while it is queried
+        tracers = [
+            _stream_tracer(self, vectors=vectors, interpolator_type=interpolator_type, **kwargs)
+        ]
+        kwargs['max_time'] = tracers[0].GetMaximumPropagation()
+        tracers += [
+            _stream_tracer(self, interpolator_type=interpolator_type, **kwargs)
+            for _ in range(n_threads - 1)
+        ]
+
+        locator = None
+        if isinstance(self, _vtk.vtkPointSet):
+            if interpolator_type in ['c', 'cell']:
+                locator = _vtk.vtkStaticCellLocator()
+            else:
+                locator = _vtk.vtkStaticPointLocator()
+            locator.SetDataSet(self)
+            locator.BuildLocator()
+
+        def trace(alg, start, chunk, progress_bar=False):
+            if locator is not None:
+                if interpolator_type in ['c', 'cell']:
+                    strategy = _vtk.vtkCellLocatorStrategy()
+                    strategy.SetCellLocator(locator)
+                else:
+                    strategy = _vtk.vtkClosestPointStrategy()
+                    strategy.SetPointLocator(locator)
+                interpolator = _vtk.vtkCompositeInterpolatedVelocityField()
+                interpolator.SetFindCellStrategy(strategy)
+                alg.SetInterpolatorPrototype(interpolator)
+            alg.SetSourceData(pyvista.PolyData(chunk))
+            _update_alg(alg, progress_bar, 'Generating Streamlines')
+            output = _get_output(alg)
+            if not output.n_lines:
+                return (
+                    np.zeros(1, dtype=pyvista.ID_TYPE),
+                    np.empty((0, 3)),
+                    np.empty(0),
+                    np.empty(0, dtype=np.int32),
+                    np.empty(0, dtype=pyvista.ID_TYPE),
+                )
+            offsets, conn = get_offsets_connectivity(output)
+            return (
+                offsets,
+                output.points[conn],
+                output.point_data['IntegrationTime'][conn],
+                np.asarray(output.cell_data['ReasonForTermination']),
+                output.cell_data['SeedIds'].astype(pyvista.ID_TYPE) + start,
+            )
+
+        if n_threads == 1:
+            results = [trace(tracers[0], 0, seeds, progress_bar)]
+        else:
+            chunks = np.array_split(seeds, n_threads)
+            starts = np.cumsum([0] + [len(chunk) for chunk in chunks[:-1]])
+            with ThreadPoolExecutor(n_threads) as pool:
+                results = list(pool.map(trace, tracers, starts, chunks))
+
+        sizes = np.concatenate([np.diff(result[0]) for result in results])
+        points, integration_time, termination, seed_ids = (
+            np.concatenate([result[i] for result in results]) for i in range(1, 5)
+        )
+        # order the streamlines by seed, the same for any number of threads
+        order = np.argsort(seed_ids, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))[order]
+        sizes = sizes[order]
+        offsets = np.zeros(sizes.size + 1, dtype=pyvista.ID_TYPE)
+        np.cumsum(sizes, out=offsets[1:])
+        index = np.repeat(starts - offsets[:-1], sizes) + np.arange(offsets[-1])
+        return (
+            offsets,
+            points[index],
+            integration_time[index],
+            termination[order],
+            seed_ids[order],
+        )
+
     def streamlines_evenly_spaced_2D(
         self,
         vectors=None,
@@ -3855,6 +4290,74 @@ class DataSetFilters:
         )
         return sampled_multiple_lines
 
+    def sample_over_lines(
+        self, starts, ends, resolution, tolerance=None, n_threads=1, progress_bar=False
+    ):
+        """Sample a dataset along many straight lines at once.
+
+        Unlike calling :func:`DataSetFilters.sample_over_line` for each
+        line, the points of all the lines are probed together and the
+        locator of the dataset is only built once. Use
+        :func:`pyvista.Sampler.sample_over_lines` to also reuse the
+        locator between calls.
+
+        Parameters
+        ----------
+        starts : numpy.ndarray
+            Start points of the lines as a ``(n_lines, 3)`` array.
+
+        ends : numpy.ndarray
+            End points of the lines as a ``(n_lines, 3)`` array.
+
+        resolution : int
+            Number of pieces to divide each line into. Each line is
+            sampled at ``resolution + 1`` evenly spaced points.
+
+        tolerance : float, optional
+            Tolerance used to compute whether a point in the source is in a
+            cell of the input.  If not given, tolerance is automatically generated.
+
+        n_threads : int, default: 1
+            Number of threads sampling equal parts of the points.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress. Only used with
+            a single thread.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            Sampled arrays by name, including ``'vtkValidPointMask'``.
+            Each array has the shape ``(n_lines, resolution + 1)``
+            followed by the shape of the components of the dataset array.
+
+        numpy.ndarray
+            ``(n_lines, resolution + 1)`` array of the distance of each
+            sample from the start of its line.
+
+        Examples
+        --------
+        Sample the Y coordinate of a plane along 100 parallel transects.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> plane = pyvista.Plane()
+        >>> plane['y'] = plane.points[:, 1]
+        >>> y = np.linspace(-0.5, 0.5, 100)
+        >>> starts = np.column_stack((np.full(100, -0.5), y, np.zeros(100)))
+        >>> ends = np.column_stack((np.full(100, 0.5), y, np.zeros(100)))
+        >>> arrays, distance = plane.sample_over_lines(starts, ends, resolution=10)
+        >>> arrays['y'].shape
+        (100, 11)
+        >>> np.allclose(arrays['y'][:, 5], y)
+        True
+
+        """
+        sampler = pyvista.Sampler(self, tolerance=tolerance)
+        return sampler.sample_over_lines(
+            starts, ends, resolution, n_threads=n_threads, progress_bar=progress_bar
+        )
+
     def sample_over_circular_arc(
         self, pointa, pointb, center, resolution=None, tolerance=None, progress_bar=False
     ):
@@ -4250,10 +4753,16 @@ class DataSetFilters:
     def extract_cells(self, ind, progress_bar=False):
         """Return a subset of the grid.
 
+        The cells of :class:`pyvista.PolyData` and
+        :class:`pyvista.UnstructuredGrid` are extracted directly with
+        NumPy, which is much faster than the VTK selection for large
+        meshes. The output is the same.
+
         Parameters
         ----------
         ind : numpy.ndarray
-            Numpy array of cell indices to be extracted.
+            Numpy array of cell indices or boolean mask of the cells to
+            be extracted.
 
         progress_bar : bool, default: False
             Display a progress bar to indicate progress.
@@ -4277,6 +4786,11 @@ class DataSetFilters:
         >>> pl.show()
 
         """
+        if _supports_fast_extraction(self):
+            cell_ids = _selected_ids(ind, self.n_cells)
+            if cell_ids.size:
+                return _extract_cells_fast(self, cell_ids, *get_offsets_connectivity(self))
+
         # Create selection objects
         selectionNode = _vtk.vtkSelectionNode()
         selectionNode.SetFieldType(_vtk.vtkSelectionNode.CELL)
@@ -4293,11 +4807,12 @@ class DataSetFilters:
         _update_alg(extract_sel, progress_bar, 'Extracting Cells')
         subgrid = _get_output(extract_sel)
 
-        # extracts only in float32
+        # the precision of the extracted points may differ from the input
         if subgrid.n_points:
-            if self.points.dtype != np.dtype('float32'):
+            points = self._point_coordinates
+            if points.dtype != subgrid.points.dtype:
                 ind = subgrid.point_data['vtkOriginalPointIds']
-                subgrid.points = self.points[ind]
+                subgrid.points = points[ind]
 
         return subgrid
 
@@ -4307,7 +4822,8 @@ class DataSetFilters:
         Parameters
         ----------
         ind : np.ndarray, list, or sequence
-            Numpy array of point indices to be extracted.
+            Numpy array of point indices or boolean mask of the points
+            to be extracted.
         adjacent_cells : bool, optional
             If ``True``, extract the cells that contain at least one of
             the extracted points. If ``False``, extract the cells that
@@ -4335,12 +4851,26 @@ class DataSetFilters:
         >>> extracted.plot()
 
         """
+        if not include_cells:
+            adjacent_cells = True
+        if _supports_fast_extraction(self):
+            point_ids = _selected_ids(ind, self.n_points)
+            if not include_cells and point_ids.size:
+                return _extract_vertices_fast(self, point_ids)
+            if include_cells:
+                offsets, conn = get_offsets_connectivity(self)
+                selected = np.zeros(self.n_points, dtype=bool)
+                selected[point_ids] = True
+                cell_ids = np.flatnonzero(
+                    _cells_of_points(offsets, conn, selected, all_points=not adjacent_cells)
+                )
+                if cell_ids.size:
+                    return _extract_cells_fast(self, cell_ids, offsets, conn)
+
         # Create selection objects
         selectionNode = _vtk.vtkSelectionNode()
         selectionNode.SetFieldType(_vtk.vtkSelectionNode.POINT)
         selectionNode.SetContentType(_vtk.vtkSelectionNode.INDICES)
-        if not include_cells:
-            adjacent_cells = True
         if not adjacent_cells:
             # Build array of point indices to be removed.
             ind_rem = np.ones(self.n_points, dtype='bool')
@@ -4363,7 +4893,12 @@ class DataSetFilters:
         return _get_output(extract_sel)
 
     def extract_surface(
-        self, pass_pointid=True, pass_cellid=True, nonlinear_subdivision=1, progress_bar=False
+        self,
+        pass_pointid=True,
+        pass_cellid=True,
+        nonlinear_subdivision=1,
+        progress_bar=False,
+        pass_arrays=None,
     ):
         """Extract surface mesh of the grid.
 
@@ -4397,6 +4932,10 @@ class DataSetFilters:
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
+        pass_arrays : sequence[str], optional
+            Names of the point and cell arrays to pass to the output.
+            Defaults to all the arrays.
+
         Returns
         -------
         pyvista.PolyData
@@ -4417,7 +4956,7 @@ class DataSetFilters:
 
         """
         surf_filter = _vtk.vtkDataSetSurfaceFilter()
-        surf_filter.SetInputData(self)
+        surf_filter.SetInputData(_with_arrays(self, pass_arrays))
         surf_filter.SetPassThroughPointIds(pass_pointid)
         surf_filter.SetPassThroughCellIds(pass_cellid)
 
@@ -5119,6 +5658,15 @@ class DataSetFilters:
         if m.GetElement(3, 3) == 0:
             raise ValueError("Transform element (3,3), the inverse scale term, is zero")
 
+        # defer in-place transforms within ``DataSet.transform_stack``
+        pending = self._pending_transform
+        if pending is not None:
+            if not inplace or pending.transform_all_input_vectors != transform_all_input_vectors:
+                self._apply_pending_transform()
+            if inplace:
+                pending.push(pyvista.array_from_vtkmatrix(m), transform_all_input_vectors)
+                return self
+
         # vtkTransformFilter truncates the result if the input is an integer type
         # so convert input points and relevant vectors to float
         # (creating a new copy would be harmful much more often)
@@ -5458,17 +6006,509 @@ class DataSetFilters:
         return self.shrink(1.0)
 
 
-def _set_threshold_limit(alg, value, method, invert):
-    """Set vtkThreshold limits and function.
+def _contour_algorithm(dataset, method, scalars_name, n_contours, compute_gradients):
+    """Return the contour algorithm for a method, resolving ``'auto'``."""
+    if method == 'auto':
+        if isinstance(dataset, pyvista.UniformGrid) and min(dataset.dimensions) > 1:
+            method = 'flying_edges'
+        elif (
+            isinstance(dataset, pyvista.UnstructuredGrid)
+            and not compute_gradients
+            and n_contours <= _CONTOUR_LINEAR_GRID_MAX_VALUES
+            and _vtk.vtkContour3DLinearGrid.CanFullyProcessDataObject(dataset, scalars_name)
+        ):
+            alg = _vtk.vtkContour3DLinearGrid()
+            alg.SetMergePoints(True)
+            return alg
+        else:
+            method = 'contour'
+    if method == 'marching_cubes':
+        return _vtk.vtkMarchingCubes()
+    if method == 'flying_edges':
+        return _vtk.vtkFlyingEdges3D()
+    return _vtk.vtkContourFilter()
 
-    Addresses VTK API deprecations and previous PyVista inconsistencies with ParaView. Reference:
 
-    * https://github.com/pyvista/pyvista/issues/2850
-    * https://github.com/pyvista/pyvista/issues/3610
-    * https://discourse.vtk.org/t/unnecessary-vtk-api-change/9929
+def _sort_contour_values(alg, data_range):
+    """Move the isovalues crossing the data range first.
+
+    ``vtkFlyingEdges3D`` does not interpolate the point data when the
+    first isovalue produces no surface.
+
+    """
+    values = np.array([alg.GetValue(i) for i in range(alg.GetNumberOfContours())])
+    outside = (values <= data_range[0]) | (values >= data_range[1])
+    for i, value in enumerate(values[np.argsort(outside, kind='stable')]):
+        alg.SetValue(i, value)
+
+
+def _with_arrays(dataset, names, keep=()):
+    """Return a shallow copy of a dataset holding only the named point and cell arrays.
+
+    Return the dataset itself when ``names`` is ``None``. The blocks of a
+    :class:`pyvista.MultiBlock` keep the named arrays they hold. Raise a
+    ``KeyError`` for names that are in no block.
+
+    """
+    if names is None:
+        return dataset
+    if isinstance(names, str):
+        names = [names]
+    names = (set(names) | set(keep)) - {None}
+    missing = names - set(_array_names(dataset))
+    if missing:
+        raise KeyError(f'Arrays {sorted(missing)} not found in the dataset.')
+    if isinstance(dataset, pyvista.MultiBlock):
+        output = pyvista.MultiBlock()
+        for key, block in zip(dataset.keys(), dataset):
+            if block is not None:
+                present = set(_array_names(block))
+                block = _with_arrays(block, names & present)
+            output.append(block, key)
+        return output
+    output = dataset.copy(deep=False)
+    for data in (output.point_data, output.cell_data):
+        for name in data.keys():
+            if name not in names:
+                data.remove(name)
+    return output
+
+
+def _array_names(dataset):
+    """Return the names of the point and cell arrays of a dataset or its blocks."""
+    if isinstance(dataset, pyvista.MultiBlock):
+        return [name for block in dataset if block is not None for name in _array_names(block)]
+    return dataset.point_data.keys() + dataset.cell_data.keys()
+
+
+def _supports_fast_extraction(dataset):
+    """Return whether the cells of a dataset can be extracted with NumPy.
+
+    Polyhedra, ghost cells and arrays that are not plain data arrays are
+    left to ``vtkExtractSelection``.
+
+    """
+    if isinstance(dataset, pyvista.UnstructuredGrid):
+        if dataset.GetFaces() is not None:
+            return False
+    elif not isinstance(dataset, pyvista.PolyData):
+        return False
+    for data in (dataset.GetPointData(), dataset.GetCellData()):
+        if data.GetArray('vtkGhostType') is not None:
+            return False
+        for i in range(data.GetNumberOfArrays()):
+            array = data.GetArray(i)
+            if array is None or array.IsA('vtkBitArray'):
+                return False
+    return True
+
+
+def _selected_ids(ind, n_items):
+    """Return the sorted unique ids selected by indices or a mask, ignoring invalid ids."""
+    ind = np.asarray(ind)
+    if not issubclass(ind.dtype.type, (np.bool_, np.integer)):
+        raise TypeError('Indices must be either a mask or an integer array-like')
+    if ind.dtype == np.bool_:
+        if ind.shape == (n_items,):
+            return np.flatnonzero(ind)
+        ind = np.flatnonzero(ind)
+    ind = ind.ravel()
+    mask = np.zeros(n_items, dtype=bool)
+    mask[ind[(ind >= 0) & (ind < n_items)]] = True
+    return np.flatnonzero(mask)
+
+
+def _cells_of_points(offsets, conn, selected, all_points=False):
+    """Return the mask of the cells using any, or only, the points of a point mask."""
+    sizes = np.diff(offsets)
+    size = _uniform_size(sizes)
+    if size:
+        # combine the columns, faster than reducing the short rows
+        inside = selected[conn].reshape(-1, size)
+        combine = np.logical_and if all_points else np.logical_or
+        result = inside[:, 0].copy()
+        for column in range(1, size):
+            combine(result, inside[:, column], out=result)
+        return result
+    # number of selected points of each cell
+    cumulative = np.zeros(conn.size + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(selected[conn], out=cumulative[1:])
+    counts = cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+    if all_points:
+        return counts == sizes
+    return counts > 0
+
+
+def _uniform_size(sizes):
+    """Return the size shared by all the cells, ``0`` if their sizes differ."""
+    if sizes.size and sizes[0] and (sizes == sizes[0]).all():
+        return int(sizes[0])
+    return 0
+
+
+def _polydata_cell_types(mesh, cell_ids, sizes):
+    """Return the VTK cell types of some cells of a polydata from their sizes."""
+    n_cells = [mesh.GetNumberOfVerts(), mesh.GetNumberOfLines(), mesh.GetNumberOfPolys()]
+    group = np.searchsorted(np.cumsum(n_cells), cell_ids, side='right')
+    celltypes = np.full(cell_ids.size, _vtk.VTK_TRIANGLE_STRIP, dtype=np.uint8)
+    for index, (single, fixed, other) in enumerate(
+        [
+            (1, _vtk.VTK_VERTEX, _vtk.VTK_POLY_VERTEX),
+            (2, _vtk.VTK_LINE, _vtk.VTK_POLY_LINE),
+            (3, _vtk.VTK_TRIANGLE, _vtk.VTK_POLYGON),
+        ]
+    ):
+        in_group = group == index
+        celltypes[in_group] = np.where(sizes[in_group] == single, fixed, other)
+    celltypes[(group == 2) & (sizes == 4)] = _vtk.VTK_QUAD
+    return celltypes
+
+
+def _copy_tuples(source, target, ids, original_ids_name):
+    """Copy the tuples of the arrays of a ``vtkDataSetAttributes`` at ``ids``.
+
+    The active attributes are kept and the ids are stored in a new
+    ``original_ids_name`` array, like ``vtkExtractSelection``.
 
     """
-    # Check value
+    for i in range(source.GetNumberOfArrays()):
+        array = source.GetArray(i)
+        values = _vtk.vtk_to_numpy(array)[ids]
+        copy = _vtk.numpy_to_vtk(values, array_type=array.GetDataType())
+        copy.SetName(array.GetName())
+        if array.HasAComponentName():
+            for component in range(array.GetNumberOfComponents()):
+                copy.SetComponentName(component, array.GetComponentName(component))
+        target.AddArray(copy)
+    for attribute in range(_vtk.vtkDataSetAttributes.NUM_ATTRIBUTES):
+        active = source.GetAttribute(attribute)
+        if active is not None:
+            target.SetActiveAttribute(active.GetName(), attribute)
+    original_ids = _vtk.numpy_to_vtkIdTypeArray(ids.astype(pyvista.ID_TYPE))
+    original_ids.SetName(original_ids_name)
+    target.AddArray(original_ids)
+
+
+def _new_subset_grid(dataset, point_ids, offsets, conn, celltypes):
+    """Return an unstructured grid with some points of a dataset and new cells."""
+    # vtkCellArray copies the arrays into its own arrays sharing their memory
+    cells = _vtk.vtkCellArray()
+    cells.SetData(
+        _vtk.numpy_to_vtkIdTypeArray(offsets.astype(pyvista.ID_TYPE, copy=False), deep=True),
+        _vtk.numpy_to_vtkIdTypeArray(conn.astype(pyvista.ID_TYPE, copy=False), deep=True),
+    )
+    output = pyvista.UnstructuredGrid()
+    output.SetPoints(pyvista.vtk_points(dataset.points[point_ids], deep=False))
+    output.SetCells(_vtk.numpy_to_vtk(celltypes, deep=True), cells)
+    _copy_tuples(dataset.GetPointData(), output.GetPointData(), point_ids, 'vtkOriginalPointIds')
+    output.GetFieldData().PassData(dataset.GetFieldData())
+    return output
+
+
+def _extract_cells_fast(dataset, cell_ids, offsets, conn):
+    """Extract cells of a polydata or unstructured grid with NumPy (internal helper).
+
+    Return the same unstructured grid as ``vtkExtractSelection`` with a
+    selection of the sorted unique ``cell_ids``: the points used by the
+    cells in the order of their ids, and the point and cell data with
+    the ``vtkOriginalPointIds`` and ``vtkOriginalCellIds`` arrays. The
+    points keep their precision.
+
+    """
+    all_sizes = np.diff(offsets)
+    sizes = all_sizes[cell_ids]
+    new_offsets = np.zeros(cell_ids.size + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(sizes, out=new_offsets[1:])
+    size = _uniform_size(all_sizes)
+    if size:
+        conn = conn.reshape(-1, size)[cell_ids].ravel()
+    else:
+        selected = np.zeros(all_sizes.size, dtype=bool)
+        selected[cell_ids] = True
+        conn = conn[np.repeat(selected, all_sizes)]
+
+    if cell_ids.size == dataset.n_cells:
+        # all the points are kept when all the cells are selected
+        point_ids = np.arange(dataset.n_points)
+    else:
+        used = np.zeros(dataset.n_points, dtype=bool)
+        used[conn] = True
+        point_ids = np.flatnonzero(used)
+    # compact the point ids with a lookup table
+    lookup = np.empty(dataset.n_points, dtype=pyvista.ID_TYPE)
+    lookup[point_ids] = np.arange(point_ids.size)
+
+    if isinstance(dataset, pyvista.PolyData):
+        celltypes = _polydata_cell_types(dataset, cell_ids, sizes)
+    else:
+        celltypes = dataset.celltypes[cell_ids]
+    output = _new_subset_grid(dataset, point_ids, new_offsets, lookup[conn], celltypes)
+    _copy_tuples(dataset.GetCellData(), output.GetCellData(), cell_ids, 'vtkOriginalCellIds')
+    return output
+
+
+def _extract_vertices_fast(dataset, point_ids):
+    """Extract points as vertex cells with NumPy, like ``vtkExtractSelection``."""
+    offsets = np.arange(point_ids.size + 1, dtype=pyvista.ID_TYPE)
+    conn = np.arange(point_ids.size, dtype=pyvista.ID_TYPE)
+    celltypes = np.full(point_ids.size, _vtk.VTK_VERTEX, dtype=np.uint8)
+    return _new_subset_grid(dataset, point_ids, offsets, conn, celltypes)
+
+
+def _slice_planes(dataset, normal, values, generate_triangles, progress_bar=False):
+    """Slice a dataset by parallel planes in a single pass (internal helper).
+
+    The planes are ``dot(normal, point) == value`` for each of
+    ``values``, with ``normal`` a unit vector. When triangles are
+    requested, uniform grids with active point scalars and without cell
+    data are sliced with ``vtkFlyingEdgesPlaneCutter``, which only
+    visits the cells intersected by each plane. It fails without active
+    scalars and always generates triangles. Other datasets are cut by
+    all the planes at once with the contour values of ``vtkCutter`` and
+    the output is then split by plane, except uniform grids without
+    triangles: ``vtkCutter`` triangulates their cuts by several planes.
+
+    """
+    values = np.asarray(values, dtype=float)
+    if (
+        generate_triangles
+        and isinstance(dataset, pyvista.UniformGrid)
+        and min(dataset.dimensions) > 1
+        and dataset.point_data.active_scalars_name is not None
+        and not dataset.cell_data
+    ):
+        slices = []
+        for value in values:
+            alg = _vtk.vtkFlyingEdgesPlaneCutter()
+            alg.SetInputDataObject(dataset)
+            alg.SetPlane(generate_plane(normal, normal * value))
+            alg.InterpolateAttributesOn()
+            _update_alg(alg, progress_bar, 'Slicing')
+            slices.append(_get_output(alg))
+        return slices
+    if isinstance(dataset, pyvista.UniformGrid) and not generate_triangles and len(values) > 1:
+        return [
+            _slice_planes(dataset, normal, [value], generate_triangles, progress_bar)[0]
+            for value in values
+        ]
+
+    alg = _vtk.vtkCutter()
+    alg.SetInputDataObject(dataset)
+    alg.SetCutFunction(generate_plane(normal, (0.0, 0.0, 0.0)))
+    alg.SetGenerateTriangles(generate_triangles)
+    alg.SetNumberOfContours(len(values))
+    for i, value in enumerate(values):
+        alg.SetValue(i, value)
+    _update_alg(alg, progress_bar, 'Slicing')
+    output = _get_output(alg)
+    if len(values) == 1:
+        return [output]
+
+    # every point of the output lies on one plane, and so do the cells:
+    # group the points and the cells of each kind by plane
+    order = np.argsort(values)
+    midpoints = (values[order][1:] + values[order][:-1]) / 2
+    point_slices = order[np.searchsorted(midpoints, output.points @ normal)]
+    groups = np.arange(len(values) + 1)
+    point_order = np.argsort(point_slices, kind='stable')
+    point_bounds = np.searchsorted(point_slices[point_order], groups)
+    cells = []
+    first_cell = 0
+    for cell_array in (output.GetVerts(), output.GetLines(), output.GetPolys(), output.GetStrips()):
+        offsets = _vtk.vtk_to_numpy(cell_array.GetOffsetsArray())
+        connectivity = _vtk.vtk_to_numpy(cell_array.GetConnectivityArray())
+        cell_slices = point_slices[connectivity[offsets[:-1]]]
+        cell_order = np.argsort(cell_slices, kind='stable')
+        cell_bounds = np.searchsorted(cell_slices[cell_order], groups)
+        cells.append((offsets, connectivity, cell_order, cell_bounds, first_cell))
+        first_cell += cell_slices.size
+
+    slices = []
+    point_map = np.empty(output.n_points, dtype=pyvista.ID_TYPE)
+    for i in range(len(values)):
+        point_ids = point_order[point_bounds[i] : point_bounds[i + 1]]
+        point_map[point_ids] = np.arange(point_ids.size)
+        slc = pyvista.PolyData()
+        slc.points = output.points[point_ids]
+        cell_ids = []
+        setters = [slc.SetVerts, slc.SetLines, slc.SetPolys, slc.SetStrips]
+        for setter, (offsets, connectivity, cell_order, cell_bounds, first_cell) in zip(
+            setters, cells
+        ):
+            selected = cell_order[cell_bounds[i] : cell_bounds[i + 1]]
+            if not selected.size:
+                continue
+            cell_ids.append(selected + first_cell)
+            sizes = offsets[selected + 1] - offsets[selected]
+            new_offsets = np.concatenate(([0], np.cumsum(sizes)))
+            index = np.repeat(offsets[selected] - new_offsets[:-1], sizes)
+            index += np.arange(new_offsets[-1])
+            cell_array = _vtk.vtkCellArray()
+            cell_array.SetData(
+                numpy_to_idarr(new_offsets, deep=True),
+                numpy_to_idarr(point_map[connectivity[index]], deep=True),
+            )
+            setter(cell_array)
+        cell_ids = np.concatenate(cell_ids) if cell_ids else np.empty(0, int)
+        for source, target, ids in (
+            (output.point_data, slc.point_data, point_ids),
+            (output.cell_data, slc.cell_data, cell_ids),
+        ):
+            for name in source.keys():
+                target.AddArray(pyvista.convert_array(source[name][ids], name=name, deep=True))
+            for attribute in range(_vtk.vtkDataSetAttributes.NUM_ATTRIBUTES):
+                array = source.GetAbstractAttribute(attribute)
+                if array is not None:
+                    target.SetActiveAttribute(array.GetName(), attribute)
+        slices.append(slc)
+    return slices
+
+
+def _implicit_function_values(function, dataset):
+    """Evaluate an implicit function at the points of a dataset (internal helper).
+
+    The implicit points of grids are evaluated in chunks rather than
+    being built all at once.
+    """
+    points = dataset._point_coordinates
+    if isinstance(points, np.ndarray):
+        chunks = [points]
+    else:
+        chunks = points.iter_chunks()
+    values = np.empty(dataset.n_points)
+    start = 0
+    for chunk in chunks:
+        dists = _vtk.vtkDoubleArray()
+        function.FunctionValue(pyvista.convert_array(chunk), dists)
+        values[start : start + len(chunk)] = pyvista.convert_array(dists)
+        start += len(chunk)
+    return values
+
+
+def _stream_tracer(
+    dataset,
+    vectors=None,
+    integrator_type=45,
+    integration_direction='both',
+    surface_streamlines=False,
+    initial_step_length=0.5,
+    step_unit='cl',
+    min_step_length=0.01,
+    max_step_length=1.0,
+    max_steps=2000,
+    terminal_speed=1e-12,
+    max_error=1e-6,
+    max_time=None,
+    compute_vorticity=True,
+    rotation_scale=1.0,
+    interpolator_type='point',
+):
+    """Return a ``vtkStreamTracer`` integrating the vectors of a dataset, without its source.
+
+    See :func:`DataSetFilters.streamlines_from_source` for the parameters.
+
+    """
+    integration_direction = str(integration_direction).strip().lower()
+    if integration_direction not in ['both', 'back', 'backward', 'forward']:
+        raise ValueError(
+            "Integration direction must be one of:\n 'backward', "
+            f"'forward', or 'both' - not '{integration_direction}'."
+        )
+    if integrator_type not in [2, 4, 45]:
+        raise ValueError('Integrator type must be one of `2`, `4`, or `45`.')
+    if interpolator_type not in ['c', 'cell', 'p', 'point']:
+        raise ValueError("Interpolator type must be either 'cell' or 'point'")
+    if step_unit not in ['l', 'cl']:
+        raise ValueError("Step unit must be either 'l' or 'cl'")
+    step_unit = {
+        'cl': _vtk.vtkStreamTracer.CELL_LENGTH_UNIT,
+        'l': _vtk.vtkStreamTracer.LENGTH_UNIT,
+    }[step_unit]
+    if isinstance(vectors, str):
+        dataset.set_active_scalars(vectors)
+        dataset.set_active_vectors(vectors)
+    elif vectors is None:
+        pyvista.set_default_active_vectors(dataset)
+
+    if max_time is None:
+        max_velocity = dataset.get_data_range()[-1]
+        max_time = 4.0 * dataset.GetLength() / max_velocity
+
+    # Build the algorithm
+    alg = _vtk.vtkStreamTracer()
+    # Inputs
+    alg.SetInputDataObject(dataset)
+
+    # general parameters
+    alg.SetComputeVorticity(compute_vorticity)
+    alg.SetInitialIntegrationStep(initial_step_length)
+    alg.SetIntegrationStepUnit(step_unit)
+    alg.SetMaximumError(max_error)
+    alg.SetMaximumIntegrationStep(max_step_length)
+    alg.SetMaximumNumberOfSteps(max_steps)
+    alg.SetMaximumPropagation(max_time)
+    alg.SetMinimumIntegrationStep(min_step_length)
+    alg.SetRotationScale(rotation_scale)
+    alg.SetSurfaceStreamlines(surface_streamlines)
+    alg.SetTerminalSpeed(terminal_speed)
+    # Model parameters
+    if integration_direction == 'forward':
+        alg.SetIntegrationDirectionToForward()
+    elif integration_direction in ['backward', 'back']:
+        alg.SetIntegrationDirectionToBackward()
+    else:
+        alg.SetIntegrationDirectionToBoth()
+    # set integrator type
+    if integrator_type == 2:
+        alg.SetIntegratorTypeToRungeKutta2()
+    elif integrator_type == 4:
+        alg.SetIntegratorTypeToRungeKutta4()
+    else:
+        alg.SetIntegratorTypeToRungeKutta45()
+    # set interpolator type
+    if interpolator_type in ['c', 'cell']:
+        alg.SetInterpolatorTypeToCellLocator()
+    else:
+        alg.SetInterpolatorTypeToDataSetPointLocator()
+    return alg
+
+
+def _threshold_values(array, value, method='upper', component_mode='all', component=0):
+    """Return the mask of the values of an array meeting a threshold, like ``vtkThreshold``.
+
+    Bounds are inclusive and NaN values never meet the threshold.
+
+    """
+    if value is None:
+        value = (np.nanmin(array), np.nanmax(array))
+    _check_threshold_value(value, method)
+    if isinstance(value, (np.ndarray, collections.abc.Sequence)):
+        inside = (array >= value[0]) & (array <= value[1])
+    elif method.lower() == 'lower':
+        inside = array <= value
+    else:
+        inside = array >= value
+
+    if inside.ndim == 1:
+        return inside
+    if component_mode == 'component':
+        dim = inside.shape[1]
+        if not isinstance(component, (int, np.integer)):
+            raise TypeError('component must be int')
+        if component > (dim - 1) or component < 0:
+            raise ValueError(
+                f'scalars has {dim} components: supplied component {component} not in range'
+            )
+        return inside[:, component]
+    if component_mode == 'all':
+        return inside.all(axis=1)
+    if component_mode == 'any':
+        return inside.any(axis=1)
+    raise ValueError(f"component_mode must be 'component', 'all', or 'any' got: {component_mode}")
+
+
+def _check_threshold_value(value, method):
+    """Check a threshold value or ``(min, max)`` range and its method."""
     if isinstance(value, (np.ndarray, collections.abc.Sequence)):
         if len(value) != 2:
             raise ValueError(
@@ -5481,6 +6521,21 @@ def _set_threshold_limit(alg, value, method, invert):
             )
     elif isinstance(value, collections.abc.Iterable):
         raise TypeError('Value must either be a single scalar or a sequence.')
+    elif method.lower() not in ['lower', 'upper']:
+        raise ValueError('Invalid method choice. Either `lower` or `upper`')
+
+
+def _set_threshold_limit(alg, value, method, invert):
+    """Set vtkThreshold limits and function.
+
+    Addresses VTK API deprecations and previous PyVista inconsistencies with ParaView. Reference:
+
+    * https://github.com/pyvista/pyvista/issues/2850
+    * https://github.com/pyvista/pyvista/issues/3610
+    * https://discourse.vtk.org/t/unnecessary-vtk-api-change/9929
+
+    """
+    _check_threshold_value(value, method)
     alg.SetInvert(invert)
     # Set values and function
     if pyvista.vtk_version_info >= (9, 1):
@@ -5493,11 +6548,9 @@ def _set_threshold_limit(alg, value, method, invert):
             if method.lower() == 'lower':
                 alg.SetLowerThreshold(value)
                 alg.SetThresholdFunction(_vtk.vtkThreshold.THRESHOLD_LOWER)
-            elif method.lower() == 'upper':
+            else:
                 alg.SetUpperThreshold(value)
                 alg.SetThresholdFunction(_vtk.vtkThreshold.THRESHOLD_UPPER)
-            else:
-                raise ValueError('Invalid method choice. Either `lower` or `upper`')
     else:  # pragma: no cover
         # ThresholdByLower, ThresholdByUpper, ThresholdBetween
         if isinstance(value, (np.ndarray, collections.abc.Sequence)):
@@ -5506,7 +6559,5 @@ def _set_threshold_limit(alg, value, method, invert):
             # Single value
             if method.lower() == 'lower':
                 alg.ThresholdByLower(value)
-            elif method.lower() == 'upper':
-                alg.ThresholdByUpper(value)
             else:
-                raise ValueError('Invalid method choice. Either `lower` or `upper`')
+                alg.ThresholdByUpper(value)
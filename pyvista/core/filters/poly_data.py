@@ -22,6 +22,149 @@ from pyvista.utilities import FieldAssociation, get_array
 from pyvista.utilities.misc import PyVistaFutureWarning
 
 
+def _new_point_cloud(dataset, points, point_data):
+    """Return a point cloud of the same kind as ``dataset``.
+
+    ``point_data`` maps the names of the point arrays of ``dataset``
+    to their values on the new points. The active point
+    arrays of ``dataset`` remain active on the point cloud.
+
+    """
+    if isinstance(dataset, pyvista.PointSet):
+        cloud = pyvista.PointSet(points)
+    else:
+        cloud = pyvista.PolyData(points)
+    for name, array in point_data.items():
+        cloud.point_data[name] = array
+    for attr in ('active_scalars_name', 'active_vectors_name', 'active_normals_name'):
+        name = getattr(dataset.point_data, attr)
+        if name is not None and name in cloud.point_data:
+            setattr(cloud.point_data, attr, name)
+    return cloud
+
+
+def _extract_point_cloud(dataset, mask):
+    """Return the points of ``dataset`` selected by a boolean mask as a point cloud."""
+    point_data = {name: dataset.point_data[name][mask] for name in dataset.point_data.keys()}
+    return _new_point_cloud(dataset, dataset.points[mask], point_data)
+
+
+def _triangle_surface(mesh):
+    """Return a mesh as a triangulated :class:`pyvista.PolyData` surface."""
+    if not isinstance(mesh, pyvista.PolyData):
+        mesh = mesh.extract_surface()
+    if not mesh.is_all_triangles:
+        mesh = pyvista.PolyData(mesh.points, mesh.triangulate().faces)
+    return mesh
+
+
+def _distance_locator(surface):
+    """Return a ``vtkStaticCellLocator`` of a triangulated surface, cached on it.
+
+    The locator is built on a shallow copy of the surface, so that it
+    does not hold a reference to the surface holding it, which would
+    never be freed. Like :attr:`pyvista.PolyData.bvh`, it is built
+    again when the points or faces of the surface are modified.
+
+    """
+    vtk_points = surface.GetPoints()
+    key = (
+        vtk_points.GetMTime() if vtk_points is not None else 0,
+        surface.GetPolys().GetMTime(),
+        surface.n_points,
+        surface.n_faces,
+    )
+    if getattr(surface, '_distance_locator_key', None) != key:
+        copy = _vtk.vtkPolyData()
+        copy.ShallowCopy(surface)
+        locator = _vtk.vtkStaticCellLocator()
+        locator.SetDataSet(copy)
+        locator.BuildLocator()
+        surface._distance_locator = locator
+        surface._distance_locator_key = key
+    return surface._distance_locator
+
+
+def _surface_normals(surface):
+    """Return the points, triangles, face normals and point normals of a triangulated surface.
+
+    The point normals are weighted by the angle of each triangle at the
+    point. The normals are cached on the surface until its points or
+    faces are modified.
+
+    """
+    vtk_points = surface.GetPoints()
+    key = (
+        vtk_points.GetMTime() if vtk_points is not None else 0,
+        surface.GetPolys().GetMTime(),
+        surface.n_points,
+        surface.n_faces,
+    )
+    if getattr(surface, '_surface_normals_key', None) == key:
+        return surface._surface_normals
+
+    points = np.asarray(surface.points, dtype=float)
+    triangles = surface.faces.reshape(-1, 4)[:, 1:]
+    corners = points[triangles]
+    face_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(face_normals, axis=1)
+    face_normals /= np.where(lengths > 0, lengths, 1)[:, np.newaxis]
+
+    point_normals = np.zeros_like(points)
+    for i in range(3):
+        edge_a = corners[:, (i + 1) % 3] - corners[:, i]
+        edge_b = corners[:, (i + 2) % 3] - corners[:, i]
+        norms = np.linalg.norm(edge_a, axis=1) * np.linalg.norm(edge_b, axis=1)
+        cosine = np.einsum('ij,ij->i', edge_a, edge_b) / np.where(norms > 0, norms, 1)
+        angle = np.arccos(np.clip(cosine, -1, 1))
+        for axis in range(3):
+            point_normals[:, axis] += np.bincount(
+                triangles[:, i], angle * face_normals[:, axis], minlength=points.shape[0]
+            )
+
+    surface._surface_normals = (points, triangles, face_normals, point_normals)
+    surface._surface_normals_key = key
+    return surface._surface_normals
+
+
+def _closest_normals(surface, closest, cells):
+    """Return the normal of a triangulated surface at points lying on given cells.
+
+    Points inside a triangle get its normal. Points on an edge or a
+    point of the triangle get the interpolated angle weighted normals
+    of its points, which orient the distance to convex and concave
+    edges consistently.
+
+    """
+    points, triangles, face_normals, point_normals = _surface_normals(surface)
+    corners = points[triangles[cells]]
+
+    # barycentric coordinates of the closest points in their triangle
+    v0, v1, v2 = (corners[:, i] for i in range(3))
+    edge1 = v1 - v0
+    edge2 = v2 - v0
+    offset = closest - v0
+    d00 = np.einsum('ij,ij->i', edge1, edge1)
+    d01 = np.einsum('ij,ij->i', edge1, edge2)
+    d11 = np.einsum('ij,ij->i', edge2, edge2)
+    d20 = np.einsum('ij,ij->i', offset, edge1)
+    d21 = np.einsum('ij,ij->i', offset, edge2)
+    denom = d00 * d11 - d01 * d01
+    denom[denom == 0] = 1
+    weights = np.empty((cells.size, 3))
+    weights[:, 1] = (d11 * d20 - d01 * d21) / denom
+    weights[:, 2] = (d00 * d21 - d01 * d20) / denom
+    weights[:, 0] = 1 - weights[:, 1] - weights[:, 2]
+
+    normals = face_normals[cells]
+    on_boundary = np.any(weights < 1e-6, axis=1)
+    boundary = cells[on_boundary]
+    normals[on_boundary] = np.einsum(
+        'ij,ijk->ik', weights[on_boundary], point_normals[triangles[boundary]]
+    )
+    return normals
+
+
 @abstract_class
 class PolyDataFilters(DataSetFilters):
     """An internal class to manage filters/algorithms for polydata datasets."""
@@ -1997,6 +2140,234 @@ class PolyDataFilters(DataSetFilters):
         del sizes
         return distance
 
+    def _geodesic_cache(self, cache=True):
+        """Return a dictionary caching the geodesic operators of this mesh.
+
+        The cache is invalidated when the points, polygons or lines of
+        the mesh are modified.
+
+        """
+        points = self.GetPoints()
+        key = (
+            points.GetMTime() if points is not None else 0,
+            self.GetPolys().GetMTime(),
+            self.GetLines().GetMTime(),
+            self.n_points,
+        )
+        if not cache or getattr(self, '_geodesic_cache_key', None) != key:
+            self._geodesic_cache_dict = {}
+            self._geodesic_cache_key = key if cache else None
+        return self._geodesic_cache_dict
+
+    def _edge_graph(self, cache=True):
+        """Return the symmetric sparse matrix of the edge lengths of the mesh."""
+        from scipy import sparse
+
+        store = self._geodesic_cache(cache)
+        if 'edge_graph' not in store:
+            edges = []
+            for cells, closed in ((self.GetPolys(), True), (self.GetLines(), False)):
+                offsets = _vtk.vtk_to_numpy(cells.GetOffsetsArray())
+                conn = _vtk.vtk_to_numpy(cells.GetConnectivityArray())
+                if not conn.size:
+                    continue
+                # each point is connected to the next point of its cell
+                nxt = np.arange(1, conn.size + 1)
+                last = offsets[1:] - 1
+                if closed:
+                    nxt[last] = offsets[:-1]
+                else:
+                    nxt[last] = last
+                edge = np.column_stack((conn, conn[nxt]))
+                edges.append(edge[edge[:, 0] != edge[:, 1]])
+
+            if edges:
+                edges = np.sort(np.vstack(edges), axis=1).astype(np.int64)
+                keys = np.unique(edges[:, 0] * self.n_points + edges[:, 1])
+                edges = np.column_stack((keys // self.n_points, keys % self.n_points))
+            else:
+                edges = np.empty((0, 2), dtype=np.int64)
+            points = np.asarray(self.points, dtype=np.float64)
+            lengths = np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
+            graph = sparse.coo_matrix(
+                (lengths, (edges[:, 0], edges[:, 1])), shape=(self.n_points, self.n_points)
+            )
+            store['edge_graph'] = (graph + graph.T).tocsr()
+        return store['edge_graph']
+
+    def _heat_operators(self, cache=True):
+        """Return the cotangent Laplacian, lumped mass and face geometry of the mesh."""
+        from scipy import sparse
+
+        store = self._geodesic_cache(cache)
+        if 'heat' not in store:
+            points = np.asarray(self.points, dtype=np.float64)
+            faces = self.faces.reshape(-1, 4)[:, 1:]
+            vert = points[faces]
+            # counterclockwise edge opposite to each corner of each face
+            opposite = np.roll(vert, 1, axis=1) - np.roll(vert, -1, axis=1)
+            normals = np.cross(opposite[:, 0], opposite[:, 1])
+            double_area = np.linalg.norm(normals, axis=1)
+            double_area[double_area == 0] = np.finfo(float).eps
+
+            # cotangent of the angle at each corner
+            to_next = np.roll(vert, -1, axis=1) - vert
+            to_prev = np.roll(vert, 1, axis=1) - vert
+            cot = np.einsum('ijk,ijk->ij', to_next, to_prev) / double_area[:, np.newaxis]
+
+            # the corner angle weights the edge between the two other vertices
+            rows = np.roll(faces, -1, axis=1).ravel()
+            cols = np.roll(faces, 1, axis=1).ravel()
+            weights = 0.5 * cot.ravel()
+            weight = sparse.coo_matrix(
+                (weights, (rows, cols)), shape=(self.n_points, self.n_points)
+            ).tocsr()
+            weight = weight + weight.T
+            laplacian = weight - sparse.diags(np.asarray(weight.sum(axis=1)).ravel())
+            mass = np.bincount(
+                faces.ravel(), np.repeat(double_area / 6, 3), minlength=self.n_points
+            )
+            store['heat'] = laplacian.tocsc(), mass, faces, opposite, normals, double_area, cot
+        return store['heat']
+
+    def geodesic_distance_field(self, sources, method='dijkstra', time_step=None, cache=True):
+        """Calculate the geodesic distance from a set of source points to every point.
+
+        The whole distance field is computed in one pass over the mesh
+        rather than with one :func:`PolyDataFilters.geodesic_distance`
+        call per pair of points.
+
+        Two methods are available:
+
+        * ``'dijkstra'`` computes the exact shortest path distance along
+          the edges of the mesh, like
+          :func:`PolyDataFilters.geodesic_distance`.
+        * ``'heat'`` uses the heat method of Crane et al. to approximate
+          the smooth geodesic distance across the faces of the mesh. It
+          is typically closer to the true surface distance than edge
+          paths, but requires an all triangle mesh.
+
+        The edge graph and the heat method operators are built once and
+        cached on the mesh until its points or cells are modified.
+
+        This filter requires ``scipy``.
+
+        Parameters
+        ----------
+        sources : int or sequence[int]
+            Indices of the source points.
+
+        method : str, optional
+            Either ``'dijkstra'`` or ``'heat'``.
+
+        time_step : float, optional
+            Diffusion time used by the heat method. Defaults to the
+            square of the mean edge length.
+
+        cache : bool, optional
+            Reuse the edge graph and heat operators cached on the mesh
+            by previous calls. When ``False`` they are rebuilt.
+
+        Returns
+        -------
+        numpy.ndarray
+            Geodesic distance of each point to the nearest source.
+            Points that cannot be reached from any source are set to
+            ``numpy.inf``.
+
+        numpy.ndarray
+            Index of the nearest source point for each point, computed
+            along the edges of the mesh. Points that cannot be reached
+            from any source are set to ``-1``.
+
+        Examples
+        --------
+        Compute the distance field from the two poles of a sphere.
+
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> distance, nearest = sphere.geodesic_distance_field([0, 1])
+        >>> f'Maximum distance is {distance.max():.3f}'
+        'Maximum distance is 0.758'
+        >>> sphere['distance'] = distance
+        >>> sphere.plot(scalars='distance')
+
+        """
+        try:
+            from scipy import sparse
+            from scipy.sparse import csgraph, linalg
+        except ImportError:  # pragma: no cover
+            raise ImportError('Install `scipy` to use `geodesic_distance_field`.')
+
+        sources = np.unique(np.asarray(sources, dtype=int).ravel())
+        if not sources.size:
+            raise ValueError('At least one source point is required.')
+        if sources.min() < 0 or sources.max() >= self.n_points:
+            raise IndexError('Invalid point indices.')
+        if method not in ['dijkstra', 'heat']:
+            raise ValueError(f'Invalid method "{method}". Use either "dijkstra" or "heat".')
+
+        graph = self._edge_graph(cache)
+        distance, _, nearest = csgraph.dijkstra(
+            graph, directed=False, indices=sources, min_only=True, return_predecessors=True
+        )
+        nearest[nearest < 0] = -1
+        if method == 'dijkstra':
+            return distance, nearest
+
+        if not self.is_all_triangles:
+            raise NotAllTrianglesError("Input mesh for the heat method must be all triangles.")
+        laplacian, mass, faces, opposite, normals, double_area, cot = self._heat_operators(cache)
+        if time_step is None:
+            time_step = graph.data.mean() ** 2 if graph.nnz else 1.0
+
+        store = self._geodesic_cache(cache)
+        if store.get('heat_solver', (None,))[0] != time_step:
+            # both systems are symmetric, use a symmetric fill-reducing ordering
+            mass_matrix = sparse.diags(mass)
+            eps = 1e-10 * mass.mean()
+            store['heat_solver'] = (
+                time_step,
+                linalg.splu(
+                    (mass_matrix - time_step * laplacian).tocsc(), permc_spec='MMD_AT_PLUS_A'
+                ).solve,
+                linalg.splu(
+                    (eps * mass_matrix - laplacian).tocsc(), permc_spec='MMD_AT_PLUS_A'
+                ).solve,
+            )
+        _, heat_solve, poisson_solve = store['heat_solver']
+
+        # diffuse heat from the sources
+        impulse = np.zeros(self.n_points)
+        impulse[sources] = 1.0
+        heat = heat_solve(impulse)
+
+        # normalized gradient of the heat on each face
+        unit_normals = normals / double_area[:, np.newaxis]
+        gradient = np.einsum(
+            'ij,ijk->ik', heat[faces], np.cross(unit_normals[:, np.newaxis], opposite)
+        )
+        gradient /= double_area[:, np.newaxis]
+        norm = np.linalg.norm(gradient, axis=1)
+        norm[norm == 0] = 1.0
+        field = -gradient / norm[:, np.newaxis]
+
+        # integrated divergence of the field at each point
+        vert = np.asarray(self.points, dtype=np.float64)[faces]
+        divergence = np.zeros(self.n_points)
+        for i in range(3):
+            j, k = (i + 1) % 3, (i + 2) % 3
+            edge_j = vert[:, j] - vert[:, i]
+            edge_k = vert[:, k] - vert[:, i]
+            contribution = cot[:, k] * np.einsum('ij,ij->i', edge_j, field)
+            contribution += cot[:, j] * np.einsum('ij,ij->i', edge_k, field)
+            divergence += np.bincount(faces[:, i], 0.5 * contribution, minlength=self.n_points)
+
+        phi = poisson_solve(-divergence)
+        phi -= phi[sources].min()
+        phi[nearest < 0] = np.inf
+        return phi, nearest
+
     def ray_trace(self, origin, end_point, first_point=False, plot=False, off_screen=None):
         """Perform a single ray trace calculation.
 
@@ -2159,41 +2530,180 @@ class PolyDataFilters(DataSetFilters):
             origins, directions, multiple_hits=not first_point
         )
         if retry:
-            # gather intersecting rays in lists
-            loc_lst = locations.tolist()
-            ray_lst = index_ray.tolist()
-            tri_lst = index_tri.tolist()
-
             # find indices that trimesh failed on
             all_ray_indices = np.arange(len(origins))
             retry_ray_indices = np.setdiff1d(all_ray_indices, index_ray, assume_unique=True)
 
-            # compute ray points for all failed rays at once
-            origins_retry = origins[retry_ray_indices, :]  # shape (n_retry, 3)
-            directions_retry = directions[retry_ray_indices, :]
-            unit_directions = directions_retry / np.linalg.norm(
-                directions_retry, axis=1, keepdims=True
+            # trace all failed rays at once over the length of the mesh
+            locs, rays, cells, _ = self.batch_ray_trace(
+                origins[retry_ray_indices],
+                directions[retry_ray_indices],
+                first_point=first_point,
+                max_distance=self.length,
             )
-            second_points = origins_retry + unit_directions * self.length  # shape (n_retry, 3)
-
-            for id_r, origin, second_point in zip(retry_ray_indices, origins_retry, second_points):
-                locs, indices = self.ray_trace(origin, second_point, first_point=first_point)
-                if locs.any():
-                    if first_point:
-                        locs = locs.reshape([1, 3])
-                    ray_lst.extend([id_r] * indices.size)
-                    tri_lst.extend(indices)
-                    loc_lst.extend(locs)
 
             # sort result arrays by ray index
-            index_ray = np.array(ray_lst)
-            sorting_inds = index_ray.argsort()
+            index_ray = np.concatenate((index_ray, retry_ray_indices[rays]))
+            sorting_inds = index_ray.argsort(kind='stable')
             index_ray = index_ray[sorting_inds]
-            index_tri = np.array(tri_lst)[sorting_inds]
-            locations = np.array(loc_lst)[sorting_inds]
+            index_tri = np.concatenate((index_tri, cells))[sorting_inds]
+            locations = np.concatenate((locations.reshape(-1, 3), locs))[sorting_inds]
 
         return locations, index_ray, index_tri
 
+    def batch_ray_trace(self, origins, directions, first_point=False, max_distance=None):
+        """Perform many ray trace calculations using a bounding volume hierarchy.
+
+        This is a dependency-free alternative to
+        :func:`PolyDataFilters.multi_ray_trace`. Rays are traced in
+        vectorized batches through a bounding volume hierarchy (BVH) of
+        the triangles of the mesh. The hierarchy is built once and cached
+        on the mesh (see :attr:`pyvista.PolyData.bvh`), so repeated calls
+        on an unmodified mesh only pay for the traversal.
+
+        This requires a mesh with only triangular faces.
+
+        Parameters
+        ----------
+        origins : sequence
+            Starting point for each ray. A single origin may be given
+            for all rays.
+
+        directions : sequence
+            Direction vector for each ray.
+
+        first_point : bool, optional
+            Returns the closest intersection of each ray only.
+
+        max_distance : float or sequence, optional
+            Maximum distance traced along each ray. Either a single
+            value or one value per ray. Rays are infinite by default.
+
+        Returns
+        -------
+        intersection_points : numpy.ndarray
+            Location of the intersection points.  Empty array if no
+            intersections.
+
+        intersection_rays : numpy.ndarray
+            Indices of the ray for each intersection point. Empty array if no
+            intersections.
+
+        intersection_cells : numpy.ndarray
+            Indices of the intersection cells.  Empty array if no
+            intersections.
+
+        intersection_distances : numpy.ndarray
+            Distance from the ray origin to each intersection point.
+            Empty array if no intersections.
+
+        Examples
+        --------
+        Compute the intersection between rays from the origin in
+        directions ``[1, 0, 0]``, ``[0, 1, 0]`` and ``[0, 0, 1]``, and
+        a sphere with radius 0.5 centered at the origin.
+
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> points, rays, cells, distances = sphere.batch_ray_trace(
+        ...     [0, 0, 0], [[1, 0, 0], [0, 1, 0], [0, 0, 1]], first_point=True
+        ... )
+        >>> rays
+        array([0, 1, 2])
+        >>> [f'{distance:.3f}' for distance in distances]
+        ['0.499', '0.497', '0.500']
+
+        """
+        if not self.is_all_triangles:
+            raise NotAllTrianglesError("Input mesh for batch_ray_trace must be all triangles.")
+        return self.bvh.intersect(
+            origins, directions, first_point=first_point, max_distance=max_distance
+        )
+
+    def distance_to(self, target, signed=True, return_closest=True):
+        """Compute the distance from the points of this mesh to a surface.
+
+        The closest point of ``target`` to each point is found with a
+        ``vtkStaticCellLocator``. The locator is built once and cached
+        on ``target``, so repeated calls against an unmodified surface
+        only pay for the queries, which are made point by point. Unlike
+        :func:`DataSetFilters.compute_implicit_distance`, this also
+        returns the closest points and cells.
+
+        Parameters
+        ----------
+        target : pyvista.DataSet
+            Reference surface. Datasets that are not triangulated
+            :class:`pyvista.PolyData` surfaces are converted first, in
+            which case the locator is not cached and the closest cell
+            ids refer to the cells of the triangulated surface.
+
+        signed : bool, default: True
+            Return signed distances, positive on the side the normals
+            of ``target`` point to, like
+            :func:`DataSetFilters.compute_implicit_distance`. The sign
+            uses the normal of the closest triangle, or the angle
+            weighted normals of its points when the closest point lies
+            on one of its edges.
+
+        return_closest : bool, default: True
+            Also return the closest points and cells.
+
+        Returns
+        -------
+        distances : numpy.ndarray
+            Distance from each point to ``target``.
+
+        closest_points : numpy.ndarray
+            ``(n_points, 3)`` array of the closest point of ``target``.
+            Only returned when ``return_closest=True``.
+
+        closest_cells : numpy.ndarray
+            Index of the cell of ``target`` holding each closest point.
+            Only returned when ``return_closest=True``.
+
+        Examples
+        --------
+        Compute the signed distance from a slightly larger sphere to a
+        sphere.
+
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere(radius=0.5)
+        >>> larger = pyvista.Sphere(radius=0.6, theta_resolution=10, phi_resolution=10)
+        >>> distances, points, cells = larger.distance_to(sphere)
+        >>> f'{distances.min():.3f}, {distances.max():.3f}'
+        '0.100, 0.101'
+
+        """
+        surface = _triangle_surface(target)
+        locator = _distance_locator(surface)
+
+        points = np.asarray(self.points, dtype=float)
+        cell = _vtk.vtkGenericCell()
+        point = [0.0, 0.0, 0.0]
+        cell_id = _vtk.mutable(0)
+        sub_id = _vtk.mutable(0)
+        dist2 = _vtk.mutable(0.0)
+        closest = []
+        cells = []
+        distances = []
+        for query_point in points.tolist():
+            locator.FindClosestPoint(query_point, point, cell, cell_id, sub_id, dist2)
+            closest.extend(point)
+            cells.append(int(cell_id))
+            distances.append(float(dist2))
+        closest = np.reshape(np.array(closest, dtype=float), (-1, 3))
+        cells = np.array(cells, dtype=pyvista.ID_TYPE)
+        distances = np.sqrt(np.array(distances, dtype=float))
+
+        if signed and points.shape[0]:
+            normals = _closest_normals(surface, closest, cells)
+            sign = np.einsum('ij,ij->i', points - closest, normals)
+            distances[sign < 0] *= -1
+        if return_closest:
+            return distances, closest, cells
+        return distances
+
     def plot_boundaries(self, edge_color="red", line_width=None, progress_bar=False, **kwargs):
         """Plot boundaries of a mesh.
 
@@ -3572,3 +4082,247 @@ class PolyDataFilters(DataSetFilters):
         _update_alg(mc, progress_bar, 'Reconstructing surface')
         surf = pyvista.wrap(mc.GetOutput())
         return surf
+
+    def voxel_down_sample(self, voxel_size):
+        """Downsample the points of this dataset on a voxel grid.
+
+        The points are binned into cubic voxels and the points falling
+        in each occupied voxel are replaced by their centroid. Point
+        arrays are averaged over the same voxels. The binning is done
+        with a vectorized spatial hash, so this filter scales to large
+        point clouds.
+
+        Any cells of this dataset are discarded, and the output is a
+        point cloud.
+
+        Parameters
+        ----------
+        voxel_size : float
+            Edge length of the voxels.
+
+        Returns
+        -------
+        pyvista.PolyData or pyvista.PointSet
+            Point cloud with one point per occupied voxel. The output is
+            a :class:`pyvista.PointSet` when this dataset is one.
+
+        Notes
+        -----
+        Numeric point arrays are averaged as floating point values,
+        including integer arrays. Non-numeric arrays are not passed to
+        the output.
+
+        Examples
+        --------
+        Downsample a dense random point cloud.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> rng = np.random.default_rng(0)
+        >>> cloud = pyvista.PolyData(rng.random((100000, 3)))
+        >>> cloud['x'] = cloud.points[:, 0]
+        >>> down = cloud.voxel_down_sample(0.1)
+        >>> down.n_points
+        1000
+        >>> bool(np.allclose(down['x'], down.points[:, 0]))
+        True
+
+        """
+        from pyvista.utilities.spatial_hash import SpatialHash
+
+        if not self.n_points:
+            return _extract_point_cloud(self, np.zeros(0, dtype=bool))
+        spatial_hash = SpatialHash(self.points, voxel_size)
+        counts = spatial_hash.cell_count[:, np.newaxis]
+
+        def average(array):
+            array = np.asarray(array)[spatial_hash.order]
+            shape = (-1,) + array.shape[1:]
+            sums = np.add.reduceat(array.reshape(array.shape[0], -1), spatial_hash.cell_start)
+            return (sums / counts).reshape(shape)
+
+        points = average(self.points.astype(np.float64)).astype(self.points.dtype)
+        point_data = {}
+        for name in self.point_data.keys():
+            array = self.point_data[name]
+            if np.issubdtype(array.dtype, np.number) or array.dtype == np.bool_:
+                point_data[name] = average(array.astype(np.float64))
+        return _new_point_cloud(self, points, point_data)
+
+    def remove_radius_outliers(self, radius, min_neighbors=1):
+        """Remove the points that have too few neighbors within a radius.
+
+        Neighbors are counted with a vectorized spatial hash whose cells
+        are ``radius`` wide, so this filter scales to large point clouds.
+
+        Any cells of this dataset are discarded, and the output is a
+        point cloud.
+
+        Parameters
+        ----------
+        radius : float
+            Radius of the sphere in which the neighbors of each point
+            are counted.
+
+        min_neighbors : int, default: 1
+            Minimum number of other points within ``radius`` for a
+            point to be kept.
+
+        Returns
+        -------
+        pyvista.PolyData or pyvista.PointSet
+            Point cloud of the remaining points and their point data.
+            The output is a :class:`pyvista.PointSet` when this dataset
+            is one.
+
+        See Also
+        --------
+        remove_statistical_outliers
+
+        Examples
+        --------
+        Add a few isolated points to a sphere and remove them.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> cloud = pyvista.PolyData(np.vstack((sphere.points, [[2, 2, 2], [-2, 0, 1]])))
+        >>> cloud.remove_radius_outliers(0.1, min_neighbors=2).n_points
+        842
+
+        """
+        from pyvista.utilities.spatial_hash import SpatialHash
+
+        counts = SpatialHash(self.points, radius).count_within(radius)
+        return _extract_point_cloud(self, counts >= min_neighbors)
+
+    def remove_statistical_outliers(self, n_neighbors=20, std_ratio=2.0):
+        """Remove the points that are farther from their neighbors than average.
+
+        The mean distance of each point to its ``n_neighbors`` nearest
+        neighbors is computed, and points whose mean distance exceeds
+        the average over the whole dataset by more than ``std_ratio``
+        standard deviations are removed. The nearest neighbors are found
+        with a vectorized spatial hash, so this filter scales to large
+        point clouds.
+
+        Any cells of this dataset are discarded, and the output is a
+        point cloud.
+
+        Parameters
+        ----------
+        n_neighbors : int, default: 20
+            Number of nearest neighbors used to compute the mean
+            distance of each point.
+
+        std_ratio : float, default: 2.0
+            Number of standard deviations above the average mean
+            distance beyond which points are removed. Lower values
+            remove more points.
+
+        Returns
+        -------
+        pyvista.PolyData or pyvista.PointSet
+            Point cloud of the remaining points and their point data.
+            The output is a :class:`pyvista.PointSet` when this dataset
+            is one.
+
+        See Also
+        --------
+        remove_radius_outliers
+
+        Examples
+        --------
+        Add a few isolated points to a sphere and remove them.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> cloud = pyvista.PolyData(np.vstack((sphere.points, [[2, 2, 2], [-2, 0, 1]])))
+        >>> cloud.remove_statistical_outliers(n_neighbors=8).n_points
+        842
+
+        """
+        from pyvista.utilities.spatial_hash import nearest_neighbors
+
+        if self.n_points < 2:
+            return _extract_point_cloud(self, np.ones(self.n_points, dtype=bool))
+        n_neighbors = min(n_neighbors, self.n_points - 1)
+        distances, _ = nearest_neighbors(self.points, n_neighbors)
+        mean_distance = distances.mean(axis=1)
+        threshold = mean_distance.mean() + std_ratio * mean_distance.std()
+        return _extract_point_cloud(self, mean_distance <= threshold)
+
+    def estimate_normals(self, n_neighbors=16, viewpoint=None, inplace=False):
+        """Estimate the normals of a point cloud from its nearest neighbors.
+
+        The normal of each point is the direction of least variance of
+        the point and its ``n_neighbors`` nearest neighbors, which are
+        found with a vectorized spatial hash. Unlike
+        :func:`PolyDataFilters.compute_normals`, this does not require
+        any cells.
+
+        The normals are stored in the ``'Normals'`` point array, which
+        is made the active normals.
+
+        Parameters
+        ----------
+        n_neighbors : int, default: 16
+            Number of nearest neighbors used to fit the local plane of
+            each point.
+
+        viewpoint : sequence, optional
+            Orient the normals towards this point. By default, the sign
+            of each normal is arbitrary.
+
+        inplace : bool, default: False
+            Whether to update the mesh in-place.
+
+        Returns
+        -------
+        pyvista.PolyData or pyvista.PointSet
+            Dataset with the estimated normals.
+
+        Examples
+        --------
+        Estimate the normals of the points of a sphere oriented
+        towards its center.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> cloud = pyvista.PolyData(pyvista.Sphere().points)
+        >>> cloud = cloud.estimate_normals(viewpoint=(0, 0, 0))
+        >>> bool(np.allclose(cloud['Normals'], -cloud.points * 2, atol=0.05))
+        True
+
+        """
+        from pyvista.utilities.spatial_hash import nearest_neighbors
+
+        points = np.asarray(self.points, dtype=np.float64)
+        n_neighbors = max(min(n_neighbors, self.n_points - 1), 0)
+        _, indices = nearest_neighbors(points, n_neighbors) if n_neighbors else (None, None)
+
+        normals = np.zeros((self.n_points, 3))
+        chunk_size = 1 << 18
+        for start in range(0, self.n_points, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            if n_neighbors:
+                neighbors = np.concatenate(
+                    (points[chunk, np.newaxis], points[indices[chunk]]), axis=1
+                )
+            else:
+                neighbors = points[chunk, np.newaxis]
+            neighbors = neighbors - neighbors.mean(axis=1, keepdims=True)
+            covariance = np.einsum('nki,nkj->nij', neighbors, neighbors)
+            # eigenvalues are sorted in ascending order
+            normals[chunk] = np.linalg.eigh(covariance)[1][:, :, 0]
+
+        if viewpoint is not None:
+            towards = np.asarray(viewpoint, dtype=np.float64) - points
+            flip = np.einsum('ij,ij->i', normals, towards) < 0
+            normals[flip] *= -1
+
+        mesh = self if inplace else self.copy()
+        mesh.point_data['Normals'] = normals.astype(self.points.dtype, copy=False)
+        mesh.point_data.active_normals_name = 'Normals'
+        return mesh
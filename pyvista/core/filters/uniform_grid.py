@@ -1,5 +1,7 @@
 """Filters with a class to manage filters/algorithms for uniform grid datasets."""
 import collections.abc
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 
 import numpy as np
 
@@ -9,12 +11,24 @@ from pyvista.core.filters import _get_output, _update_alg
 from pyvista.core.filters.data_set import DataSetFilters
 from pyvista.errors import AmbiguousDataError, MissingDataError
 
+_TILE_SIZE = 128
+_PYRAMID_REDUCTIONS = ('mean', 'max', 'nearest')
+
 
 @abstract_class
 class UniformGridFilters(DataSetFilters):
     """An internal class to manage filters/algorithms for uniform grid datasets."""
 
-    def gaussian_smooth(self, radius_factor=1.5, std_dev=2.0, scalars=None, progress_bar=False):
+    def gaussian_smooth(
+        self,
+        radius_factor=1.5,
+        std_dev=2.0,
+        scalars=None,
+        tile_size=None,
+        workers=1,
+        memmap=None,
+        progress_bar=False,
+    ):
         """Smooth the data with a Gaussian kernel.
 
         Parameters
@@ -28,6 +42,21 @@ class UniformGridFilters(DataSetFilters):
         scalars : str, optional
             Name of scalars to process. Defaults to currently active scalars.
 
+        tile_size : int | sequence[int], optional
+            Process the image in bricks of this many points along each
+            axis instead of all at once. Each brick is padded with a halo
+            of neighboring points sized to the kernel, so the result is
+            identical to processing the whole image. Only point data is
+            supported. Defaults to ``128`` when ``workers`` or
+            ``memmap`` is set.
+
+        workers : int, default: 1
+            Number of threads processing the bricks.
+
+        memmap : str | pathlib.Path, optional
+            Write the output scalars to a ``.npy`` file at this path
+            and memory-map it rather than holding the output in memory.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
@@ -62,9 +91,14 @@ class UniformGridFilters(DataSetFilters):
 
         See :ref:`gaussian_smoothing_example` for a full example using this filter.
 
+        Smooth the sample data in bricks of ``8 x 8 x 8`` points using two
+        threads. The result is identical.
+
+        >>> tiled = grid.gaussian_smooth(tile_size=8, workers=2)
+        >>> np.allclose(tiled['scalars'], smoothed['scalars'])
+        True
+
         """
-        alg = _vtk.vtkImageGaussianSmooth()
-        alg.SetInputDataObject(self)
         if scalars is None:
             pyvista.set_default_active_scalars(self)
             field, scalars = self.active_scalars_info
@@ -74,22 +108,38 @@ class UniformGridFilters(DataSetFilters):
             field = self.get_array_association(scalars, preference='point')
             if field.value == 1:
                 raise ValueError('Can only process point data, given `scalars` are cell data.')
-        alg.SetInputArrayToProcess(
-            0, 0, 0, field.value, scalars
-        )  # args: (idx, port, connection, field, name)
-        if isinstance(radius_factor, collections.abc.Iterable):
-            alg.SetRadiusFactors(radius_factor)
-        else:
-            alg.SetRadiusFactors(radius_factor, radius_factor, radius_factor)
-        if isinstance(std_dev, collections.abc.Iterable):
-            alg.SetStandardDeviations(std_dev)
-        else:
-            alg.SetStandardDeviations(std_dev, std_dev, std_dev)
-        _update_alg(alg, progress_bar, 'Performing Gaussian Smoothing')
-        return _get_output(alg)
+        radius_factor = np.broadcast_to(radius_factor, 3).astype(float)
+        std_dev = np.broadcast_to(std_dev, 3).astype(float)
+
+        def make_alg():
+            alg = _vtk.vtkImageGaussianSmooth()
+            alg.SetRadiusFactors(*radius_factor)
+            alg.SetStandardDeviations(*std_dev)
+            return alg
+
+        # vtkImageGaussianSmooth truncates the kernel radius
+        halo = (std_dev * radius_factor).astype(int)
+        return self._run_image_alg(
+            make_alg,
+            field,
+            scalars,
+            halo,
+            tile_size,
+            workers,
+            memmap,
+            progress_bar,
+            'Performing Gaussian Smoothing',
+        )
 
     def median_smooth(
-        self, kernel_size=(3, 3, 3), scalars=None, preference='point', progress_bar=False
+        self,
+        kernel_size=(3, 3, 3),
+        scalars=None,
+        preference='point',
+        tile_size=None,
+        workers=1,
+        memmap=None,
+        progress_bar=False,
     ):
         """Smooth data using a median filter.
 
@@ -118,6 +168,21 @@ class UniformGridFilters(DataSetFilters):
             type to search for in the dataset.  Must be either
             ``'point'`` or ``'cell'``.
 
+        tile_size : int | sequence[int], optional
+            Process the image in bricks of this many points along each
+            axis instead of all at once. Each brick is padded with a halo
+            of neighboring points sized to the kernel, so the result is
+            identical to processing the whole image. Only point data is
+            supported. Defaults to ``128`` when ``workers`` or
+            ``memmap`` is set.
+
+        workers : int, default: 1
+            Number of threads processing the bricks.
+
+        memmap : str | pathlib.Path, optional
+            Write the output scalars to a ``.npy`` file at this path
+            and memory-map it rather than holding the output in memory.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
@@ -150,19 +215,28 @@ class UniformGridFilters(DataSetFilters):
         >>> smoothed.plot(show_scalar_bar=False)
 
         """
-        alg = _vtk.vtkImageMedian3D()
-        alg.SetInputDataObject(self)
         if scalars is None:
             pyvista.set_default_active_scalars(self)
             field, scalars = self.active_scalars_info
         else:
             field = self.get_array_association(scalars, preference=preference)
-        alg.SetInputArrayToProcess(
-            0, 0, 0, field.value, scalars
-        )  # args: (idx, port, connection, field, name)
-        alg.SetKernelSize(kernel_size[0], kernel_size[1], kernel_size[2])
-        _update_alg(alg, progress_bar, 'Performing Median Smoothing')
-        return _get_output(alg)
+
+        def make_alg():
+            alg = _vtk.vtkImageMedian3D()
+            alg.SetKernelSize(kernel_size[0], kernel_size[1], kernel_size[2])
+            return alg
+
+        return self._run_image_alg(
+            make_alg,
+            field,
+            scalars,
+            np.asarray(kernel_size[:3]) // 2,
+            tile_size,
+            workers,
+            memmap,
+            progress_bar,
+            'Performing Median Smoothing',
+        )
 
     def extract_subset(self, voi, rate=(1, 1, 1), boundary=False, progress_bar=False):
         """Select piece (e.g., volume of interest).
@@ -229,6 +303,9 @@ class UniformGridFilters(DataSetFilters):
         erode_value=0,
         kernel_size=(3, 3, 3),
         scalars=None,
+        tile_size=None,
+        workers=1,
+        memmap=None,
         progress_bar=False,
     ):
         """Dilates one value and erodes another.
@@ -255,6 +332,21 @@ class UniformGridFilters(DataSetFilters):
         scalars : str, optional
             Name of scalars to process. Defaults to currently active scalars.
 
+        tile_size : int | sequence[int], optional
+            Process the image in bricks of this many points along each
+            axis instead of all at once. Each brick is padded with a halo
+            of neighboring points sized to the kernel, so the result is
+            identical to processing the whole image. Only point data is
+            supported. Defaults to ``128`` when ``workers`` or
+            ``memmap`` is set.
+
+        workers : int, default: 1
+            Number of threads processing the bricks.
+
+        memmap : str | pathlib.Path, optional
+            Write the output scalars to a ``.npy`` file at this path
+            and memory-map it rather than holding the output in memory.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress. Default ``False``.
 
@@ -292,8 +384,6 @@ class UniformGridFilters(DataSetFilters):
         >>> idilate.plot()
 
         """
-        alg = _vtk.vtkImageDilateErode3D()
-        alg.SetInputDataObject(self)
         if scalars is None:
             pyvista.set_default_active_scalars(self)
             field, scalars = self.active_scalars_info
@@ -303,14 +393,25 @@ class UniformGridFilters(DataSetFilters):
             field = self.get_array_association(scalars, preference='point')
             if field.value == 1:
                 raise ValueError('Can only process point data, given `scalars` are cell data.')
-        alg.SetInputArrayToProcess(
-            0, 0, 0, field.value, scalars
-        )  # args: (idx, port, connection, field, name)
-        alg.SetKernelSize(*kernel_size)
-        alg.SetDilateValue(dilate_value)
-        alg.SetErodeValue(erode_value)
-        _update_alg(alg, progress_bar, 'Performing Dilation and Erosion')
-        return _get_output(alg)
+
+        def make_alg():
+            alg = _vtk.vtkImageDilateErode3D()
+            alg.SetKernelSize(*kernel_size)
+            alg.SetDilateValue(dilate_value)
+            alg.SetErodeValue(erode_value)
+            return alg
+
+        return self._run_image_alg(
+            make_alg,
+            field,
+            scalars,
+            np.asarray(kernel_size) // 2,
+            tile_size,
+            workers,
+            memmap,
+            progress_bar,
+            'Performing Dilation and Erosion',
+        )
 
     def image_threshold(
         self,
@@ -319,6 +420,9 @@ class UniformGridFilters(DataSetFilters):
         out_value=0,
         scalars=None,
         preference='point',
+        tile_size=None,
+        workers=1,
+        memmap=None,
         progress_bar=False,
     ):
         """Apply a threshold to scalar values in a uniform grid.
@@ -358,6 +462,21 @@ class UniformGridFilters(DataSetFilters):
             type to search for in the dataset.  Must be either
             ``'point'`` or ``'cell'``.
 
+        tile_size : int | sequence[int], optional
+            Process the image in bricks of this many points along each
+            axis instead of all at once. Each brick is padded with a halo
+            of neighboring points sized to the kernel, so the result is
+            identical to processing the whole image. Only point data is
+            supported. Defaults to ``128`` when ``workers`` or
+            ``memmap`` is set.
+
+        workers : int, default: 1
+            Number of threads processing the bricks.
+
+        memmap : str | pathlib.Path, optional
+            Write the output scalars to a ``.npy`` file at this path
+            and memory-map it rather than holding the output in memory.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress. Default ``False``.
 
@@ -382,43 +501,158 @@ class UniformGridFilters(DataSetFilters):
         >>> ithresh.plot()
 
         """
-        alg = _vtk.vtkImageThreshold()
-        alg.SetInputDataObject(self)
         if scalars is None:
             pyvista.set_default_active_scalars(self)
             field, scalars = self.active_scalars_info
         else:
             field = self.get_array_association(scalars, preference=preference)
-        alg.SetInputArrayToProcess(
-            0, 0, 0, field.value, scalars
-        )  # args: (idx, port, connection, field, name)
-        # set the threshold(s) and mode
+        # check the threshold(s)
         if isinstance(threshold, (np.ndarray, collections.abc.Sequence)):
             if len(threshold) != 2:
                 raise ValueError(
                     f'Threshold must be length one for a float value or two for min/max; not ({threshold}).'
                 )
-            alg.ThresholdBetween(threshold[0], threshold[1])
         elif isinstance(threshold, collections.abc.Iterable):
             raise TypeError('Threshold must either be a single scalar or a sequence.')
-        else:
-            alg.ThresholdByUpper(threshold)
-        # set the replacement values / modes
-        if in_value is not None:
-            alg.SetReplaceIn(True)
-            alg.SetInValue(in_value)
-        else:
-            alg.SetReplaceIn(False)
-        if out_value is not None:
-            alg.SetReplaceOut(True)
-            alg.SetOutValue(out_value)
-        else:
-            alg.SetReplaceOut(False)
+
+        def make_alg():
+            alg = _vtk.vtkImageThreshold()
+            # set the threshold(s) and mode
+            if isinstance(threshold, (np.ndarray, collections.abc.Sequence)):
+                alg.ThresholdBetween(threshold[0], threshold[1])
+            else:
+                alg.ThresholdByUpper(threshold)
+            # set the replacement values / modes
+            if in_value is not None:
+                alg.SetReplaceIn(True)
+                alg.SetInValue(in_value)
+            else:
+                alg.SetReplaceIn(False)
+            if out_value is not None:
+                alg.SetReplaceOut(True)
+                alg.SetOutValue(out_value)
+            else:
+                alg.SetReplaceOut(False)
+            return alg
+
         # run the algorithm
-        _update_alg(alg, progress_bar, 'Performing Image Thresholding')
-        return _get_output(alg)
+        return self._run_image_alg(
+            make_alg,
+            field,
+            scalars,
+            0,
+            tile_size,
+            workers,
+            memmap,
+            progress_bar,
+            'Performing Image Thresholding',
+        )
+
+    def build_pyramid(self, levels=None, reduction='mean', factor=2, filename=None):
+        """Build a multi-resolution pyramid of this grid.
+
+        Each level reduces the point data of the previous one over blocks
+        of ``factor`` points along each axis, until no axis has at least
+        ``factor`` points. The points of a reduced level sit at the
+        center of their blocks, so the origin and spacing of each level
+        are consistent with the input. Points that do not fill a whole
+        block at the upper end of an axis are dropped.
 
-    def fft(self, output_scalars_name=None, progress_bar=False):
+        Parameters
+        ----------
+        levels : int, optional
+            Maximum number of levels, including the input grid. Defaults
+            to reducing until the grid cannot be reduced anymore.
+
+        reduction : str, default: 'mean'
+            How each block of points is reduced. One of ``'mean'``,
+            ``'max'`` or ``'nearest'``, which keeps the first point of
+            each block. Integer and boolean arrays keep their data type
+            and are rounded when averaged.
+
+        factor : int, default: 2
+            Number of points of each block along each axis.
+
+        filename : str | pathlib.Path, optional
+            Save the pyramid to this ``.vtm`` file.
+
+        Returns
+        -------
+        pyvista.ImagePyramid
+            Levels of the pyramid ordered from the finest to the coarsest.
+
+        Notes
+        -----
+        Only point data is reduced. Arrays that are not numeric or
+        boolean and cell data are not passed to the reduced levels.
+
+        Examples
+        --------
+        Build a pyramid of a sampled function and show the coarsest level
+        which has at most ``1000`` points.
+
+        >>> import pyvista
+        >>> noise = pyvista.perlin_noise(0.1, (2, 5, 8), (0, 0, 0))
+        >>> grid = pyvista.sample_function(noise, [0, 1, 0, 1, 0, 1], dim=(65, 65, 65))
+        >>> pyramid = grid.build_pyramid(levels=4, reduction='max')
+        >>> [level.dimensions for level in pyramid]
+        [(65, 65, 65), (32, 32, 32), (16, 16, 16), (8, 8, 8)]
+        >>> level = pyramid.finest_level(1000)
+        >>> level.spacing
+        (0.125, 0.125, 0.125)
+        >>> level.plot(volume=True)
+
+        """
+        if reduction not in _PYRAMID_REDUCTIONS:
+            raise ValueError(
+                f'`reduction` must be one of {_PYRAMID_REDUCTIONS}, not "{reduction}".'
+            )
+        if int(factor) != factor or factor < 2:
+            raise ValueError('`factor` must be an integer greater than 1.')
+        if levels is not None and levels < 1:
+            raise ValueError('`levels` must be a positive integer.')
+
+        pyramid = pyvista.ImagePyramid()
+        level = self.copy(deep=False)
+        pyramid.append(level, 'Level 0')
+        while levels is None or pyramid.n_blocks < levels:
+            factors = [factor if size >= factor else 1 for size in level.dimensions]
+            if factors == [1, 1, 1]:
+                break
+            level = _reduce_grid(level, factors, reduction)
+            pyramid.append(level, f'Level {pyramid.n_blocks}')
+
+        if filename is not None:
+            pyramid.save(filename)
+        return pyramid
+
+    def _run_image_alg(
+        self, make_alg, field, scalars, halo, tile_size, workers, memmap, progress_bar, message
+    ):
+        """Run an imaging algorithm on the whole image or brick by brick (internal helper)."""
+        if tile_size is None and workers == 1 and memmap is None:
+            alg = make_alg()
+            alg.SetInputDataObject(self)
+            alg.SetInputArrayToProcess(
+                0, 0, 0, field.value, scalars
+            )  # args: (idx, port, connection, field, name)
+            _update_alg(alg, progress_bar, message)
+            return _get_output(alg)
+
+        if field.value != 0:
+            raise ValueError('Tiled processing only supports point data.')
+        if workers < 1:
+            raise ValueError('`workers` must be a positive integer.')
+        if tile_size is None:
+            tile_size = _TILE_SIZE
+        tile_size = np.broadcast_to(tile_size, 3).astype(int)
+        if np.any(tile_size < 1):
+            raise ValueError('`tile_size` must be a positive integer.')
+        return _process_tiles(
+            self, make_alg, scalars, halo, tile_size, workers, memmap, progress_bar, message
+        )
+
+    def fft(self, output_scalars_name=None, engine='vtk', workers=None, progress_bar=False):
         """Apply a fast Fourier transform (FFT) to the active scalars.
 
         The input can be real or complex data, but the output is always
@@ -443,6 +677,16 @@ class UniformGridFilters(DataSetFilters):
             The name of the output scalars. By default, this is the same as the
             active scalars of the dataset.
 
+        engine : str, default: 'vtk'
+            Library computing the transform. ``'vtk'`` always outputs
+            :attr:`numpy.complex128`. ``'numpy'`` uses :mod:`scipy.fft`
+            when SciPy is installed, falling back to :mod:`numpy.fft`,
+            and keeps single precision input as :attr:`numpy.complex64`.
+
+        workers : int, optional
+            Number of threads used by :mod:`scipy.fft` with
+            ``engine='numpy'``. ``-1`` uses all the available cores.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
@@ -476,6 +720,17 @@ class UniformGridFilters(DataSetFilters):
 
         See :ref:`image_fft_example` for a full example using this filter.
 
+        Compute the FFT of single precision scalars with NumPy or SciPy,
+        keeping the output in single precision.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(64, 64, 64))
+        >>> grid['data'] = np.random.default_rng(0).random(grid.n_points, dtype=np.float32)
+        >>> fft_grid = grid.fft(engine='numpy', workers=2)
+        >>> fft_grid['data'].dtype
+        dtype('complex64')
+
         """
         # check for active scalars, otherwise risk of segfault
         if self.point_data.active_scalars_name is None:
@@ -488,16 +743,19 @@ class UniformGridFilters(DataSetFilters):
             if self.point_data.active_scalars_name is None:
                 raise MissingDataError('FFT filter requires point scalars.')
 
-        alg = _vtk.vtkImageFFT()
-        alg.SetInputDataObject(self)
-        _update_alg(alg, progress_bar, 'Performing Fast Fourier Transform')
-        output = _get_output(alg)
+        if _check_fft_engine(engine) == 'numpy':
+            output = _numpy_fft(self, 'fftn', workers, output_scalars_name)
+        else:
+            alg = _vtk.vtkImageFFT()
+            alg.SetInputDataObject(self)
+            _update_alg(alg, progress_bar, 'Performing Fast Fourier Transform')
+            output = _get_output(alg)
         self._change_fft_output_scalars(
             output, self.point_data.active_scalars_name, output_scalars_name
         )
         return output
 
-    def rfft(self, output_scalars_name=None, progress_bar=False):
+    def rfft(self, output_scalars_name=None, engine='vtk', workers=None, progress_bar=False):
         """Apply a reverse fast Fourier transform (RFFT) to the active scalars.
 
         The input can be real or complex data, but the output is always
@@ -522,6 +780,16 @@ class UniformGridFilters(DataSetFilters):
             The name of the output scalars. By default, this is the same as the
             active scalars of the dataset.
 
+        engine : str, default: 'vtk'
+            Library computing the transform. ``'vtk'`` always outputs
+            :attr:`numpy.complex128`. ``'numpy'`` uses :mod:`scipy.fft`
+            when SciPy is installed, falling back to :mod:`numpy.fft`,
+            and keeps single precision input as :attr:`numpy.complex64`.
+
+        workers : int, optional
+            Number of threads used by :mod:`scipy.fft` with
+            ``engine='numpy'``. ``-1`` uses all the available cores.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
@@ -558,10 +826,13 @@ class UniformGridFilters(DataSetFilters):
 
         """
         self._check_fft_scalars()
-        alg = _vtk.vtkImageRFFT()
-        alg.SetInputDataObject(self)
-        _update_alg(alg, progress_bar, 'Performing Reverse Fast Fourier Transform.')
-        output = _get_output(alg)
+        if _check_fft_engine(engine) == 'numpy':
+            output = _numpy_fft(self, 'ifftn', workers, output_scalars_name)
+        else:
+            alg = _vtk.vtkImageRFFT()
+            alg.SetInputDataObject(self)
+            _update_alg(alg, progress_bar, 'Performing Reverse Fast Fourier Transform.')
+            output = _get_output(alg)
         self._change_fft_output_scalars(
             output, self.point_data.active_scalars_name, output_scalars_name
         )
@@ -574,6 +845,7 @@ class UniformGridFilters(DataSetFilters):
         z_cutoff,
         order=1,
         output_scalars_name=None,
+        engine='vtk',
         progress_bar=False,
     ):
         """Perform a Butterworth low pass filter in the frequency domain.
@@ -614,6 +886,12 @@ class UniformGridFilters(DataSetFilters):
             The name of the output scalars. By default, this is the same as the
             active scalars of the dataset.
 
+        engine : str, default: 'vtk'
+            Library applying the filter. ``'vtk'`` always outputs
+            :attr:`numpy.complex128`. ``'numpy'`` keeps
+            :attr:`numpy.complex64` input in single precision and reuses
+            the filter weights across grids of the same shape.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
@@ -634,12 +912,17 @@ class UniformGridFilters(DataSetFilters):
 
         """
         self._check_fft_scalars()
-        alg = _vtk.vtkImageButterworthLowPass()
-        alg.SetInputDataObject(self)
-        alg.SetCutOff(x_cutoff, y_cutoff, z_cutoff)
-        alg.SetOrder(order)
-        _update_alg(alg, progress_bar, 'Performing Low Pass Filter')
-        output = _get_output(alg)
+        if _check_fft_engine(engine) == 'numpy':
+            output = _numpy_butterworth(
+                self, (x_cutoff, y_cutoff, z_cutoff), order, False, output_scalars_name
+            )
+        else:
+            alg = _vtk.vtkImageButterworthLowPass()
+            alg.SetInputDataObject(self)
+            alg.SetCutOff(x_cutoff, y_cutoff, z_cutoff)
+            alg.SetOrder(order)
+            _update_alg(alg, progress_bar, 'Performing Low Pass Filter')
+            output = _get_output(alg)
         self._change_fft_output_scalars(
             output, self.point_data.active_scalars_name, output_scalars_name
         )
@@ -652,6 +935,7 @@ class UniformGridFilters(DataSetFilters):
         z_cutoff,
         order=1,
         output_scalars_name=None,
+        engine='vtk',
         progress_bar=False,
     ):
         """Perform a Butterworth high pass filter in the frequency domain.
@@ -692,6 +976,12 @@ class UniformGridFilters(DataSetFilters):
             The name of the output scalars. By default, this is the same as the
             active scalars of the dataset.
 
+        engine : str, default: 'vtk'
+            Library applying the filter. ``'vtk'`` always outputs
+            :attr:`numpy.complex128`. ``'numpy'`` keeps
+            :attr:`numpy.complex64` input in single precision and reuses
+            the filter weights across grids of the same shape.
+
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
@@ -712,12 +1002,17 @@ class UniformGridFilters(DataSetFilters):
 
         """
         self._check_fft_scalars()
-        alg = _vtk.vtkImageButterworthHighPass()
-        alg.SetInputDataObject(self)
-        alg.SetCutOff(x_cutoff, y_cutoff, z_cutoff)
-        alg.SetOrder(order)
-        _update_alg(alg, progress_bar, 'Performing High Pass Filter')
-        output = _get_output(alg)
+        if _check_fft_engine(engine) == 'numpy':
+            output = _numpy_butterworth(
+                self, (x_cutoff, y_cutoff, z_cutoff), order, True, output_scalars_name
+            )
+        else:
+            alg = _vtk.vtkImageButterworthHighPass()
+            alg.SetInputDataObject(self)
+            alg.SetCutOff(x_cutoff, y_cutoff, z_cutoff)
+            alg.SetOrder(order)
+            _update_alg(alg, progress_bar, 'Performing High Pass Filter')
+            output = _get_output(alg)
         self._change_fft_output_scalars(
             output, self.point_data.active_scalars_name, output_scalars_name
         )
@@ -758,3 +1053,213 @@ class UniformGridFilters(DataSetFilters):
                 'as an array with a datatype of `numpy.complex64` or '
                 '`numpy.complex128`.'
             )
+
+
+def _process_tiles(
+    grid, make_alg, scalars, halo, tile_size, workers, memmap, progress_bar, message
+):
+    """Run an imaging algorithm over padded bricks of a grid (internal helper)."""
+    dims = np.array(grid.dimensions)
+    halo = np.broadcast_to(halo, 3).astype(int)
+    spacing = np.array(grid.spacing)
+    origin = np.array(grid.origin) + np.array(grid.extent[::2]) * spacing
+    values = grid.point_data[scalars]
+    n_components = values.shape[1:]
+    # view the point data with (z, y, x) indexing
+    volume = values.reshape(*dims[::-1], *n_components)
+
+    # bricks ordered along z, then y, then x to follow the point ordering
+    starts = [range(0, dim, size) for dim, size in zip(dims, tile_size)]
+    tiles = [np.array(start[::-1]) for start in itertools.product(*starts[::-1])]
+    if not tiles:
+        return grid.copy()
+    output = []
+
+    def process(start):
+        stop = np.minimum(start + tile_size, dims)
+        lower = np.maximum(start - halo, 0)
+        upper = np.minimum(stop + halo, dims)
+        brick = pyvista.UniformGrid(
+            dimensions=upper - lower, spacing=spacing, origin=origin + lower * spacing
+        )
+        padded = tuple(slice(lo, hi) for lo, hi in zip(lower[::-1], upper[::-1]))
+        brick.point_data.set_array(
+            np.ascontiguousarray(volume[padded]).reshape(-1, *n_components), scalars
+        )
+        brick.point_data.active_scalars_name = scalars
+        alg = make_alg()
+        alg.SetInputDataObject(brick)
+        alg.SetInputArrayToProcess(
+            0, 0, 0, 0, scalars
+        )  # args: (idx, port, connection, field, name)
+        alg.Update()
+        result = pyvista.wrap(alg.GetOutputDataObject(0)).point_data[scalars]
+        result = result.reshape(*(upper - lower)[::-1], *n_components)
+        if not output:
+            # allocate once the output type of the algorithm is known
+            shape = (*dims[::-1], *result.shape[3:])
+            if memmap is None:
+                output.append(np.empty(shape, dtype=result.dtype))
+            else:
+                output.append(
+                    np.lib.format.open_memmap(memmap, mode='w+', dtype=result.dtype, shape=shape)
+                )
+        core = tuple(slice(lo, hi) for lo, hi in zip((start - lower)[::-1], (stop - lower)[::-1]))
+        target = tuple(slice(lo, hi) for lo, hi in zip(start[::-1], stop[::-1]))
+        output[0][target] = result[core]
+
+    if progress_bar:
+        try:
+            from tqdm import tqdm
+        except ImportError:  # pragma: no cover
+            raise ImportError("Please install `tqdm` to monitor algorithms.")
+        tiles = tqdm(tiles, desc=message)
+
+    tiles = iter(tiles)
+    process(next(tiles))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(process, tiles))
+    else:
+        for start in tiles:
+            process(start)
+
+    result = grid.copy(deep=False)
+    result.point_data[scalars] = output[0].reshape(grid.n_points, *output[0].shape[3:])
+    result.point_data.active_scalars_name = scalars
+    return result
+
+
+def _check_fft_engine(engine):
+    """Validate the engine of the FFT filters (internal helper)."""
+    if engine not in ('vtk', 'numpy'):
+        raise ValueError(f'`engine` must be either "vtk" or "numpy", not "{engine}".')
+    return engine
+
+
+def _fft_scalars(grid):
+    """Return the active point scalars as a real or complex volume (internal helper)."""
+    values = grid.point_data.active_scalars
+    if values.ndim == 2:
+        # like VTK, use the first two components as the real and imaginary parts
+        if values.shape[1] > 1:
+            dtype = np.complex64 if values.dtype == np.float32 else np.complex128
+            complex_values = np.empty(values.shape[0], dtype=dtype)
+            complex_values.real = values[:, 0]
+            complex_values.imag = values[:, 1]
+            values = complex_values
+        else:
+            values = values[:, 0]
+    if not np.issubdtype(values.dtype, np.inexact):
+        values = values.astype(np.float64)
+    return values.reshape(grid.dimensions[::-1])
+
+
+def _fft_output(grid, values, name):
+    """Build the output of the NumPy FFT filters (internal helper)."""
+    output = pyvista.UniformGrid()
+    output.copy_structure(grid)
+    output.copy_meta_from(grid, deep=True)
+    output.field_data.update(grid.field_data)
+    if name is None:
+        name = grid.point_data.active_scalars_name
+    output.point_data.set_array(values.reshape(-1), name)
+    output.point_data.active_scalars_name = name
+    return output
+
+
+def _numpy_fft(grid, transform, workers, name):
+    """Transform the active scalars with scipy.fft or numpy.fft (internal helper)."""
+    values = _fft_scalars(grid)
+    single = values.dtype in (np.float32, np.complex64)
+    try:
+        import scipy.fft
+    except ImportError:  # pragma: no cover
+        result = getattr(np.fft, transform)(values)
+    else:
+        # pocketfft caches the plans of recently used shapes
+        result = getattr(scipy.fft, transform)(values, workers=workers)
+    result = result.astype(np.complex64 if single else np.complex128, copy=False)
+    return _fft_output(grid, result, name)
+
+
+def _butterworth_weights(dimensions, spacing, cutoff, order, high, dtype):
+    """Return the Butterworth filter weights of a grid (internal helper).
+
+    The weights match ``vtkImageButterworthLowPass`` and
+    ``vtkImageButterworthHighPass``. They are as large as the grid, so
+    they are built for each call rather than cached.
+    """
+    with np.errstate(over='ignore', invalid='ignore'):
+        weights = np.zeros(dimensions[::-1], dtype=dtype)
+        for axis, (size, step, frequency) in enumerate(zip(dimensions, spacing, cutoff)):
+            index = np.arange(size)
+            distance = np.minimum(index, size - index).astype(float)
+            if frequency:
+                ratio = distance / (size * step * frequency)
+            else:
+                # a zero cutoff only passes the zero frequency
+                ratio = np.where(distance > 0, np.inf, 0.0)
+            shape = [1, 1, 1]
+            shape[2 - axis] = size
+            weights += (ratio**2).astype(dtype).reshape(shape)
+        # low pass: 1 / (1 + ratio**(2*order)), high pass: 1 - low pass
+        np.power(weights, order, out=weights)
+        weights += 1
+        np.reciprocal(weights, out=weights)
+        if high:
+            np.subtract(1, weights, out=weights)
+    return weights
+
+
+def _numpy_butterworth(grid, cutoff, order, high, name):
+    """Apply a Butterworth filter to complex active scalars (internal helper)."""
+    values = _fft_scalars(grid)
+    real_dtype = np.float32 if values.dtype == np.complex64 else np.float64
+    weights = _butterworth_weights(grid.dimensions, grid.spacing, cutoff, order, high, real_dtype)
+    return _fft_output(grid, values * weights, name)
+
+
+def _reduce_array(volume, factors, reduction):
+    """Reduce a ``(nz, ny, nx, n_components)`` volume over blocks of points (internal helper)."""
+    fx, fy, fz = factors
+    nz, ny, nx = (size // factor for size, factor in zip(volume.shape[:3], factors[::-1]))
+    if reduction == 'nearest':
+        return volume[: nz * fz : fz, : ny * fy : fy, : nx * fx : fx]
+
+    blocks = volume[: nz * fz, : ny * fy, : nx * fx].reshape(
+        nz, fz, ny, fy, nx, fx, volume.shape[3]
+    )
+    if reduction == 'max':
+        return blocks.max(axis=(1, 3, 5))
+    if np.issubdtype(volume.dtype, np.inexact):
+        return blocks.mean(axis=(1, 3, 5), dtype=volume.dtype)
+    # keep integer and boolean arrays in their own type
+    mean = blocks.mean(axis=(1, 3, 5))
+    return np.round(mean, out=mean).astype(volume.dtype)
+
+
+def _reduce_grid(grid, factors, reduction):
+    """Return a grid reduced over blocks of ``factors`` points (internal helper)."""
+    factors = np.asarray(factors)
+    dims = np.array(grid.dimensions)
+    spacing = np.array(grid.spacing)
+    origin = np.array(grid.origin) + np.array(grid.extent[::2]) * spacing
+    if reduction != 'nearest':
+        # points of a reduced grid sit at the center of their blocks
+        origin = origin + (factors - 1) / 2 * spacing
+    output = pyvista.UniformGrid(
+        dimensions=dims // factors, spacing=spacing * factors, origin=origin
+    )
+
+    for name in grid.point_data.keys():
+        array = grid.point_data[name]
+        if not (np.issubdtype(array.dtype, np.number) or array.dtype == np.bool_):
+            continue
+        volume = array.reshape(*dims[::-1], -1)
+        reduced = _reduce_array(volume, factors, reduction)
+        output.point_data[name] = reduced.reshape(output.n_points, *array.shape[1:])
+    active = grid.point_data.active_scalars_name
+    if active in output.point_data:
+        output.point_data.active_scalars_name = active
+    return output
@@ -10,13 +10,21 @@ import pyvista
 from pyvista import _vtk
 from pyvista.core.dataset import DataSet
 from pyvista.core.filters import RectilinearGridFilters, UniformGridFilters, _get_output
+from pyvista.core.implicit_points import ImplicitPoints
+from pyvista.core.structured import (
+    _cell_index,
+    _cells_in_range,
+    _nearest_index,
+    _StructuredIndexing,
+)
 from pyvista.utilities import abstract_class, assert_empty_kwargs
+from pyvista.utilities.arrays import _coerce_pointslike_arg
 import pyvista.utilities.helpers as helpers
 from pyvista.utilities.misc import PyVistaDeprecationWarning, raise_has_duplicates
 
 
 @abstract_class
-class Grid(DataSet):
+class Grid(DataSet, _StructuredIndexing):
     """A class full of common methods for non-pointset grids."""
 
     def __init__(self, *args, **kwargs):
@@ -54,6 +62,160 @@ class Grid(DataSet):
         self.SetDimensions(*dims)
         self.Modified()
 
+    @property
+    def implicit_points(self) -> ImplicitPoints:
+        """Return the points of the grid without building them.
+
+        The returned :class:`pyvista.ImplicitPoints` can be indexed
+        like the ``(n_points, 3)`` array of :attr:`Grid.points`, but
+        only computes the coordinates of the points that are indexed.
+        Use :func:`numpy.asarray` to build all the points.
+
+        Returns
+        -------
+        pyvista.ImplicitPoints
+            Lazy point coordinates of this grid.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(10, 10, 10), spacing=(0.5, 1, 2))
+        >>> grid.implicit_points[-1]
+        array([ 4.5,  9. , 18. ])
+
+        """
+        return ImplicitPoints(*self._point_axes())
+
+    @property
+    def _point_coordinates(self):
+        """Return the lazy point coordinates (internal helper)."""
+        return self.implicit_points
+
+    def _point_axes(self):  # pragma: no cover
+        """Return the point coordinates along each axis (internal helper)."""
+        raise NotImplementedError
+
+    def find_closest_point(self, point, n=1):
+        """Find index of closest point in this grid to the given point(s).
+
+        The closest point is computed from the coordinates along each
+        axis, without building a locator. See
+        :func:`DataSet.find_closest_point` for the general case.
+
+        Parameters
+        ----------
+        point : sequence[float] | numpy.ndarray
+            Coordinates of point to query (length 3) or a ``numpy`` array
+            of ``n`` points with shape ``(n, 3)``.
+
+        n : int, optional
+            If greater than ``1``, returns the indices of the ``n``
+            closest points to a single point using a locator.
+
+        Returns
+        -------
+        int or numpy.ndarray
+            Index or indices of the closest points of this grid.
+
+        See Also
+        --------
+        DataSet.find_closest_point
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(10, 10, 10), spacing=(0.1, 0.1, 0.1))
+        >>> grid.find_closest_point((0.51, 0.12, 0.0))
+        15
+        >>> grid.find_closest_point([[0.0, 0.0, 0.0], [10.0, 10.0, 10.0]])
+        array([  0, 999])
+
+        """
+        if n != 1:
+            return super().find_closest_point(point, n)
+        point, singular = _coerce_pointslike_arg(point, copy=False)
+        ijk = [_nearest_index(axis, point[:, i]) for i, axis in enumerate(self._point_axes())]
+        ind = np.ravel_multi_index(ijk, self.dimensions, order='F')
+        return int(ind[0]) if singular else ind
+
+    def find_containing_cell(self, point):
+        """Find index of the cells containing the given point(s).
+
+        The cells are computed from the coordinates along each axis,
+        without building a locator.
+
+        Parameters
+        ----------
+        point : sequence[float] | numpy.ndarray
+            Coordinates of point to query (length 3) or a ``numpy`` array
+            of ``n`` points with shape ``(n, 3)``.
+
+        Returns
+        -------
+        int or numpy.ndarray
+            Index or indices of the cells of this grid containing the
+            points, ``-1`` for the points outside of the grid.
+
+        See Also
+        --------
+        DataSet.find_containing_cell
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=[5, 5, 1], spacing=[1/4, 1/4, 0])
+        >>> grid.find_containing_cell([0.3, 0.3, 0.0])
+        5
+        >>> grid.find_containing_cell([[0.3, 0.3, 0.0], [0.3, 0.3, 1.0]])
+        array([ 5, -1])
+
+        """
+        point, singular = _coerce_pointslike_arg(point, copy=False)
+        ijk, inside = zip(
+            *(_cell_index(axis, point[:, i]) for i, axis in enumerate(self._point_axes()))
+        )
+        ind = np.ravel_multi_index(ijk, self._cell_dimensions(), order='F')
+        ind[~np.logical_and.reduce(inside)] = -1
+        return int(ind[0]) if singular else ind
+
+    def find_cells_within_bounds(self, bounds):
+        """Find the index of the cells of this grid within bounds.
+
+        The cells are computed from the coordinates along each axis,
+        without building a locator.
+
+        Parameters
+        ----------
+        bounds : sequence[float]
+            Bounding box. The form is: ``[xmin, xmax, ymin, ymax, zmin, zmax]``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted indices of the cells overlapping the bounds.
+
+        See Also
+        --------
+        DataSet.find_cells_within_bounds
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(5, 5, 5))
+        >>> grid.find_cells_within_bounds([1.1, 1.9, 1.1, 2.5, 0.0, 0.5])
+        array([5, 9])
+
+        """
+        if np.array(bounds).size != 6:
+            raise TypeError("Bounds must be a length three tuple of floats.")
+        bounds = np.asarray(bounds, dtype=float).ravel()
+        i, j, k = (
+            _cells_in_range(axis, bounds[2 * n], bounds[2 * n + 1])
+            for n, axis in enumerate(self._point_axes())
+        )
+        nx, ny, _ = self._cell_dimensions()
+        return ((k[:, np.newaxis, np.newaxis] * ny + j[:, np.newaxis]) * nx + i).ravel()
+
     def _get_attrs(self):
         """Return the representation methods (internal helper)."""
         attrs = DataSet._get_attrs(self)
@@ -215,6 +377,10 @@ class RectilinearGrid(_vtk.vtkRectilinearGrid, Grid, RectilinearGridFilters):
         # Ensure dimensions are properly set
         self._update_dimensions()
 
+    def _point_axes(self):
+        """Return the point coordinates along each axis (internal helper)."""
+        return self.x, self.y, self.z
+
     @property
     def meshgrid(self) -> list:
         """Return a meshgrid of numpy arrays for this mesh.
@@ -255,8 +421,7 @@ class RectilinearGrid(_vtk.vtkRectilinearGrid, Grid, RectilinearGridFilters):
                [  0.,   0.,   0.]])
 
         """
-        xx, yy, zz = self.meshgrid
-        return np.c_[xx.ravel(order='F'), yy.ravel(order='F'), zz.ravel(order='F')]
+        return np.asarray(self.implicit_points)
 
     @points.setter
     def points(self, points):
@@ -588,6 +753,16 @@ class UniformGrid(_vtk.vtkImageData, Grid, UniformGridFilters):
         self.SetOrigin(xo, yo, zo)
         self.spacing = (spacing[0], spacing[1], spacing[2])
 
+    def _point_axes(self):
+        """Return the point coordinates along each axis (internal helper)."""
+        extent = self.extent
+        return tuple(
+            origin + np.arange(start, stop + 1) * spacing
+            for origin, start, stop, spacing in zip(
+                self.origin, extent[::2], extent[1::2], self.spacing
+            )
+        )
+
     @property  # type: ignore
     def points(self) -> np.ndarray:  # type: ignore
         """Build a copy of the implicitly defined points as a numpy array.
@@ -611,20 +786,7 @@ class UniformGrid(_vtk.vtkImageData, Grid, UniformGridFilters):
                [1., 1., 1.]])
 
         """
-        # Get grid dimensions
-        nx, ny, nz = self.dimensions
-        nx -= 1
-        ny -= 1
-        nz -= 1
-        # get the points and convert to spacings
-        dx, dy, dz = self.spacing
-        # Now make the cell arrays
-        ox, oy, oz = np.array(self.origin) + np.array(self.extent[::2])  # type: ignore
-        x = np.insert(np.cumsum(np.full(nx, dx)), 0, 0.0) + ox
-        y = np.insert(np.cumsum(np.full(ny, dy)), 0, 0.0) + oy
-        z = np.insert(np.cumsum(np.full(nz, dz)), 0, 0.0) + oz
-        xx, yy, zz = np.meshgrid(x, y, z, indexing='ij')
-        return np.c_[xx.ravel(order='F'), yy.ravel(order='F'), zz.ravel(order='F')]
+        return np.asarray(self.implicit_points)
 
     @points.setter
     def points(self, points):
@@ -652,7 +814,7 @@ class UniformGrid(_vtk.vtkImageData, Grid, UniformGridFilters):
         array([0., 1., 0., 1., 0., 1., 0., 1.])
 
         """
-        return self.points[:, 0]
+        return self.implicit_points[:, 0]
 
     @property
     def y(self) -> np.ndarray:
@@ -666,7 +828,7 @@ class UniformGrid(_vtk.vtkImageData, Grid, UniformGridFilters):
         array([0., 0., 1., 1., 0., 0., 1., 1.])
 
         """
-        return self.points[:, 1]
+        return self.implicit_points[:, 1]
 
     @property
     def z(self) -> np.ndarray:
@@ -680,7 +842,7 @@ class UniformGrid(_vtk.vtkImageData, Grid, UniformGridFilters):
         array([0., 0., 0., 0., 1., 1., 1., 1.])
 
         """
-        return self.points[:, 2]
+        return self.implicit_points[:, 2]
 
     @property
     def origin(self) -> Tuple[float]:
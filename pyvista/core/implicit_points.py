@@ -0,0 +1,253 @@
+"""Contains ImplicitPoints, a lazy view of the points of a grid."""
+from typing import Iterator, Sequence
+
+import numpy as np
+
+_CHUNK_SIZE = 1 << 20
+
+
+class ImplicitPoints:
+    """Lazy point coordinates of a grid defined by its axis coordinates.
+
+    The points of a :class:`pyvista.UniformGrid` and a
+    :class:`pyvista.RectilinearGrid` are fully described by the
+    coordinates along each axis. This object exposes those points with
+    the indexing semantics of an ``(n_points, 3)`` array without
+    allocating it: only the points that are indexed are computed.
+
+    Use :func:`numpy.asarray` to explicitly build the full array and
+    :func:`ImplicitPoints.iter_chunks` to stream over all the points.
+
+    Parameters
+    ----------
+    x : sequence[float]
+        Coordinates along the X-direction.
+
+    y : sequence[float]
+        Coordinates along the Y-direction.
+
+    z : sequence[float]
+        Coordinates along the Z-direction.
+
+    Examples
+    --------
+    Index the points of a large uniform grid without building them.
+
+    >>> import pyvista
+    >>> grid = pyvista.UniformGrid(dimensions=(1000, 1000, 1000))
+    >>> points = grid.implicit_points
+    >>> points.shape
+    (1000000000, 3)
+    >>> points[[0, 1001, 999_999_999]]
+    array([[  0.,   0.,   0.],
+           [  1.,   1.,   0.],
+           [999., 999., 999.]])
+
+    Compute the points explicitly for a small grid.
+
+    >>> import numpy as np
+    >>> grid = pyvista.UniformGrid(dimensions=(2, 2, 1))
+    >>> np.asarray(grid.implicit_points)
+    array([[0., 0., 0.],
+           [1., 0., 0.],
+           [0., 1., 0.],
+           [1., 1., 0.]])
+
+    """
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], z: Sequence[float]):
+        """Initialize from the axis coordinates."""
+        self._axes = tuple(np.asarray(coords).ravel() for coords in (x, y, z))
+        self._dtype = np.result_type(*self._axes)
+
+    @property
+    def axes(self) -> tuple:
+        """Return the coordinates along each axis.
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            X, Y and Z coordinates.
+
+        """
+        return self._axes
+
+    @property
+    def dimensions(self) -> tuple:
+        """Return the number of points along each axis.
+
+        Returns
+        -------
+        tuple[int]
+            Number of points along X, Y and Z.
+
+        """
+        return tuple(coords.size for coords in self._axes)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the data type of the coordinates.
+
+        Returns
+        -------
+        numpy.dtype
+            Data type of the coordinates.
+
+        """
+        return self._dtype
+
+    @property
+    def shape(self) -> tuple:
+        """Return the shape of the points as if they were an array.
+
+        Returns
+        -------
+        tuple[int]
+            ``(n_points, 3)``.
+
+        """
+        return (len(self), 3)
+
+    @property
+    def ndim(self) -> int:
+        """Return the number of dimensions of the points array."""
+        return 2
+
+    @property
+    def size(self) -> int:
+        """Return the number of coordinate values."""
+        return 3 * len(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes the explicit array would use."""
+        return self.size * self._dtype.itemsize
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        nx, ny, nz = self.dimensions
+        return nx * ny * nz
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f'{type(self).__name__}(shape={self.shape}, dtype={self._dtype})'
+
+    def __array__(self, dtype=None):
+        """Build the explicit ``(n_points, 3)`` array of points."""
+        return self._build(slice(None), dtype)
+
+    def _build(self, columns, dtype=None):
+        """Build the selected columns of all the points (internal helper)."""
+        dtype = self._dtype if dtype is None else np.dtype(dtype)
+        nx, ny, nz = self.dimensions
+        axes = np.arange(3)[columns]
+        points = np.empty((nz, ny, nx, axes.size), dtype=dtype)
+        for column, axis in enumerate(np.atleast_1d(axes)):
+            # broadcast each axis over the x-fastest point ordering
+            points[..., column] = self._axes[axis].reshape([-1] + [1] * axis)
+        if axes.ndim == 0:
+            return points.reshape(-1)
+        return points.reshape(-1, axes.size)
+
+    def __getitem__(self, key):
+        """Return the coordinates of the indexed points."""
+        columns = slice(None)
+        if isinstance(key, tuple):
+            if len(key) == 1:
+                key = key[0]
+            elif len(key) == 2:
+                key, columns = key
+            else:
+                raise IndexError('too many indices for points: points are 2-dimensional')
+
+        if isinstance(key, (int, np.integer)):
+            index = int(key)
+            if not -len(self) <= index < len(self):
+                raise IndexError(
+                    f'index {index} is out of bounds for points with {len(self)} points'
+                )
+            return self.take(index % len(self))[columns]
+        if isinstance(key, slice) and key.indices(len(self)) == (0, len(self), 1):
+            return self._build(columns)
+        if isinstance(key, slice):
+            ind = np.arange(*key.indices(len(self)), dtype=np.int64)
+        elif key is Ellipsis:
+            ind = np.arange(len(self), dtype=np.int64)
+        else:
+            ind = np.asarray(key)
+            if ind.dtype == np.bool_:
+                if ind.shape != (len(self),):
+                    raise IndexError(
+                        f'boolean index of shape {ind.shape} does not match '
+                        f'points with {len(self)} points'
+                    )
+                ind = np.nonzero(ind)[0]
+            elif not np.issubdtype(ind.dtype, np.integer):
+                raise IndexError('points may only be indexed with integers, slices or masks')
+            elif ind.size and (ind.min() < -len(self) or ind.max() >= len(self)):
+                raise IndexError(f'index out of bounds for points with {len(self)} points')
+            else:
+                ind = np.where(ind < 0, ind + len(self), ind)
+        return self.take(ind)[..., columns]
+
+    def take(self, ind) -> np.ndarray:
+        """Return the coordinates of points by their ids.
+
+        Parameters
+        ----------
+        ind : int | sequence[int]
+            Non-negative point ids.
+
+        Returns
+        -------
+        numpy.ndarray
+            Coordinates of the points with shape ``ind.shape + (3,)``.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(3, 3, 3), spacing=(2, 2, 2))
+        >>> grid.implicit_points.take([4, 26])
+        array([[2., 2., 0.],
+               [4., 4., 4.]])
+
+        """
+        ind = np.asarray(ind, dtype=np.int64)
+        nx, ny, _ = self.dimensions
+        x, y, z = self._axes
+        out = np.empty(ind.shape + (3,), dtype=self._dtype)
+        layer, i = np.divmod(ind, nx)
+        k, j = np.divmod(layer, ny)
+        out[..., 0] = x[i]
+        out[..., 1] = y[j]
+        out[..., 2] = z[k]
+        return out
+
+    def iter_chunks(self, chunk_size: int = _CHUNK_SIZE) -> Iterator[np.ndarray]:
+        """Iterate over the points in consecutive chunks.
+
+        Parameters
+        ----------
+        chunk_size : int, default: 1048576
+            Maximum number of points in each chunk.
+
+        Yields
+        ------
+        numpy.ndarray
+            Coordinates of the next ``chunk_size`` points.
+
+        Examples
+        --------
+        Compute the centroid of a grid with a bounded amount of memory.
+
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(200, 200, 200))
+        >>> total = sum(chunk.sum(axis=0) for chunk in grid.implicit_points.iter_chunks())
+        >>> total / grid.n_points
+        array([99.5, 99.5, 99.5])
+
+        """
+        if chunk_size < 1:
+            raise ValueError('`chunk_size` must be a positive integer.')
+        for start in range(0, len(self), chunk_size):
+            yield self.take(np.arange(start, min(start + chunk_size, len(self))))
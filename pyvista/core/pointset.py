@@ -13,14 +13,16 @@ import numpy as np
 import pyvista
 from pyvista import _vtk
 from pyvista.utilities import abstract_class
+from pyvista.utilities.bvh import TriangleBVH
 from pyvista.utilities.cells import CellArray, create_mixed_cells, get_mixed_cells
 
 from .._typing import BoundsLike
 from ..utilities.fileio import get_ext
 from .celltype import CellType
 from .dataset import DataSet
-from .errors import DeprecationError, VTKVersionError
+from .errors import DeprecationError, NotAllTrianglesError, VTKVersionError
 from .filters import PolyDataFilters, StructuredGridFilters, UnstructuredGridFilters, _get_output
+from .structured import _StructuredIndexing
 
 DEFAULT_INPLACE_WARNING = (
     'You did not specify a value for `inplace` and the default value will '
@@ -193,9 +195,15 @@ class _PointSet(DataSet):
         [2.0, 1.0, 2.0]
 
         """
-        if inplace:
-            self.points += np.asarray(xyz)  # type: ignore
-            return self
+        # within a transform stack the translation is deferred by ``transform``
+        if inplace and self._pending_transform is None:
+            points = self.points
+            if np.issubdtype(points.dtype, np.floating):
+                # add in the precision of the points, directly in the VTK array
+                points += np.asarray(xyz, dtype=points.dtype)  # type: ignore
+                self.GetPoints().Modified()
+                self.Modified()
+                return self
         return super().translate(
             xyz, transform_all_input_vectors=transform_all_input_vectors, inplace=inplace
         )
@@ -324,6 +332,26 @@ class PointSet(_vtk.vtkPointSet, _PointSet):
         kwargs.setdefault('style', 'points')
         return pdata.plot(*args, **kwargs)
 
+    @wraps(PolyDataFilters.voxel_down_sample)
+    def voxel_down_sample(self, *args, **kwargs):
+        """Wrap ``PolyDataFilters.voxel_down_sample``."""
+        return PolyDataFilters.voxel_down_sample(self, *args, **kwargs)
+
+    @wraps(PolyDataFilters.remove_radius_outliers)
+    def remove_radius_outliers(self, *args, **kwargs):
+        """Wrap ``PolyDataFilters.remove_radius_outliers``."""
+        return PolyDataFilters.remove_radius_outliers(self, *args, **kwargs)
+
+    @wraps(PolyDataFilters.remove_statistical_outliers)
+    def remove_statistical_outliers(self, *args, **kwargs):
+        """Wrap ``PolyDataFilters.remove_statistical_outliers``."""
+        return PolyDataFilters.remove_statistical_outliers(self, *args, **kwargs)
+
+    @wraps(PolyDataFilters.estimate_normals)
+    def estimate_normals(self, *args, **kwargs):
+        """Wrap ``PolyDataFilters.estimate_normals``."""
+        return PolyDataFilters.estimate_normals(self, *args, **kwargs)
+
 
 class PolyData(_vtk.vtkPolyData, _PointSet, PolyDataFilters):
     """Dataset consisting of surface geometry (e.g. vertices, lines, and polygons).
@@ -1106,6 +1134,42 @@ class PolyData(_vtk.vtkPolyData, _PointSet, PolyDataFilters):
 
         return self._obbTree
 
+    @property
+    def bvh(self):
+        """Return the triangle bounding volume hierarchy of the polydata.
+
+        The hierarchy is built on first access and cached on the mesh. It
+        is rebuilt automatically when the points or faces of the mesh are
+        modified. It is used by :func:`PolyDataFilters.batch_ray_trace`.
+
+        Returns
+        -------
+        pyvista.utilities.bvh.TriangleBVH
+            Bounding volume hierarchy over the faces of the mesh.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> sphere.bvh.n_triangles
+        1680
+
+        """
+        if not self.is_all_triangles:
+            raise NotAllTrianglesError('Input mesh must be all triangles to build a BVH.')
+
+        points = self.GetPoints()
+        key = (
+            points.GetMTime() if points is not None else 0,
+            self.GetPolys().GetMTime(),
+            self.n_points,
+            self.n_faces,
+        )
+        if getattr(self, '_bvh_key', None) != key:
+            self._bvh = TriangleBVH(self.points, self.faces.reshape(-1, 4)[:, 1:])
+            self._bvh_key = key
+        return self._bvh
+
     @property
     def n_open_edges(self) -> int:
         """Return the number of open edges on this mesh.
@@ -1740,7 +1804,7 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
         return grid
 
 
-class StructuredGrid(_vtk.vtkStructuredGrid, PointGrid, StructuredGridFilters):
+class StructuredGrid(_vtk.vtkStructuredGrid, PointGrid, StructuredGridFilters, _StructuredIndexing):
     """Dataset used for topologically regular arrays of data.
 
     Can be initialized in one of the following several ways:
@@ -0,0 +1,61 @@
+"""Multi-resolution pyramid of uniform grids."""
+from .composite import MultiBlock
+
+
+class ImagePyramid(MultiBlock):
+    """Multi-resolution levels of a :class:`pyvista.UniformGrid`.
+
+    The levels are stored as the blocks of a :class:`pyvista.MultiBlock`
+    ordered from the finest level (the input grid) to the coarsest.
+    Create one with :func:`UniformGridFilters.build_pyramid
+    <pyvista.UniformGridFilters.build_pyramid>` or wrap a pyramid loaded
+    from disk.
+
+    Parameters
+    ----------
+    *args : list
+        Arguments accepted by :class:`pyvista.MultiBlock`.
+
+    **kwargs : dict, optional
+        Keyword arguments accepted by :class:`pyvista.MultiBlock`.
+
+    Examples
+    --------
+    Build a pyramid and fetch the finest level with at most 10,000 points.
+
+    >>> import pyvista
+    >>> grid = pyvista.UniformGrid(dimensions=(64, 64, 64))
+    >>> pyramid = grid.build_pyramid()
+    >>> [level.dimensions for level in pyramid]
+    [(64, 64, 64), (32, 32, 32), (16, 16, 16), (8, 8, 8), (4, 4, 4), (2, 2, 2), (1, 1, 1)]
+    >>> pyramid.finest_level(10_000).dimensions
+    (16, 16, 16)
+
+    """
+
+    def finest_level(self, max_points):
+        """Return the finest level with at most ``max_points`` points.
+
+        Parameters
+        ----------
+        max_points : int
+            Maximum number of points (voxels) of the level.
+
+        Returns
+        -------
+        pyvista.UniformGrid
+            Finest level of the pyramid under the budget.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(100, 80, 60))
+        >>> pyramid = grid.build_pyramid()
+        >>> pyramid.finest_level(100_000).dimensions
+        (50, 40, 30)
+
+        """
+        for level in self:
+            if level is not None and level.n_points <= max_points:
+                return level
+        raise ValueError(f'No level of the pyramid has at most {max_points} points.')
@@ -0,0 +1,414 @@
+"""Contains Sampler, a reusable sampler of the arrays of a dataset."""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from pyvista.core.filters import _update_alg
+from pyvista.core.filters.data_set import _with_arrays
+
+_KERNELS = ('probe', 'gaussian', 'shepard', 'linear', 'voronoi')
+
+
+class Sampler:
+    """Sample the arrays of a fixed source dataset onto many targets.
+
+    The locator of the source is built once when the sampler is
+    created, then reused by every call to :func:`Sampler.sample` and
+    :func:`Sampler.sample_points`. This is much faster than calling
+    :func:`DataSetFilters.probe() <pyvista.DataSetFilters.probe>`,
+    :func:`DataSetFilters.sample() <pyvista.DataSetFilters.sample>` or
+    :func:`DataSetFilters.interpolate()
+    <pyvista.DataSetFilters.interpolate>` repeatedly when only the
+    target points change, for example when tracking particles.
+
+    Parameters
+    ----------
+    source : pyvista.DataSet
+        Dataset whose arrays are sampled.
+
+    kernel : str, default: 'probe'
+        Interpolation method. ``'probe'`` interpolates the point data
+        of the cell containing each target point and takes the cell
+        data of that cell, like :func:`DataSetFilters.probe()
+        <pyvista.DataSetFilters.probe>`. The other kernels interpolate
+        the point data of the source points near each target point, like
+        :func:`DataSetFilters.interpolate()
+        <pyvista.DataSetFilters.interpolate>`:
+
+        * ``'gaussian'``: Gaussian weights of the points within ``radius``.
+        * ``'shepard'``: inverse squared distance weights of the points
+          within ``radius``.
+        * ``'linear'``: average of the points within ``radius``.
+        * ``'voronoi'``: value of the closest point.
+
+    arrays : sequence[str], optional
+        Names of the source arrays to sample. Defaults to all the point
+        and cell arrays. Sampling fewer arrays is faster.
+
+    locator : vtk.vtkLocator, optional
+        Locator of the source. Either a cell or a point locator for
+        the ``'probe'`` kernel and a point locator for the other
+        kernels. Defaults to ``vtkStaticCellLocator`` and
+        ``vtkStaticPointLocator``. The ``'probe'`` kernel of a
+        :class:`pyvista.PolyData` source defaults to
+        ``vtkStaticPointLocator``, since cell locators miss the points
+        lying just off flat surfaces. Datasets without explicit points,
+        like :class:`pyvista.UniformGrid`, do not need a locator.
+
+    tolerance : float, optional
+        Tolerance of the ``'probe'`` kernel to decide whether a point is
+        inside a cell. Computed from the source by default.
+
+    categorical : bool, default: False
+        Treat the source data of the ``'probe'`` kernel as categorical
+        and use the value of the closest cell point instead of
+        interpolating.
+
+    radius : float, default: 1.0
+        Radius of the neighborhood of the ``'gaussian'``, ``'shepard'``
+        and ``'linear'`` kernels.
+
+    sharpness : float, default: 2.0
+        Sharpness of the ``'gaussian'`` kernel.
+
+    n_points : int, optional
+        Use the ``n_points`` closest points instead of the points within
+        ``radius`` for the ``'gaussian'``, ``'shepard'`` and ``'linear'``
+        kernels.
+
+    null_value : float, default: 0.0
+        Value of the target points without any source point within
+        ``radius`` for the ``'gaussian'``, ``'shepard'`` and ``'linear'``
+        kernels. The ``'probe'`` kernel sets the values of the points
+        outside of the source to zero.
+
+    Examples
+    --------
+    Sample a tetrahedral mesh at points moving between each step.
+
+    >>> import numpy as np
+    >>> import pyvista
+    >>> source = pyvista.UniformGrid(dimensions=(10, 10, 10)).triangulate()
+    >>> source['x'] = source.points[:, 0]
+    >>> sampler = pyvista.Sampler(source)
+    >>> points = np.array([[1.5, 2.0, 3.0], [20.0, 0.0, 0.0]])
+    >>> for _ in range(3):
+    ...     values = sampler.sample_points(points)
+    ...     points += 1
+    >>> values['x'], values['vtkValidPointMask']
+    (pyvista_ndarray([3.5, 0. ], dtype=float32), pyvista_ndarray([1, 0], dtype=int8))
+
+    Interpolate a point cloud onto a plane.
+
+    >>> cloud = pyvista.PolyData(np.random.random((1000, 3)))
+    >>> cloud['values'] = np.ones(cloud.n_points)
+    >>> sampler = pyvista.Sampler(cloud, kernel='gaussian', radius=0.2)
+    >>> plane = pyvista.Plane(center=(0.5, 0.5, 0.5))
+    >>> sampler.sample(plane)['values'].mean()
+    1.0
+
+    """
+
+    def __init__(
+        self,
+        source,
+        kernel='probe',
+        arrays=None,
+        locator=None,
+        tolerance=None,
+        categorical=False,
+        radius=1.0,
+        sharpness=2.0,
+        n_points=None,
+        null_value=0.0,
+    ):
+        """Initialize the sampler and build the locator of the source."""
+        if not pyvista.is_pyvista_dataset(source):
+            raise TypeError('`source` must be a PyVista mesh type.')
+        if kernel not in _KERNELS:
+            raise ValueError(f'kernel `{kernel}` not supported. Must be one of {_KERNELS}.')
+        if kernel != 'probe' and isinstance(source, (pyvista.UniformGrid, pyvista.RectilinearGrid)):
+            # point locators and interpolators require explicit points
+            source = source.cast_to_unstructured_grid()
+        if arrays is not None:
+            source = _with_arrays(source, arrays)
+
+        self._source = source
+        self._kernel = kernel
+        self._tolerance = tolerance
+        self._categorical = categorical
+        self._radius = radius
+        self._sharpness = sharpness
+        self._n_points = n_points
+        self._null_value = null_value
+
+        if locator is None:
+            if kernel != 'probe':
+                locator = _vtk.vtkStaticPointLocator()
+            elif isinstance(source, pyvista.PolyData):
+                locator = _vtk.vtkStaticPointLocator()
+            elif isinstance(source, _vtk.vtkPointSet):
+                locator = _vtk.vtkStaticCellLocator()
+        if locator is not None:
+            locator.SetDataSet(source)
+            locator.BuildLocator()
+        self._locator = locator
+
+    @property
+    def source(self):
+        """Return the dataset whose arrays are sampled.
+
+        Returns
+        -------
+        pyvista.DataSet
+            Source dataset, restricted to the sampled arrays.
+
+        """
+        return self._source
+
+    @property
+    def kernel(self) -> str:
+        """Return the interpolation method.
+
+        Returns
+        -------
+        str
+            Name of the kernel.
+
+        """
+        return self._kernel
+
+    def _new_kernel(self):
+        """Return a new point interpolation kernel (internal helper)."""
+        if self._kernel == 'voronoi':
+            return _vtk.vtkVoronoiKernel()
+        if self._kernel == 'gaussian':
+            kernel = _vtk.vtkGaussianKernel()
+            kernel.SetSharpness(self._sharpness)
+        elif self._kernel == 'shepard':
+            kernel = _vtk.vtkShepardKernel()
+        else:
+            kernel = _vtk.vtkLinearKernel()
+        kernel.SetRadius(self._radius)
+        if self._n_points:
+            kernel.SetNumberOfPoints(self._n_points)
+            kernel.SetKernelFootprintToNClosest()
+        else:
+            kernel.SetKernelFootprintToRadius()
+        return kernel
+
+    def _new_algorithm(self):
+        """Return a new algorithm sampling the source (internal helper).
+
+        Each call gets its own algorithm so that several threads can
+        sample concurrently while sharing the locator.
+
+        """
+        if self._kernel == 'probe':
+            alg = _vtk.vtkProbeFilter()
+            alg.SetCategoricalData(self._categorical)
+            if self._tolerance is not None:
+                alg.SetComputeTolerance(False)
+                alg.SetTolerance(self._tolerance)
+            if self._locator is not None:
+                if self._locator.IsA('vtkAbstractPointLocator'):
+                    strategy = _vtk.vtkClosestPointStrategy()
+                    strategy.SetPointLocator(self._locator)
+                else:
+                    strategy = _vtk.vtkCellLocatorStrategy()
+                    strategy.SetCellLocator(self._locator)
+                alg.SetFindCellStrategy(strategy)
+        else:
+            alg = _vtk.vtkPointInterpolator()
+            alg.SetKernel(self._new_kernel())
+            alg.SetLocator(self._locator)
+            alg.SetNullPointsStrategyToMaskPoints()
+            alg.SetNullValue(self._null_value)
+        alg.SetSourceData(self._source)
+        return alg
+
+    def _sample_chunk(self, points, progress_bar=False):
+        """Return the arrays sampled at some points (internal helper)."""
+        target = _vtk.vtkPolyData()
+        target.SetPoints(pyvista.vtk_points(points, deep=False))
+        alg = self._new_algorithm()
+        alg.SetInputData(target)
+        _update_alg(alg, progress_bar, 'Sampling')
+        output = pyvista.wrap(alg.GetOutput())
+        return {name: output.point_data[name] for name in output.point_data.keys()}
+
+    def sample_points(self, points, n_threads=1, progress_bar=False):
+        """Sample the source at points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Target points as a ``(n, 3)`` array.
+
+        n_threads : int, default: 1
+            Number of threads sampling equal parts of the points. Each
+            thread runs its own filter and they all share the locator of
+            the source.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress. Only used with
+            a single thread.
+
+        Returns
+        -------
+        dict[str, pyvista_ndarray]
+            Sampled arrays by name, including the
+            ``'vtkValidPointMask'`` array flagging the points that
+            received source data.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> source = pyvista.UniformGrid(dimensions=(5, 5, 5))
+        >>> source['z'] = source.points[:, 2]
+        >>> sampler = pyvista.Sampler(source)
+        >>> sampler.sample_points([[1, 1, 1.25], [2, 2, 3.5]], n_threads=2)['z']
+        pyvista_ndarray([1.25, 3.5 ])
+
+        """
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError(f'`points` must be a (n, 3) array, not {points.shape}.')
+        if not np.issubdtype(points.dtype, np.floating):
+            points = points.astype(float)
+        points = np.ascontiguousarray(points)
+        if n_threads < 1:
+            raise ValueError('`n_threads` must be a positive integer.')
+        if n_threads == 1 or len(points) < n_threads:
+            return self._sample_chunk(points, progress_bar)
+
+        with ThreadPoolExecutor(n_threads) as pool:
+            results = list(pool.map(self._sample_chunk, np.array_split(points, n_threads)))
+        return {
+            name: pyvista.pyvista_ndarray(np.concatenate([result[name] for result in results]))
+            for name in results[0]
+        }
+
+    def sample(self, target, n_threads=1, progress_bar=False):
+        """Sample the source at the points of a dataset.
+
+        Parameters
+        ----------
+        target : pyvista.DataSet
+            Dataset whose points are sampled.
+
+        n_threads : int, default: 1
+            Number of threads sampling equal parts of the points. See
+            :func:`Sampler.sample_points`.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress. Only used with
+            a single thread.
+
+        Returns
+        -------
+        pyvista.DataSet
+            Shallow copy of ``target`` with the sampled arrays added to
+            its point data.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> source = pyvista.UniformGrid(dimensions=(5, 5, 5))
+        >>> source['z'] = source.points[:, 2]
+        >>> sampler = pyvista.Sampler(source)
+        >>> line = pyvista.Line((1, 1, 0), (1, 1, 4), resolution=4)
+        >>> sampler.sample(line)['z']
+        pyvista_ndarray([0., 1., 2., 3., 4.])
+
+        """
+        if not pyvista.is_pyvista_dataset(target):
+            raise TypeError('`target` must be a PyVista mesh type.')
+        arrays = self.sample_points(target.points, n_threads=n_threads, progress_bar=progress_bar)
+        output = target.copy(deep=False)
+        for name, array in arrays.items():
+            output.point_data[name] = array
+        active_name = self._source.point_data.active_scalars_name
+        if active_name in arrays:
+            output.point_data.active_scalars_name = active_name
+        return output
+
+    def sample_over_lines(self, starts, ends, resolution, n_threads=1, progress_bar=False):
+        """Sample the source along many straight lines at once.
+
+        The points of all the lines are sampled together in a single
+        call to :func:`Sampler.sample_points`.
+
+        Parameters
+        ----------
+        starts : numpy.ndarray
+            Start points of the lines as a ``(n_lines, 3)`` array.
+
+        ends : numpy.ndarray
+            End points of the lines as a ``(n_lines, 3)`` array.
+
+        resolution : int
+            Number of pieces to divide each line into. Each line is
+            sampled at ``resolution + 1`` evenly spaced points.
+
+        n_threads : int, default: 1
+            Number of threads sampling equal parts of the points. See
+            :func:`Sampler.sample_points`.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress. Only used with
+            a single thread.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            Sampled arrays by name, including ``'vtkValidPointMask'``.
+            Each array has the shape ``(n_lines, resolution + 1)``
+            followed by the shape of the components of the source array.
+
+        numpy.ndarray
+            ``(n_lines, resolution + 1)`` array of the distance of each
+            sample from the start of its line.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> source = pyvista.UniformGrid(dimensions=(5, 5, 5))
+        >>> source['z'] = source.points[:, 2]
+        >>> sampler = pyvista.Sampler(source)
+        >>> arrays, distance = sampler.sample_over_lines(
+        ...     [[1, 1, 0], [2, 2, 0]], [[1, 1, 4], [2, 2, 2]], resolution=4
+        ... )
+        >>> arrays['z']
+        array([[0. , 1. , 2. , 3. , 4. ],
+               [0. , 0.5, 1. , 1.5, 2. ]])
+        >>> distance[1]
+        array([0. , 0.5, 1. , 1.5, 2. ])
+
+        """
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        if starts.ndim != 2 or starts.shape[1] != 3:
+            raise ValueError(f'`starts` must be a (n, 3) array, not {starts.shape}.')
+        if ends.shape != starts.shape:
+            raise ValueError(
+                f'`ends` must have the same shape as `starts` {starts.shape}, not {ends.shape}.'
+            )
+        if not isinstance(resolution, (int, np.integer)) or resolution < 1:
+            raise ValueError('`resolution` must be a positive integer.')
+
+        fractions = np.linspace(0.0, 1.0, resolution + 1)
+        directions = ends - starts
+        points = starts[:, np.newaxis] + fractions[:, np.newaxis] * directions[:, np.newaxis]
+        arrays = self.sample_points(
+            points.reshape(-1, 3), n_threads=n_threads, progress_bar=progress_bar
+        )
+        shape = points.shape[:2]
+        arrays = {
+            name: np.asarray(array).reshape(*shape, *array.shape[1:])
+            for name, array in arrays.items()
+        }
+        distance = np.linalg.norm(directions, axis=1)[:, np.newaxis] * fractions
+        return arrays, distance
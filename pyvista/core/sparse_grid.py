@@ -0,0 +1,646 @@
+"""Contains SparseVoxelGrid, a block-sparse uniform grid."""
+import numpy as np
+
+import pyvista
+
+# offsets of the points of a VTK_VOXEL cell, X-fastest
+_VOXEL_OFFSETS = np.array(
+    [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1]]
+)
+
+
+class SparseVoxelGrid:
+    """Uniform grid storing its point data only in active blocks.
+
+    The points of the grid are partitioned into cubic blocks of
+    ``block_size`` points per axis. Only the active blocks store point
+    data, every other point has the ``background`` value. This makes
+    mostly empty volumes, like occupancy masks or narrow band level sets,
+    much cheaper to store than a :class:`pyvista.UniformGrid`.
+
+    Cell data is not supported.
+
+    Parameters
+    ----------
+    dimensions : sequence[int]
+        Number of points along each axis.
+
+    spacing : sequence[float], default: (1.0, 1.0, 1.0)
+        Spacing between the points along each axis.
+
+    origin : sequence[float], default: (0.0, 0.0, 0.0)
+        Coordinates of the first point.
+
+    block_size : int, default: 8
+        Number of points of each block along each axis.
+
+    background : float, default: 0.0
+        Value of the points outside of the active blocks.
+
+    Examples
+    --------
+    Store a sphere occupancy mask of a large grid sparsely.
+
+    >>> import numpy as np
+    >>> import pyvista
+    >>> grid = pyvista.UniformGrid(dimensions=(128, 128, 128))
+    >>> points = grid.implicit_points
+    >>> distance = np.linalg.norm(np.asarray(points) - 64, axis=1)
+    >>> grid['occupancy'] = (np.abs(distance - 40) < 2).astype(np.uint8)
+    >>> sparse = pyvista.SparseVoxelGrid.from_uniform_grid(grid, block_size=8)
+    >>> sparse.n_blocks, sparse.n_blocks / 16**3
+    (600, 0.146484375)
+
+    Look up values by point index and recover the dense grid.
+
+    >>> sparse.values_at_index([[64, 64, 24], [64, 64, 64]])
+    pyvista_ndarray([1, 0], dtype=uint8)
+    >>> sparse.to_uniform_grid() == grid
+    True
+
+    """
+
+    def __init__(
+        self,
+        dimensions,
+        spacing=(1.0, 1.0, 1.0),
+        origin=(0.0, 0.0, 0.0),
+        block_size=8,
+        background=0.0,
+    ):
+        """Initialize an empty sparse grid."""
+        if int(block_size) != block_size or block_size < 1:
+            raise ValueError('`block_size` must be a positive integer.')
+        self._dimensions = tuple(int(size) for size in dimensions)
+        if len(self._dimensions) != 3 or min(self._dimensions) < 1:
+            raise ValueError('`dimensions` must be three positive integers.')
+        self._spacing = tuple(float(value) for value in spacing)
+        self._origin = tuple(float(value) for value in origin)
+        self._block_size = int(block_size)
+        self._background = background
+        # index of each block in the block arrays, -1 when inactive (ZYX ordering)
+        block_dims = -(-np.array(self._dimensions[::-1]) // self._block_size)
+        self._block_ids = np.full(block_dims, -1, dtype=np.int64)
+        self._block_indices = np.empty((0, 3), dtype=np.int64)
+        self._arrays = {}
+        self._active_scalars_name = None
+
+    @classmethod
+    def from_uniform_grid(cls, grid, scalars=None, block_size=8, background=0.0):
+        """Create a sparse grid from the point data of a uniform grid.
+
+        A block is active when any of its points has a value of
+        ``scalars`` different from ``background``. All the point arrays
+        of the grid are stored in the active blocks.
+
+        Parameters
+        ----------
+        grid : pyvista.UniformGrid
+            Grid to convert.
+
+        scalars : str, optional
+            Name of the point array defining the active blocks. Defaults
+            to the active scalars.
+
+        block_size : int, default: 8
+            Number of points of each block along each axis.
+
+        background : float, default: 0.0
+            Value of the points outside of the active blocks.
+
+        Returns
+        -------
+        pyvista.SparseVoxelGrid
+            Sparse grid.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(32, 32, 32))
+        >>> grid['values'] = (grid.z > 28).astype(float)
+        >>> sparse = pyvista.SparseVoxelGrid.from_uniform_grid(grid, block_size=4)
+        >>> sparse.n_blocks
+        64
+
+        """
+        if scalars is None:
+            scalars = grid.point_data.active_scalars_name
+            if scalars is None and len(grid.point_data.keys()) == 1:
+                scalars = grid.point_data.keys()[0]
+        if scalars not in grid.point_data:
+            raise KeyError(f'Point data array "{scalars}" not found.')
+
+        origin = np.array(grid.origin) + np.array(grid.extent[::2]) * np.array(grid.spacing)
+        sparse = cls(grid.dimensions, grid.spacing, origin, block_size, background)
+        blocks = {name: sparse._split(grid.point_data[name]) for name in grid.point_data.keys()}
+        active = np.any(blocks[scalars] != background, axis=tuple(range(1, blocks[scalars].ndim)))
+
+        sparse._block_indices = sparse._all_block_indices()[active]
+        sparse._block_ids.reshape(-1)[active] = np.arange(active.sum())
+        sparse._arrays = {name: array[active] for name, array in blocks.items()}
+        sparse._active_scalars_name = scalars
+        return sparse
+
+    @property
+    def dimensions(self) -> tuple:
+        """Return the number of points along each axis."""
+        return self._dimensions
+
+    @property
+    def spacing(self) -> tuple:
+        """Return the spacing between the points along each axis."""
+        return self._spacing
+
+    @property
+    def origin(self) -> tuple:
+        """Return the coordinates of the first point."""
+        return self._origin
+
+    @property
+    def block_size(self) -> int:
+        """Return the number of points of each block along each axis."""
+        return self._block_size
+
+    @property
+    def background(self):
+        """Return the value of the points outside of the active blocks."""
+        return self._background
+
+    @property
+    def n_points(self) -> int:
+        """Return the number of points of the full grid."""
+        return int(np.prod(self._dimensions))
+
+    @property
+    def n_blocks(self) -> int:
+        """Return the number of active blocks."""
+        return len(self._block_indices)
+
+    @property
+    def block_indices(self) -> np.ndarray:
+        """Return the ``(i, j, k)`` indices of the active blocks.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(n_blocks, 3)`` array of block indices. Block ``(i, j, k)``
+            starts at point ``(i, j, k) * block_size``.
+
+        """
+        return self._block_indices
+
+    @property
+    def array_names(self) -> list:
+        """Return the names of the point arrays."""
+        return list(self._arrays)
+
+    @property
+    def active_scalars_name(self) -> str:
+        """Return the name of the array used when ``scalars`` is not given.
+
+        This is the array used to find the active blocks of
+        :func:`SparseVoxelGrid.from_uniform_grid` or the first array set
+        with :func:`SparseVoxelGrid.set_values_at_index`.
+
+        """
+        return self._active_scalars_name
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes used by the point data of the active blocks."""
+        return sum(array.nbytes for array in self._arrays.values()) + self._block_ids.nbytes
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return (
+            f'{type(self).__name__}(dimensions={self._dimensions}, '
+            f'block_size={self._block_size}, n_blocks={self.n_blocks})'
+        )
+
+    def _all_block_indices(self):
+        """Return the ``(i, j, k)`` indices of all the blocks in ZYX ordering (internal helper)."""
+        nbz, nby, nbx = self._block_ids.shape
+        k, j, i = np.meshgrid(np.arange(nbz), np.arange(nby), np.arange(nbx), indexing='ij')
+        return np.column_stack((i.ravel(), j.ravel(), k.ravel()))
+
+    def _split(self, array):
+        """Split a dense point array into the blocks of every block (internal helper)."""
+        bs = self._block_size
+        nbz, nby, nbx = self._block_ids.shape
+        components = array.shape[1:]
+        volume = np.asarray(array).reshape(*self._dimensions[::-1], *components)
+        if volume.shape[:3] != (nbz * bs, nby * bs, nbx * bs):
+            padded = np.full(
+                (nbz * bs, nby * bs, nbx * bs, *components), self._background, volume.dtype
+            )
+            padded[: volume.shape[0], : volume.shape[1], : volume.shape[2]] = volume
+            volume = padded
+        blocks = volume.reshape(nbz, bs, nby, bs, nbx, bs, *components)
+        blocks = blocks.transpose(0, 2, 4, 1, 3, 5, *range(6, blocks.ndim))
+        return blocks.reshape(nbz * nby * nbx, bs, bs, bs, *components)
+
+    def _activate(self, block_indices):
+        """Activate blocks filled with the background value (internal helper)."""
+        block_indices = np.unique(np.asarray(block_indices).reshape(-1, 3), axis=0)
+        i, j, k = block_indices.T
+        block_indices = block_indices[self._block_ids[k, j, i] < 0]
+        if not block_indices.size:
+            return
+        i, j, k = block_indices.T
+        self._block_ids[k, j, i] = np.arange(self.n_blocks, self.n_blocks + len(block_indices))
+        self._block_indices = np.vstack((self._block_indices, block_indices))
+        for name, array in self._arrays.items():
+            new = np.full((len(block_indices),) + array.shape[1:], self._background, array.dtype)
+            self._arrays[name] = np.concatenate((array, new))
+
+    def _locate(self, ijk):
+        """Return the block ids and local indices of points (internal helper)."""
+        ijk = np.asarray(ijk)
+        if ijk.ndim != 2 or ijk.shape[1] != 3 or not np.issubdtype(ijk.dtype, np.integer):
+            raise ValueError('Point indices must be an integer array of shape (n, 3).')
+        if ijk.size and (ijk.min() < 0 or np.any(ijk.max(axis=0) >= self._dimensions)):
+            raise IndexError(f'Point indices out of bounds for dimensions {self._dimensions}.')
+        block, local = np.divmod(ijk, self._block_size)
+        return self._block_ids[block[:, 2], block[:, 1], block[:, 0]], local
+
+    def _array_name(self, scalars):
+        """Return the name of the requested array (internal helper)."""
+        if scalars is None:
+            if self._active_scalars_name is None:
+                raise ValueError('`scalars` must be given when there are no active scalars.')
+            return self._active_scalars_name
+        if scalars not in self._arrays:
+            raise KeyError(f'Point data array "{scalars}" not found.')
+        return scalars
+
+    def values_at_index(self, ijk, scalars=None):
+        """Return the values of points from their ``(i, j, k)`` indices.
+
+        Parameters
+        ----------
+        ijk : sequence[int]
+            ``(n, 3)`` array of point indices.
+
+        scalars : str, optional
+            Name of the point array. Defaults to the active scalars.
+
+        Returns
+        -------
+        pyvista.pyvista_ndarray
+            Values of the points.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((100, 100, 100), block_size=10)
+        >>> sparse.set_values_at_index([[5, 5, 5]], [2.5], 'values')
+        >>> sparse.values_at_index([[5, 5, 5], [50, 50, 50]])
+        pyvista_ndarray([2.5, 0. ])
+
+        """
+        name = self._array_name(scalars)
+        array = self._arrays[name]
+        ids, local = self._locate(ijk)
+        values = np.full((len(ids),) + array.shape[4:], self._background, array.dtype)
+        active = ids >= 0
+        local = local[active]
+        values[active] = array[ids[active], local[:, 2], local[:, 1], local[:, 0]]
+        return pyvista.pyvista_ndarray(values)
+
+    def values_at_points(self, points, scalars=None):
+        """Return the values of the closest grid points to arbitrary points.
+
+        Points outside of the grid have the background value.
+
+        Parameters
+        ----------
+        points : sequence[float]
+            ``(n, 3)`` array of points.
+
+        scalars : str, optional
+            Name of the point array. Defaults to the active scalars.
+
+        Returns
+        -------
+        pyvista.pyvista_ndarray
+            Values of the closest grid points.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((100, 100, 100), spacing=(0.1, 0.1, 0.1))
+        >>> sparse.set_values_at_index([[5, 5, 5]], [2.5], 'values')
+        >>> sparse.values_at_points([[0.51, 0.49, 0.5], [20.0, 0.0, 0.0]])
+        pyvista_ndarray([2.5, 0. ])
+
+        """
+        points = pyvista.utilities.arrays._coerce_pointslike_arg(points)[0]
+        ijk = np.rint((points - self._origin) / self._spacing).astype(np.int64)
+        inside = np.all((ijk >= 0) & (ijk < self._dimensions), axis=1)
+        name = self._array_name(scalars)
+        array = self._arrays[name]
+        values = np.full((len(points),) + array.shape[4:], self._background, array.dtype)
+        values[inside] = self.values_at_index(ijk[inside], name)
+        return pyvista.pyvista_ndarray(values)
+
+    def set_values_at_index(self, ijk, values, name):
+        """Set the values of points from their ``(i, j, k)`` indices.
+
+        The blocks of the points are activated when needed.
+
+        Parameters
+        ----------
+        ijk : sequence[int]
+            ``(n, 3)`` array of point indices.
+
+        values : sequence
+            Values of the points. A new array with the data type of
+            ``values`` is created when ``name`` is not an existing array.
+
+        name : str
+            Name of the point array.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((64, 64, 64))
+        >>> sparse.set_values_at_index([[0, 0, 0], [63, 63, 63]], [1, 2], 'labels')
+        >>> sparse.n_blocks
+        2
+
+        """
+        ijk = np.asarray(ijk)
+        values = np.asarray(values)
+        self._locate(ijk)
+        if name not in self._arrays:
+            shape = (self.n_blocks,) + (self._block_size,) * 3 + values.shape[1:]
+            self._arrays[name] = np.full(shape, self._background, values.dtype)
+            if self._active_scalars_name is None:
+                self._active_scalars_name = name
+        self._activate(ijk // self._block_size)
+        ids, local = self._locate(ijk)
+        self._arrays[name][ids, local[:, 2], local[:, 1], local[:, 0]] = values
+
+    def to_uniform_grid(self):
+        """Return the dense uniform grid.
+
+        Returns
+        -------
+        pyvista.UniformGrid
+            Grid with every point array filled with the background value
+            outside of the active blocks.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((10, 10, 10))
+        >>> sparse.set_values_at_index([[1, 2, 3]], [1.0], 'values')
+        >>> grid = sparse.to_uniform_grid()
+        >>> grid['values'].sum()
+        1.0
+
+        """
+        grid = pyvista.UniformGrid(
+            dimensions=self._dimensions, spacing=self._spacing, origin=self._origin
+        )
+        bs = self._block_size
+        nbz, nby, nbx = self._block_ids.shape
+        i, j, k = self._block_indices.T
+        for name, array in self._arrays.items():
+            components = array.shape[4:]
+            volume = np.full(
+                (nbz, bs, nby, bs, nbx, bs, *components), self._background, array.dtype
+            )
+            blocks = volume.transpose(0, 2, 4, 1, 3, 5, *range(6, volume.ndim))
+            blocks[k, j, i] = array
+            volume = volume.reshape(nbz * bs, nby * bs, nbx * bs, *components)
+            nx, ny, nz = self._dimensions
+            volume = volume[:nz, :ny, :nx]
+            grid.point_data[name] = volume.reshape(grid.n_points, *components)
+        return grid
+
+    def _block_grid(self, block):
+        """Return the uniform grid of the cells of a block (internal helper)."""
+        start = np.asarray(block) * self._block_size
+        stop = np.minimum(start + self._block_size + 1, self._dimensions)
+        grid = pyvista.UniformGrid(
+            dimensions=stop - start,
+            spacing=self._spacing,
+            origin=np.array(self._origin) + start * self._spacing,
+        )
+        ijk = grid.implicit_points.take(np.arange(grid.n_points))
+        ijk = np.rint((ijk - self._origin) / self._spacing).astype(np.int64)
+        for name in self._arrays:
+            grid.point_data[name] = self.values_at_index(ijk, name)
+        return grid
+
+    def to_multiblock(self):
+        """Return the cells of the active blocks as small uniform grids.
+
+        Each grid covers the cells of one active block, including the
+        points shared with the next blocks, so that the grids tile the
+        active region.
+
+        Returns
+        -------
+        pyvista.MultiBlock
+            One :class:`pyvista.UniformGrid` per active block.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((64, 64, 64), block_size=16)
+        >>> sparse.set_values_at_index([[0, 0, 0], [63, 63, 63]], [1, 2], 'labels')
+        >>> [block.dimensions for block in sparse.to_multiblock()]
+        [(17, 17, 17), (16, 16, 16)]
+
+        """
+        blocks = pyvista.MultiBlock()
+        for block in self._block_indices:
+            blocks.append(self._block_grid(block))
+        return blocks
+
+    def _cells_grid(self, block_indices):
+        """Return the cells of blocks as an unstructured grid of voxels (internal helper)."""
+        bs = self._block_size
+        dims = np.array(self._dimensions)
+        block_dims = np.array(self._block_ids.shape[::-1])
+        # corners of the voxels, flattened along the flat axes of the grid
+        corner_offsets = _VOXEL_OFFSETS * (dims > 1)
+
+        # number the blocks holding the points of the cells, b + {0, 1}^3
+        neighbors = np.minimum(block_indices[:, np.newaxis] + corner_offsets, block_dims - 1)
+        needed = np.zeros(block_dims, dtype=bool)
+        needed[tuple(neighbors.reshape(-1, 3).T)] = True
+        needed_indices = np.argwhere(needed)
+        numbers = np.full(block_dims, -1, dtype=np.int64)
+        numbers[tuple(needed_indices.T)] = np.arange(len(needed_indices))
+        neighbors = numbers[neighbors[..., 0], neighbors[..., 1], neighbors[..., 2]]
+
+        # point ids of the voxels of one block: the block of each corner
+        # as an index in ``corner_offsets`` and its id within the block
+        local = np.column_stack([np.arange(bs**3) // bs**axis % bs for axis in range(3)])
+        corners = local[:, np.newaxis] + corner_offsets
+        shift = corners // bs
+        corner_block = (shift[..., np.newaxis, :] == corner_offsets).all(axis=-1).argmax(axis=-1)
+        corners %= bs
+        corner_local = (corners[..., 2] * bs + corners[..., 1]) * bs + corners[..., 0]
+
+        connectivity = neighbors[:, corner_block] * bs**3 + corner_local
+        cells = block_indices[:, np.newaxis] * bs + local
+        inside = np.all(cells < np.maximum(dims - 1, 1), axis=-1)
+        connectivity = connectivity[inside]
+        n_cells = len(connectivity)
+
+        # compact the ids of the used points without sorting
+        used = np.zeros(len(needed_indices) * bs**3, dtype=bool)
+        used[connectivity] = True
+        compact = np.cumsum(used) - 1
+        block, point = np.divmod(np.flatnonzero(used), bs**3)
+        ijk = needed_indices[block] * bs + local[point]
+
+        cell_array = np.empty((n_cells, 9), dtype=np.int64)
+        cell_array[:, 0] = 8
+        cell_array[:, 1:] = compact[connectivity]
+        celltypes = np.full(n_cells, pyvista.CellType.VOXEL, dtype=np.uint8)
+        points = ijk * np.array(self._spacing) + self._origin
+        grid = pyvista.UnstructuredGrid(cell_array.ravel(), celltypes, points)
+        for name in self._arrays:
+            grid.point_data[name] = self.values_at_index(ijk, name)
+        return grid
+
+    def _touching_blocks(self):
+        """Return the blocks whose cells touch an active point (internal helper)."""
+        # the cells of block b have points in the blocks b + {0, 1}^3
+        active = self._block_ids >= 0
+        touching = active.copy()
+        for dz, dy, dx in _VOXEL_OFFSETS[1:, ::-1]:
+            nbz, nby, nbx = active.shape
+            touching[: nbz - dz, : nby - dy, : nbx - dx] |= active[dz:, dy:, dx:]
+        return self._all_block_indices()[touching.ravel()]
+
+    def to_unstructured_grid(self):
+        """Return the cells of the active blocks as an unstructured grid.
+
+        Returns
+        -------
+        pyvista.UnstructuredGrid
+            Voxels of the active blocks with their point data.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((64, 64, 64), block_size=4)
+        >>> sparse.set_values_at_index([[0, 0, 0]], [1.0], 'values')
+        >>> sparse.to_unstructured_grid().n_cells
+        64
+
+        """
+        return self._cells_grid(self._block_indices)
+
+    def threshold(self, value=None, scalars=None, invert=False, method='upper', progress_bar=False):
+        """Apply a threshold filter to the cells touching the active blocks.
+
+        Cells with all their points outside of the active blocks are
+        never processed. See :func:`DataSetFilters.threshold
+        <pyvista.DataSetFilters.threshold>` for the parameters.
+
+        Parameters
+        ----------
+        value : float | sequence[float], optional
+            Single value or ``(min, max)`` to be used for the threshold.
+
+        scalars : str, optional
+            Name of the point array. Defaults to the active scalars.
+
+        invert : bool, default: False
+            Invert the threshold results.
+
+        method : str, default: 'upper'
+            Threshold method for single value, either ``'upper'`` or
+            ``'lower'``.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress.
+
+        Returns
+        -------
+        pyvista.UnstructuredGrid
+            Thresholded voxels.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sparse = pyvista.SparseVoxelGrid((64, 64, 64))
+        >>> sparse.set_values_at_index([[10, 10, 10], [50, 50, 50]], [1.0, 2.0], 'values')
+        >>> sparse.threshold(1.5).n_cells
+        8
+
+        """
+        name = self._array_name(scalars)
+        grid = self._cells_grid(self._touching_blocks())
+        return grid.threshold(
+            value,
+            scalars=name,
+            invert=invert,
+            preference='point',
+            method=method,
+            progress_bar=progress_bar,
+        )
+
+    def contour(
+        self, isosurfaces=10, scalars=None, compute_normals=False, rng=None, progress_bar=False
+    ):
+        """Contour the cells touching the active blocks.
+
+        Cells with all their points outside of the active blocks are
+        never processed. See :func:`DataSetFilters.contour
+        <pyvista.DataSetFilters.contour>` for the parameters.
+
+        Parameters
+        ----------
+        isosurfaces : int | sequence[float], default: 10
+            Number of isosurfaces to compute across the range of the
+            values of the active blocks, or sequence of values.
+
+        scalars : str, optional
+            Name of the point array. Defaults to the active scalars.
+
+        compute_normals : bool, default: False
+            Compute normals for the dataset.
+
+        rng : sequence[float], optional
+            If an integer number of isosurfaces is specified, this is
+            the range over which to generate contours.
+
+        progress_bar : bool, default: False
+            Display a progress bar to indicate progress.
+
+        Returns
+        -------
+        pyvista.PolyData
+            Contours.
+
+        Examples
+        --------
+        Contour a narrow band signed distance to a sphere.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(64, 64, 64))
+        >>> distance = np.linalg.norm(np.asarray(grid.implicit_points) - 32, axis=1) - 20
+        >>> grid['distance'] = np.clip(distance, -2, 2)
+        >>> sparse = pyvista.SparseVoxelGrid.from_uniform_grid(grid, background=2.0)
+        >>> surface = sparse.contour([0.0])
+        >>> surface.plot()
+
+        """
+        name = self._array_name(scalars)
+        grid = self._cells_grid(self._touching_blocks())
+        return grid.contour(
+            isosurfaces,
+            scalars=name,
+            compute_normals=compute_normals,
+            rng=rng,
+            progress_bar=progress_bar,
+        )
@@ -0,0 +1,201 @@
+"""Indexing helpers shared by the structured datasets."""
+import numpy as np
+
+
+class _StructuredIndexing:
+    """Conversions between flat ids and ``(i, j, k)`` structured coordinates.
+
+    Points and cells of structured datasets are ordered with ``i``
+    varying fastest, then ``j`` and ``k``.
+
+    """
+
+    def _cell_dimensions(self):
+        """Return the number of cells along each axis (internal helper)."""
+        return tuple(max(size - 1, 1) for size in self.dimensions)
+
+    def point_id(self, coords):
+        """Return the point IDs from their structured coordinates.
+
+        Parameters
+        ----------
+        coords : sequence[int] | numpy.ndarray
+            Point structured coordinates ``(i, j, k)`` or ``(n, 3)``
+            array of structured coordinates.
+
+        Returns
+        -------
+        int, numpy.ndarray, or None
+            Point IDs. ``None`` if ``coords`` is outside the grid extent.
+
+        See Also
+        --------
+        point_coords : Return the point structured coordinates.
+        cell_id : Return the cell ID.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(4, 5, 6))
+        >>> grid.point_id((1, 2, 3))
+        69
+        >>> grid.point_id([(0, 0, 0), (3, 4, 5)])
+        array([  0, 119])
+
+        """
+        return _ravel(coords, self.dimensions)
+
+    def point_coords(self, ind):
+        """Return the point structured coordinates from their IDs.
+
+        Parameters
+        ----------
+        ind : int | sequence[int]
+            Point IDs.
+
+        Returns
+        -------
+        tuple[int], numpy.ndarray, or None
+            Point structured coordinates ``(i, j, k)``, or ``(n, 3)``
+            array of structured coordinates. ``None`` if ``ind`` is
+            outside the grid extent.
+
+        See Also
+        --------
+        point_id : Return the point ID.
+        cell_coords : Return the cell structured coordinates.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(4, 5, 6))
+        >>> grid.point_coords(69)
+        (1, 2, 3)
+        >>> grid.point_coords([0, 119])
+        array([[0, 0, 0],
+               [3, 4, 5]])
+
+        """
+        return _unravel(ind, self.dimensions)
+
+    def cell_id(self, coords):
+        """Return the cell IDs from their structured coordinates.
+
+        Parameters
+        ----------
+        coords : sequence[int] | numpy.ndarray
+            Cell structured coordinates ``(i, j, k)`` or ``(n, 3)`` array
+            of structured coordinates.
+
+        Returns
+        -------
+        int, numpy.ndarray, or None
+            Cell IDs. ``None`` if ``coords`` is outside the grid extent.
+
+        See Also
+        --------
+        cell_coords : Return the cell structured coordinates.
+        point_id : Return the point ID.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(4, 5, 6))
+        >>> grid.cell_id((1, 2, 3))
+        43
+        >>> grid.cell_id([(0, 0, 0), (2, 3, 4)])
+        array([ 0, 59])
+
+        """
+        return _ravel(coords, self._cell_dimensions())
+
+    def cell_coords(self, ind):
+        """Return the cell structured coordinates from their IDs.
+
+        Parameters
+        ----------
+        ind : int | sequence[int]
+            Cell IDs.
+
+        Returns
+        -------
+        tuple[int], numpy.ndarray, or None
+            Cell structured coordinates ``(i, j, k)``, or ``(n, 3)``
+            array of structured coordinates. ``None`` if ``ind`` is
+            outside the grid extent.
+
+        See Also
+        --------
+        cell_id : Return the cell ID.
+        point_coords : Return the point structured coordinates.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid(dimensions=(4, 5, 6))
+        >>> grid.cell_coords(43)
+        (1, 2, 3)
+        >>> grid.cell_coords([0, 59])
+        array([[0, 0, 0],
+               [2, 3, 4]])
+
+        """
+        return _unravel(ind, self._cell_dimensions())
+
+
+def _ravel(coords, dims):
+    """Return flat ids from structured coordinates, ``None`` if out of bounds."""
+    coords = np.asarray(coords)
+    if coords.ndim == 2:
+        coords = tuple(coords.T)
+    else:
+        coords = tuple(coords)
+    try:
+        ind = np.ravel_multi_index(coords, dims, order='F')
+    except ValueError:
+        return None
+    return ind if isinstance(ind, np.ndarray) else int(ind)
+
+
+def _unravel(ind, dims):
+    """Return structured coordinates from flat ids, ``None`` if out of bounds."""
+    try:
+        coords = np.unravel_index(ind, dims, order='F')
+    except ValueError:
+        return None
+    if isinstance(coords[0], np.ndarray):
+        return np.stack(coords, axis=1)
+    return tuple(int(coord) for coord in coords)
+
+
+def _nearest_index(axis, values):
+    """Return the index of the closest coordinate of an axis to each value."""
+    if axis.size > 1 and axis[0] > axis[-1]:
+        return axis.size - 1 - _nearest_index(axis[::-1], values)
+    if axis.size == 1:
+        return np.zeros(values.shape, dtype=np.intp)
+    ind = np.searchsorted(axis, values).clip(1, axis.size - 1)
+    # ties go to the upper coordinate, like vtkPointLocator
+    ind -= values - axis[ind - 1] < axis[ind] - values
+    return ind
+
+
+def _cell_index(axis, values):
+    """Return the index of the cell of an axis containing each value and whether it is inside."""
+    if axis.size > 1 and axis[0] > axis[-1]:
+        ind, inside = _cell_index(axis[::-1], values)
+        return axis.size - 2 - ind, inside
+    inside = (values >= axis[0]) & (values <= axis[-1])
+    if axis.size == 1:
+        return np.zeros(values.shape, dtype=np.intp), inside
+    ind = (np.searchsorted(axis, values, side='right') - 1).clip(0, axis.size - 2)
+    return ind, inside
+
+
+def _cells_in_range(axis, low, high):
+    """Return the indices of the cells of an axis overlapping a range."""
+    if axis.size == 1:
+        return np.arange(1) if low <= axis[0] <= high else np.arange(0)
+    lower = np.minimum(axis[:-1], axis[1:])
+    upper = np.maximum(axis[:-1], axis[1:])
+    return np.flatnonzero((lower <= high) & (upper >= low))
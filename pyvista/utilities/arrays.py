@@ -1,5 +1,6 @@
 """Internal array utilities."""
 import collections.abc
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Union
 
 import numpy as np
@@ -31,6 +32,9 @@ def _coerce_pointslike_arg(
     """
     if isinstance(points, collections.abc.Sequence):
         points = np.asarray(points)
+    elif not isinstance(points, np.ndarray) and hasattr(points, '__array__'):
+        # objects that can build an array such as ``pyvista.ImplicitPoints``
+        points = np.asarray(points)
 
     if not isinstance(points, np.ndarray):
         raise TypeError("Given points must be a sequence or an array.")
@@ -52,3 +56,186 @@ def _coerce_pointslike_arg(
     if copy:
         return points.copy(), singular
     return points, singular
+
+
+# number of tuples processed at once by ``_describe_arrays``
+_DESCRIBE_CHUNK_SIZE = 1 << 20
+
+
+def _describe_chunks(arrays, component):
+    """Yield functions returning chunks of finite values of the arrays."""
+    for array in arrays:
+        for start in range(0, array.shape[0], _DESCRIBE_CHUNK_SIZE):
+
+            def chunk(array=array, start=start):
+                values = array[start : start + _DESCRIBE_CHUNK_SIZE]
+                if values.ndim > 1:
+                    values = values.reshape(values.shape[0], -1)
+                    if component is None:
+                        values = np.linalg.norm(values, axis=1)
+                    else:
+                        values = values[:, component]
+                values = np.asarray(values, dtype=np.float64)
+                return values[np.isfinite(values)]
+
+            yield chunk
+
+
+def _describe_arrays(arrays, bins=256, quantiles=(), component=None, n_threads=1):
+    """Compute the statistics of the values of one or more arrays.
+
+    The arrays are read in chunks of ``_DESCRIBE_CHUNK_SIZE`` tuples,
+    so the temporaries never exceed one chunk, even for memory-mapped
+    arrays. A first pass computes the count, range and moments, a
+    second pass the histogram, from which the quantiles are
+    interpolated. Non-finite values are ignored.
+
+    Parameters
+    ----------
+    arrays : sequence[numpy.ndarray]
+        Numeric arrays. Their first axis indexes the tuples.
+
+    bins : int, default: 256
+        Number of bins of the histogram.
+
+    quantiles : sequence[float], default: ()
+        Quantiles to estimate, between 0 and 1.
+
+    component : int, optional
+        Component of multi-component arrays to describe. By default
+        the magnitude of the tuples is described.
+
+    n_threads : int, default: 1
+        Number of threads processing the chunks.
+
+    Returns
+    -------
+    dict
+        Statistics of the values. See
+        :func:`pyvista.DataSetAttributes.describe`.
+
+    """
+    for array in arrays:
+        if not np.issubdtype(array.dtype, np.number) and array.dtype != bool:
+            raise TypeError(f'Cannot describe an array of type {array.dtype}.')
+        if component is not None and array.ndim > 1:
+            n_components = int(np.prod(array.shape[1:]))
+            if not -n_components <= component < n_components:
+                raise ValueError(
+                    f'`component` must be between {-n_components} and {n_components - 1}.'
+                )
+
+    def moments(chunk):
+        values = chunk()
+        if not values.size:
+            return 0, np.inf, -np.inf, 0.0, 0.0
+        mean = values.mean()
+        return values.size, values.min(), values.max(), mean, np.square(values - mean).sum()
+
+    def histogram(chunk):
+        return np.histogram(chunk(), bins, range=(lo, hi))[0]
+
+    with ThreadPoolExecutor(n_threads) as pool:
+        # Chan et al. pairwise update of the count, mean and sum of
+        # squared deviations
+        count, mini, maxi, mean, m2 = 0, np.inf, -np.inf, 0.0, 0.0
+        for n, cmin, cmax, cmean, cm2 in pool.map(moments, _describe_chunks(arrays, component)):
+            if not n:
+                continue
+            total = count + n
+            delta = cmean - mean
+            mean += delta * n / total
+            m2 += cm2 + delta**2 * count * n / total
+            count = total
+            mini, maxi = min(mini, cmin), max(maxi, cmax)
+
+        if not count:
+            return {
+                'count': 0,
+                'min': np.nan,
+                'max': np.nan,
+                'mean': np.nan,
+                'std': np.nan,
+                'histogram': np.zeros(bins, dtype=np.int64),
+                'bin_edges': np.full(bins + 1, np.nan),
+                'quantiles': {q: np.nan for q in quantiles},
+            }
+
+        # same edges as ``numpy.histogram`` for a constant array
+        lo, hi = (mini - 0.5, maxi + 0.5) if mini == maxi else (mini, maxi)
+        counts = np.zeros(bins, dtype=np.int64)
+        for chunk_counts in pool.map(histogram, _describe_chunks(arrays, component)):
+            counts += chunk_counts
+
+    edges = np.linspace(lo, hi, bins + 1)
+
+    # interpolate linearly within the bin where the cumulative count
+    # reaches each quantile
+    cumulative = np.cumsum(counts)
+    values = {}
+    for q in quantiles:
+        target = q * count
+        i = min(int(np.searchsorted(cumulative, target)), bins - 1)
+        before = cumulative[i - 1] if i else 0
+        fraction = (target - before) / counts[i] if counts[i] else 0.0
+        value = edges[i] + fraction * (edges[i + 1] - edges[i])
+        values[q] = float(min(max(value, mini), maxi))
+
+    return {
+        'count': count,
+        'min': float(mini),
+        'max': float(maxi),
+        'mean': float(mean),
+        'std': float(np.sqrt(m2 / count)),
+        'histogram': counts,
+        'bin_edges': edges,
+        'quantiles': values,
+    }
+
+
+def _fingerprint(array, n_samples=256):
+    """Return a cheap fingerprint of the values of an array.
+
+    In-place NumPy operations such as ``array += 1`` do not change the
+    modification time of the VTK array, so a strided sample of the
+    tuples is compared as well.
+
+    """
+    step = max(1, array.shape[0] // n_samples)
+    return hash(np.ascontiguousarray(array[::step]).tobytes() + array[-1:].tobytes())
+
+
+def _cached_describe(owner, name, arrays, bins=256, quantiles=(), component=None, n_threads=1):
+    """Describe arrays, reusing the statistics cached on ``owner``.
+
+    The statistics are cached under ``name`` and computed again only
+    when the modification time or the fingerprint of one of the VTK
+    arrays changes or when the statistics requested differ.
+
+    """
+    bins = int(bins)
+    if bins < 1:
+        raise ValueError('`bins` must be a positive integer.')
+    quantiles = tuple(float(q) for q in quantiles)
+    if any(not 0 <= q <= 1 for q in quantiles):
+        raise ValueError('`quantiles` must be between 0 and 1.')
+    if n_threads < 1:
+        raise ValueError('`n_threads` must be a positive integer.')
+    mtimes = tuple(
+        array.VTKObject.GetMTime() if getattr(array, 'VTKObject', None) is not None else None
+        for array in arrays
+    )
+    key = (mtimes, tuple(_fingerprint(array) for array in arrays), bins, quantiles, component)
+    if getattr(owner, '_describe_cache', None) is None:
+        owner._describe_cache = {}
+    cache = owner._describe_cache
+    if None in mtimes or cache.get(name, (None,))[0] != key:
+        stats = _describe_arrays(arrays, bins, quantiles, component, n_threads)
+        cache[name] = (key, stats)
+    stats = cache[name][1]
+    return {
+        **stats,
+        'histogram': stats['histogram'].copy(),
+        'bin_edges': stats['bin_edges'].copy(),
+        'quantiles': dict(stats['quantiles']),
+    }
@@ -0,0 +1,336 @@
+"""Vectorized bounding volume hierarchy for batched ray casting."""
+import numpy as np
+
+# Number of bits per axis used to quantize triangle centroids when
+# computing their Morton codes.
+_MORTON_BITS = 10
+
+
+def _expand_bits(values):
+    """Spread the lower 10 bits of ``values`` so there are two zeros between each bit."""
+    values = values.astype(np.uint32)
+    values = (values * np.uint32(0x00010001)) & np.uint32(0xFF0000FF)
+    values = (values * np.uint32(0x00000101)) & np.uint32(0x0F00F00F)
+    values = (values * np.uint32(0x00000011)) & np.uint32(0xC30C30C3)
+    values = (values * np.uint32(0x00000005)) & np.uint32(0x49249249)
+    return values
+
+
+def morton_codes(points, bounds=None):
+    """Return the 30 bit Morton codes of a set of points.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(N, 3)`` array of points.
+
+    bounds : sequence, optional
+        Bounds ``(xmin, xmax, ymin, ymax, zmin, zmax)`` used to quantize
+        the points. Defaults to the bounds of ``points``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N,)`` array of ``numpy.uint32`` Morton codes.
+
+    """
+    points = np.asarray(points, dtype=float)
+    if bounds is None:
+        lower = points.min(axis=0)
+        upper = points.max(axis=0)
+    else:
+        lower = np.asarray(bounds[::2], dtype=float)
+        upper = np.asarray(bounds[1::2], dtype=float)
+    extent = upper - lower
+    extent[extent == 0] = 1.0
+    scale = (1 << _MORTON_BITS) - 1
+    quantized = np.clip((points - lower) / extent * scale, 0, scale)
+    quantized = quantized.astype(np.uint32)
+    return (
+        (_expand_bits(quantized[:, 0]) << np.uint32(2))
+        | (_expand_bits(quantized[:, 1]) << np.uint32(1))
+        | _expand_bits(quantized[:, 2])
+    )
+
+
+class TriangleBVH:
+    """Bounding volume hierarchy over the triangles of a surface.
+
+    Triangles are sorted along a Morton curve and grouped into leaves
+    of ``leaf_size`` triangles. The leaves form the bottom level of a
+    complete binary tree whose node bounds are computed bottom-up, so
+    the whole hierarchy is built with a handful of vectorized NumPy
+    operations and traversed breadth-first for many rays at once.
+
+    This class is usually accessed through :attr:`pyvista.PolyData.bvh`,
+    which caches the hierarchy on the mesh.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(N, 3)`` array of mesh points.
+
+    triangles : numpy.ndarray
+        ``(M, 3)`` array of point indices of each triangle.
+
+    leaf_size : int, default: 4
+        Maximum number of triangles stored in a leaf.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pyvista
+    >>> from pyvista.utilities.bvh import TriangleBVH
+    >>> sphere = pyvista.Sphere()
+    >>> bvh = TriangleBVH(sphere.points, sphere.faces.reshape(-1, 4)[:, 1:])
+    >>> points, rays, cells, distances = bvh.intersect([[0, 0, 0]], [[1, 0, 0]])
+    >>> f'{distances[0]:.3f}'
+    '0.499'
+
+    """
+
+    def __init__(self, points, triangles, leaf_size=4):
+        """Build the hierarchy."""
+        if leaf_size < 1:
+            raise ValueError('`leaf_size` must be a positive integer.')
+        points = np.asarray(points, dtype=np.float64)
+        triangles = np.asarray(triangles).reshape(-1, 3)
+        self.leaf_size = int(leaf_size)
+        self.n_triangles = triangles.shape[0]
+
+        if self.n_triangles:
+            centroids = points[triangles].mean(axis=1)
+            order = np.argsort(morton_codes(centroids), kind='stable')
+        else:
+            order = np.empty(0, dtype=np.intp)
+        self.triangle_ids = order
+        triangles = triangles[order]
+
+        # Precompute the Möller–Trumbore edge vectors
+        self._v0 = points[triangles[:, 0]]
+        self._edge1 = points[triangles[:, 1]] - self._v0
+        self._edge2 = points[triangles[:, 2]] - self._v0
+
+        n_leaves = max(-(-self.n_triangles // self.leaf_size), 1)
+        self.depth = int(np.ceil(np.log2(n_leaves)))
+        n_padded = (1 << self.depth) * self.leaf_size
+
+        tri_points = points[triangles]
+        self._tri_lower = tri_points.min(axis=1)
+        self._tri_upper = tri_points.max(axis=1)
+        lower = np.full((n_padded, 3), np.inf)
+        upper = np.full((n_padded, 3), -np.inf)
+        lower[: self.n_triangles] = self._tri_lower
+        upper[: self.n_triangles] = self._tri_upper
+        lower = lower.reshape(-1, self.leaf_size, 3).min(axis=1)
+        upper = upper.reshape(-1, self.leaf_size, 3).max(axis=1)
+
+        # levels are stored from the root (index 0) down to the leaves
+        self._lower = [lower]
+        self._upper = [upper]
+        while lower.shape[0] > 1:
+            lower = np.minimum(lower[0::2], lower[1::2])
+            upper = np.maximum(upper[0::2], upper[1::2])
+            self._lower.insert(0, lower)
+            self._upper.insert(0, upper)
+        self._valid = [lo[:, 0] <= up[:, 0] for lo, up in zip(self._lower, self._upper)]
+
+    @property
+    def n_nodes(self):
+        """Return the number of nodes in the hierarchy.
+
+        Returns
+        -------
+        int
+            Number of nodes, including empty padding leaves.
+
+        """
+        return sum(lower.shape[0] for lower in self._lower)
+
+    def query_box(self, bounds):
+        """Return the triangles whose bounding box overlaps a box.
+
+        Parameters
+        ----------
+        bounds : sequence
+            Bounds of the box ``(xmin, xmax, ymin, ymax, zmin, zmax)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted indices of the triangles overlapping the box.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> cells = sphere.bvh.query_box([0.4, 1, -1, 1, -1, 1])
+        >>> cells.size
+        154
+
+        """
+        lower = np.asarray(bounds[::2], dtype=np.float64)
+        upper = np.asarray(bounds[1::2], dtype=np.float64)
+        nodes = np.zeros(1, dtype=np.intp)
+        for level, (node_lower, node_upper, valid) in enumerate(
+            zip(self._lower, self._upper, self._valid)
+        ):
+            if level:
+                nodes = (np.repeat(nodes, 2) << 1) + np.tile([0, 1], nodes.size)
+            hit = valid[nodes]
+            hit &= np.all(node_lower[nodes] <= upper, axis=1)
+            hit &= np.all(node_upper[nodes] >= lower, axis=1)
+            nodes = nodes[hit]
+
+        triangles = (nodes[:, np.newaxis] * self.leaf_size + np.arange(self.leaf_size)).ravel()
+        triangles = triangles[triangles < self.n_triangles]
+        hit = np.all(self._tri_lower[triangles] <= upper, axis=1)
+        hit &= np.all(self._tri_upper[triangles] >= lower, axis=1)
+        return np.sort(self.triangle_ids[triangles[hit]])
+
+    def _candidates(self, origins, inv_directions, max_distance):
+        """Return the ``(ray, triangle)`` pairs whose leaf bounds are hit."""
+        rays = np.arange(origins.shape[0])
+        nodes = np.zeros(origins.shape[0], dtype=np.intp)
+        for level, (lower, upper, valid) in enumerate(zip(self._lower, self._upper, self._valid)):
+            if level:
+                rays = np.repeat(rays, 2)
+                nodes = (np.repeat(nodes, 2) << 1) + np.tile([0, 1], nodes.size)
+            t_near = np.zeros(rays.size)
+            t_far = max_distance[rays]
+            for axis in range(3):
+                origin = origins[rays, axis]
+                inv_dir = inv_directions[rays, axis]
+                with np.errstate(invalid='ignore'):
+                    t_a = (lower[nodes, axis] - origin) * inv_dir
+                    t_b = (upper[nodes, axis] - origin) * inv_dir
+                t_near = np.fmax(t_near, np.fmin(t_a, t_b))
+                t_far = np.fmin(t_far, np.fmax(t_a, t_b))
+            hit = valid[nodes] & (t_near <= t_far)
+            rays = rays[hit]
+            nodes = nodes[hit]
+            if not rays.size:
+                break
+
+        offsets = np.arange(self.leaf_size)
+        triangles = (nodes[:, np.newaxis] * self.leaf_size + offsets).ravel()
+        rays = np.repeat(rays, self.leaf_size)
+        mask = triangles < self.n_triangles
+        return rays[mask], triangles[mask]
+
+    def _intersect_triangles(self, origins, directions, rays, triangles, max_distance, det_eps):
+        """Vectorized Möller–Trumbore test over ``(ray, triangle)`` pairs."""
+        direction = directions[rays]
+        edge1 = self._edge1[triangles]
+        edge2 = self._edge2[triangles]
+        pvec = np.cross(direction, edge2)
+        det = np.einsum('ij,ij->i', edge1, pvec)
+        valid = np.abs(det) > det_eps
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_det = 1.0 / det
+            tvec = origins[rays] - self._v0[triangles]
+            u = np.einsum('ij,ij->i', tvec, pvec) * inv_det
+            qvec = np.cross(tvec, edge1)
+            v = np.einsum('ij,ij->i', direction, qvec) * inv_det
+            t = np.einsum('ij,ij->i', edge2, qvec) * inv_det
+            tol = 1e-9
+            valid &= (u >= -tol) & (v >= -tol) & (u + v <= 1 + tol)
+            valid &= (t >= 0) & (t <= max_distance[rays])
+        return rays[valid], triangles[valid], t[valid]
+
+    def intersect(
+        self, origins, directions, first_point=False, max_distance=None, chunk_size=65536
+    ):
+        """Intersect many rays with the triangles of the hierarchy.
+
+        Parameters
+        ----------
+        origins : numpy.ndarray
+            ``(N, 3)`` array of ray origins.
+
+        directions : numpy.ndarray
+            ``(N, 3)`` array of ray directions. These need not be
+            normalized.
+
+        first_point : bool, default: False
+            Return only the closest intersection of each ray.
+
+        max_distance : float or numpy.ndarray, optional
+            Maximum distance along each ray. Either a single value or
+            one value per ray. Defaults to infinite rays.
+
+        chunk_size : int, default: 65536
+            Number of rays traversed at once. This bounds the size of
+            the temporary arrays.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(K, 3)`` array of intersection points.
+
+        numpy.ndarray
+            ``(K,)`` array of the index of the ray for each intersection.
+
+        numpy.ndarray
+            ``(K,)`` array of the index of the intersected triangle.
+
+        numpy.ndarray
+            ``(K,)`` array of the distance from the ray origin to each
+            intersection.
+
+        """
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        if origins.shape[0] == 1 and directions.shape[0] > 1:
+            origins = np.repeat(origins, directions.shape[0], axis=0)
+        if origins.shape != directions.shape:
+            raise ValueError('`origins` and `directions` must have the same number of rays.')
+        n_rays = origins.shape[0]
+
+        norms = np.linalg.norm(directions, axis=1)
+        if np.any(norms == 0):
+            raise ValueError('Ray directions must be non-zero.')
+        directions = directions / norms[:, np.newaxis]
+        with np.errstate(divide='ignore'):
+            inv_directions = 1.0 / directions
+
+        if max_distance is None:
+            max_distance = np.full(n_rays, np.inf)
+        else:
+            max_distance = np.broadcast_to(np.asarray(max_distance, dtype=np.float64), (n_rays,))
+
+        # tolerance for the determinant of the intersection test relative
+        # to the size of the triangles
+        scale = float(np.abs(self._edge1).max(initial=0.0))
+        det_eps = 1e-12 * scale**2 if scale else 1e-300
+
+        all_rays, all_triangles, all_t = [], [], []
+        for start in range(0, n_rays, chunk_size):
+            stop = min(start + chunk_size, n_rays)
+            chunk = slice(start, stop)
+            rays, triangles = self._candidates(
+                origins[chunk], inv_directions[chunk], max_distance[chunk]
+            )
+            rays, triangles, t = self._intersect_triangles(
+                origins[chunk], directions[chunk], rays, triangles, max_distance[chunk], det_eps
+            )
+            order = np.lexsort((t, rays))
+            rays, triangles, t = rays[order], triangles[order], t[order]
+            if first_point and rays.size:
+                first = np.ones(rays.size, dtype=bool)
+                first[1:] = rays[1:] != rays[:-1]
+                rays, triangles, t = rays[first], triangles[first], t[first]
+            all_rays.append(rays + start)
+            all_triangles.append(triangles)
+            all_t.append(t)
+
+        if all_rays:
+            rays = np.concatenate(all_rays)
+            triangles = np.concatenate(all_triangles)
+            t = np.concatenate(all_t)
+        else:
+            rays = np.empty(0, dtype=np.intp)
+            triangles = np.empty(0, dtype=np.intp)
+            t = np.empty(0)
+        locations = origins[rays] + directions[rays] * t[:, np.newaxis]
+        return locations, rays, self.triangle_ids[triangles], t
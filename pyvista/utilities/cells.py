@@ -261,3 +261,114 @@ def get_mixed_cells(vtkobj):
         return_dict[cell_type] = cells[cells_inds]
 
     return return_dict
+
+
+def get_offsets_connectivity(mesh):
+    """Return the offsets and connectivity arrays of the cells of a dataset.
+
+    Parameters
+    ----------
+    mesh : pyvista.DataSet
+        Any dataset. Datasets other than :class:`pyvista.PolyData` and
+        :class:`pyvista.UnstructuredGrid` are cast to an unstructured
+        grid first.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(n_cells + 1,)`` array of the offset of each cell in the
+        connectivity array.
+
+    numpy.ndarray
+        Point ids of all cells, cell after cell.
+
+    Notes
+    -----
+    The arrays may share memory with the mesh and must not be modified.
+
+    """
+    if isinstance(mesh, pyvista.PolyData):
+        # cells of polydata are ordered as verts, lines, polys and strips
+        groups = [
+            cells
+            for cells in (mesh.GetVerts(), mesh.GetLines(), mesh.GetPolys(), mesh.GetStrips())
+            if cells.GetNumberOfCells()
+        ]
+        if len(groups) == 1:
+            return (
+                _vtk.vtk_to_numpy(groups[0].GetOffsetsArray()),
+                _vtk.vtk_to_numpy(groups[0].GetConnectivityArray()),
+            )
+        offsets = [np.zeros(1, dtype=pyvista.ID_TYPE)]
+        conn = []
+        n_conn = 0
+        for cells in groups:
+            cell_offsets = _vtk.vtk_to_numpy(cells.GetOffsetsArray())
+            offsets.append(cell_offsets[1:] + n_conn)
+            conn.append(_vtk.vtk_to_numpy(cells.GetConnectivityArray()))
+            n_conn += conn[-1].size
+        return np.concatenate(offsets), np.concatenate(conn)
+
+    if not isinstance(mesh, pyvista.UnstructuredGrid):
+        mesh = mesh.cast_to_unstructured_grid()
+    return mesh.offset, mesh.cell_connectivity
+
+
+def connected_point_labels(offsets, connectivity, n_points):
+    """Label the points of a mesh by the connected region they belong to.
+
+    Points are connected when they are used by the same cell. Regions
+    are found with a vectorized union-find: each pass hooks the larger
+    root of every unresolved edge to the smaller root and then compresses all
+    paths, so the number of passes grows with the logarithm of the
+    region size rather than with the number of cells.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        ``(n_cells + 1,)`` array of cell offsets.
+
+    connectivity : numpy.ndarray
+        Point ids of all cells, cell after cell.
+
+    n_points : int
+        Number of points of the mesh.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(n_points,)`` array with the smallest point id of the region
+        of each point. Points not used by any cell are their own region.
+
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    connectivity = np.asarray(connectivity, dtype=np.int64)
+    sizes = np.diff(offsets)
+
+    # connect every point of a cell to the first point of that cell
+    first = np.repeat(connectivity[offsets[:-1][sizes > 0]], sizes[sizes > 0])
+    mask = first != connectivity
+    u, v = first[mask], connectivity[mask]
+
+    parent = np.arange(n_points, dtype=np.int64)
+    while u.size:
+        root_u = parent[u]
+        root_v = parent[v]
+        low = np.minimum(root_u, root_v)
+        high = np.maximum(root_u, root_v)
+        unresolved = low != high
+        if not unresolved.any():
+            break
+        # hooking a root to any smaller root is valid, so duplicate
+        # writes may resolve arbitrarily; losing edges are retried
+        parent[high[unresolved]] = low[unresolved]
+        u, v = u[unresolved], v[unresolved]
+
+        # compress paths until every point points to its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    return parent
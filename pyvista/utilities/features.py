@@ -1,15 +1,22 @@
 """Module containing geometry helper functions."""
 
 import collections.abc
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 import pyvista
+from pyvista import _vtk
 
 
 def voxelize(mesh, density=None, check_surface=True):
     """Voxelize mesh to UnstructuredGrid.
 
+    This converts the occupancy mask computed by
+    :func:`voxelize_volume` to the hexahedral cells touching the lattice
+    points inside the mesh. Use :func:`voxelize_volume` directly for
+    fine densities, as the mask takes a single byte per voxel.
+
     Parameters
     ----------
     density : float, np.ndarray or collections.abc.Sequence
@@ -43,6 +50,141 @@ def voxelize(mesh, density=None, check_surface=True):
     >>> vox = pv.voxelize(mesh, density=[0.01, 0.005, 0.002])
     >>> vox.plot(show_edges=True)
 
+    """
+    grid = voxelize_volume(mesh, density=density, check_surface=check_surface)
+    mask = grid.point_data.pop('Occupancy').view(np.bool_)
+
+    # extract cells from point indices
+    vox = grid.extract_points(mask)
+
+    # reorder the points of the voxels to hexahedrons, or of the pixels
+    # to quads when the lattice is flat
+    cells = vox.cells
+    celltypes = vox.celltypes
+    if vox.n_cells and celltypes[0] == pyvista.CellType.VOXEL:
+        cells = cells.reshape(-1, 9)[:, [0, 1, 2, 4, 3, 5, 6, 8, 7]]
+        celltypes = np.full(vox.n_cells, pyvista.CellType.HEXAHEDRON, dtype=np.uint8)
+    elif vox.n_cells and celltypes[0] == pyvista.CellType.PIXEL:
+        cells = cells.reshape(-1, 5)[:, [0, 1, 2, 4, 3]]
+        celltypes = np.full(vox.n_cells, pyvista.CellType.QUAD, dtype=np.uint8)
+    output = pyvista.UnstructuredGrid(cells.ravel(), celltypes, vox.points)
+    output.point_data.update(vox.point_data)
+    output.cell_data.update(vox.cell_data)
+    return output
+
+
+def _slab_parity(triangles, origin, spacing, dims, k_range):
+    """Return the inside mask of the lattice points of a slab using scanline ray parity.
+
+    A ray is cast along the x axis through each row of lattice points
+    of the slab. Each row is offset by a tiny fraction of the spacing
+    so it does not run through the edges and vertices of the triangles
+    lying on the lattice, and the crossings of the rows with the
+    triangles are counted in one vectorized pass. A lattice point is
+    inside when an odd number of crossings lie before it on its row.
+
+    """
+    nx, ny, _ = dims
+    k_start, k_stop = k_range
+    offset = spacing[1:] * np.array([2.0**-20 * np.sqrt(2), 2.0**-20 * np.sqrt(3)])
+    tri_yz = (triangles[:, :, 1:] - origin[1:] - offset) / spacing[1:]
+
+    # rows spanned by the projection of each triangle on the yz plane
+    lower = np.ceil(tri_yz.min(axis=1)).astype(np.int64)
+    upper = np.floor(tri_yz.max(axis=1)).astype(np.int64)
+    lower = np.maximum(lower, [0, k_start])
+    upper = np.minimum(upper, [ny - 1, k_stop - 1])
+    n_rows = np.maximum(upper - lower + 1, 0)
+    counts = n_rows[:, 0] * n_rows[:, 1]
+
+    # enumerate every (triangle, row) pair
+    tri = np.repeat(np.arange(triangles.shape[0]), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    j = lower[tri, 0] + local % n_rows[tri, 0]
+    k = lower[tri, 1] + local // n_rows[tri, 0]
+
+    # barycentric coordinates of the row in the projected triangle
+    a, b, c = (tri_yz[tri, corner] for corner in range(3))
+    row = np.column_stack((j, k)).astype(np.float64)
+
+    def cross(u, v):
+        return u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+
+    w_a = cross(c - b, row - b)
+    w_b = cross(a - c, row - c)
+    w_c = cross(b - a, row - a)
+    hit = ((w_a > 0) & (w_b > 0) & (w_c > 0)) | ((w_a < 0) & (w_b < 0) & (w_c < 0))
+    tri, j, k = tri[hit], j[hit], k[hit]
+    area = w_a[hit] + w_b[hit] + w_c[hit]
+    weights = np.column_stack((w_a[hit], w_b[hit], w_c[hit])) / area[:, np.newaxis]
+    x = np.einsum('ij,ij->i', weights, triangles[tri, :, 0])
+
+    # toggle the parity of the lattice points after each crossing
+    i = np.clip(np.ceil((x - origin[0]) / spacing[0]), 0, nx).astype(np.int64)
+    n_slab = k_stop - k_start
+    toggles = np.bincount(((k - k_start) * ny + j) * (nx + 1) + i, minlength=n_slab * ny * (nx + 1))
+    parity = np.cumsum(toggles.reshape(n_slab, ny, nx + 1).astype(np.uint8), axis=2) & 1
+    return parity[:, :, :nx]
+
+
+def voxelize_volume(mesh, density=None, check_surface=True, slab_size=None, workers=1):
+    """Voxelize mesh to a UniformGrid occupancy mask.
+
+    The lattice points of a :class:`pyvista.UniformGrid` covering the
+    bounds of the mesh are classified as inside or outside of its
+    surface with scanline ray parity: each row of lattice points along
+    the x axis is intersected with the triangulated surface, and the
+    points following an odd number of crossings are inside. The volume
+    is processed in slabs of ``slab_size`` z planes so the memory used
+    by the intersections stays bounded, and slabs can be processed in
+    parallel.
+
+    Unlike :func:`voxelize`, no cells are built, and the mask only takes
+    one byte per voxel.
+
+    Parameters
+    ----------
+    mesh : pyvista.DataSet
+        Mesh to voxelize. Its surface must be closed.
+
+    density : float, np.ndarray or collections.abc.Sequence, optional
+        The uniform size of the voxels when single float passed.
+        A list of densities along x,y,z directions.
+        Defaults to 1/100th of the mesh length.
+
+    check_surface : bool, default: True
+        Specify whether to check the surface for closure. If on, then
+        the algorithm first checks to see if the surface is closed. If
+        the surface is not closed, a runtime error is raised.
+
+    slab_size : int, optional
+        Number of z planes processed at once. Defaults to the number of
+        planes holding about 16 million voxels.
+
+    workers : int, default: 1
+        Number of threads processing the slabs.
+
+    Returns
+    -------
+    pyvista.UniformGrid
+        Grid whose ``'Occupancy'`` point array is ``1`` for the points
+        inside the mesh and ``0`` otherwise.
+
+    Examples
+    --------
+    Voxelize a sphere and compute the fraction of the grid inside of it.
+
+    >>> import pyvista
+    >>> grid = pyvista.voxelize_volume(pyvista.Sphere(), density=0.01)
+    >>> grid.dimensions
+    (100, 100, 100)
+    >>> f"{grid['Occupancy'].mean():.3f}"
+    '0.518'
+
+    Convert the mask to the voxels touching the points inside the mesh.
+
+    >>> vox = grid.extract_points(grid['Occupancy'].view(bool))
+
     """
     if not pyvista.is_pyvista_dataset(mesh):
         mesh = pyvista.wrap(mesh)
@@ -63,24 +205,51 @@ def voxelize(mesh, density=None, check_surface=True):
     if not surface.is_all_triangles:
         # reduce chance for artifacts, see gh-1743
         surface.triangulate(inplace=True)
+    if check_surface and surface.n_open_edges > 0:
+        raise RuntimeError(
+            "Surface is not closed. Please read the warning in the "
+            "documentation for this function and either pass "
+            "`check_surface=False` or repair the surface."
+        )
 
     x_min, x_max, y_min, y_max, z_min, z_max = mesh.bounds
-    x = np.arange(x_min, x_max, density_x)
-    y = np.arange(y_min, y_max, density_y)
-    z = np.arange(z_min, z_max, density_z)
-    x, y, z = np.meshgrid(x, y, z)
-
-    # Create unstructured grid from the structured grid
-    grid = pyvista.StructuredGrid(x, y, z)
-    ugrid = pyvista.UnstructuredGrid(grid)
+    spacing = np.array([density_x, density_y, density_z], dtype=np.float64)
+    origin = np.array([x_min, y_min, z_min], dtype=np.float64)
+    dims = tuple(
+        max(np.arange(lower, upper, step).size, 1)
+        for lower, upper, step in zip(origin, (x_max, y_max, z_max), spacing)
+    )
 
-    # get part of the mesh within the mesh's bounding surface.
-    selection = ugrid.select_enclosed_points(surface, tolerance=0.0, check_surface=check_surface)
-    mask = selection.point_data['SelectedPoints'].view(np.bool_)
+    points = np.asarray(surface.points, dtype=np.float64)
+    triangles = points[surface.faces.reshape(-1, 4)[:, 1:]]
+    if slab_size is None:
+        slab_size = max((1 << 24) // (dims[0] * dims[1]), 1)
+    slabs = [(start, min(start + slab_size, dims[2])) for start in range(0, dims[2], slab_size)]
+
+    # sort the triangles by their lowest z plane to select them per slab
+    tri_z = (triangles[:, :, 2] - origin[2]) / spacing[2]
+    order = np.argsort(tri_z.min(axis=1), kind='stable')
+    triangles = triangles[order]
+    tri_lower = tri_z.min(axis=1)[order]
+    tri_upper = tri_z.max(axis=1)[order]
+
+    mask = np.empty(dims[::-1], dtype=np.uint8)
+
+    def process(slab):
+        start, stop = slab
+        selected = np.flatnonzero(tri_upper[: np.searchsorted(tri_lower, stop)] >= start - 1)
+        mask[start:stop] = _slab_parity(triangles[selected], origin, spacing, dims, slab)
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(process, slabs))
+    else:
+        for slab in slabs:
+            process(slab)
 
-    # extract cells from point indices
-    vox = ugrid.extract_points(mask)
-    return vox
+    grid = pyvista.UniformGrid(dimensions=dims, spacing=spacing, origin=origin)
+    grid.point_data['Occupancy'] = mask.ravel()
+    return grid
 
 
 def create_grid(dataset, dimensions=(101, 101, 101)):
@@ -224,6 +393,11 @@ def merge(
        does not attempt to create a manifold mesh and will include
        internal surfaces when two meshes overlap.
 
+    .. note::
+       To accumulate many meshes in a loop, collect them with a
+       :class:`pyvista.MeshBuilder` rather than merging them one at a
+       time.
+
     datasets : sequence of :class:`pyvista.Dataset`
         Sequence of datasets. Can be of any :class:`pyvista.Dataset`
 
@@ -272,3 +446,225 @@ def merge(
         main_has_priority=main_has_priority,
         progress_bar=progress_bar,
     )
+
+
+def _overlapping_box_pairs(bounds, tolerance=0.0):
+    """Return the pairs of overlapping boxes using sweep and prune.
+
+    Boxes are sorted by their minimum x coordinate so that each box
+    only needs to be compared to the boxes starting before its maximum
+    x coordinate. The remaining candidates are pruned on the y and z
+    axes in a single vectorized pass.
+
+    """
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 6)
+    lower = bounds[:, ::2] - tolerance
+    upper = bounds[:, 1::2] + tolerance
+
+    order = np.argsort(lower[:, 0], kind='stable')
+    sorted_lower = lower[order, 0]
+    # candidates of each box are the boxes after it starting before its end
+    stop = np.searchsorted(sorted_lower, upper[order, 0], side='right')
+    start = np.arange(order.size) + 1
+    counts = np.maximum(stop - start, 0)
+    first = np.repeat(np.arange(order.size), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = np.repeat(start, counts) + offsets
+
+    i, j = order[first], order[second]
+    overlap = np.all(lower[i, 1:] <= upper[j, 1:], axis=1)
+    overlap &= np.all(lower[j, 1:] <= upper[i, 1:], axis=1)
+    pairs = np.sort(np.column_stack((i[overlap], j[overlap])), axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _triangulated_surface(mesh):
+    """Return the triangulated surface of a mesh, cached on the mesh.
+
+    The surface is converted again when the mesh is modified.
+
+    """
+    if isinstance(mesh, pyvista.PolyData) and mesh.is_all_triangles:
+        return mesh
+    if getattr(mesh, '_triangulated_surface_key', None) != mesh.GetMTime():
+        surface = mesh if isinstance(mesh, pyvista.PolyData) else mesh.extract_surface()
+        mesh._triangulated_surface = surface.triangulate()
+        mesh._triangulated_surface_key = mesh.GetMTime()
+    return mesh._triangulated_surface
+
+
+def collide_many(
+    meshes,
+    box_tolerance=0.001,
+    cell_tolerance=0.0,
+    n_cells_per_node=2,
+    progress_bar=False,
+):
+    """Detect the collisions between many meshes.
+
+    Rather than testing every pair of meshes with
+    :func:`PolyDataFilters.collision`, the collisions are found in three
+    phases:
+
+    * A broad phase finds the pairs of meshes whose bounds overlap with
+      a sweep and prune over the bounding boxes of all meshes.
+    * For each overlapping pair, only the cells of each mesh that
+      overlap the intersection of both bounding boxes are selected
+      with the bounding volume hierarchy of the mesh (see
+      :attr:`pyvista.PolyData.bvh`), which is cached on the mesh and
+      reused across pairs and calls. The triangulated surface of other
+      meshes is cached on them as well, with its hierarchy.
+    * Those cells are handed to ``vtkCollisionDetectionFilter`` to
+      find the contacting cell pairs.
+
+    Parameters
+    ----------
+    meshes : sequence[pyvista.DataSet]
+        Meshes to test. Meshes that are not triangulated
+        :class:`pyvista.PolyData` surfaces are converted first, in
+        which case the contact cell ids refer to the cells of the
+        triangulated surface.
+
+    box_tolerance : float, optional
+        Oriented bounding box (OBB) tree tolerance in world
+        coordinates. The bounding boxes of the broad phase are also
+        padded by this tolerance.
+
+    cell_tolerance : float, optional
+        Cell tolerance (squared value).
+
+    n_cells_per_node : int, optional
+        Number of cells in each OBB.
+
+    progress_bar : bool, optional
+        Display a progress bar to indicate progress.
+
+    Returns
+    -------
+    list[tuple]
+        One ``(i, j, cells_i, cells_j)`` tuple for each pair of
+        colliding meshes, where ``i < j`` are the indices of the meshes
+        and ``cells_i`` and ``cells_j`` are arrays of the same length
+        with the ids of each pair of contacting cells.
+
+    Examples
+    --------
+    Find the collisions in a row of slightly overlapping spheres.
+
+    >>> import pyvista
+    >>> spheres = [pyvista.Sphere(center=(0.9 * i, 0, 0)) for i in range(5)]
+    >>> contacts = pyvista.collide_many(spheres)
+    >>> [(i, j) for i, j, _, _ in contacts]
+    [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+    """
+    surfaces = [_triangulated_surface(mesh) for mesh in meshes]
+    if not surfaces:
+        return []
+    bounds = np.array([surface.bounds for surface in surfaces])
+    pairs = _overlapping_box_pairs(bounds, box_tolerance)
+
+    # pad the region of interest to include cells within the tolerances
+    padding = box_tolerance + np.sqrt(cell_tolerance)
+    identity_transform = _vtk.vtkTransform()
+    identity_matrix = _vtk.vtkMatrix4x4()
+
+    contacts = []
+    for i, j in pairs:
+        overlap = np.empty(6)
+        overlap[::2] = np.maximum(bounds[i, ::2], bounds[j, ::2]) - padding
+        overlap[1::2] = np.minimum(bounds[i, 1::2], bounds[j, 1::2]) + padding
+
+        subsets = []
+        for surface in (surfaces[i], surfaces[j]):
+            cells = surface.bvh.query_box(overlap)
+            # share the points of the surface without modifying them, which
+            # would invalidate the cached surface and hierarchy
+            subset = pyvista.PolyData()
+            subset.SetPoints(surface.GetPoints())
+            subset.faces = surface.faces.reshape(-1, 4)[cells]
+            subsets.append((cells, subset))
+        if not subsets[0][0].size or not subsets[1][0].size:
+            continue
+
+        alg = _vtk.vtkCollisionDetectionFilter()
+        alg.SetInputData(0, subsets[0][1])
+        alg.SetTransform(0, identity_transform)
+        alg.SetInputData(1, subsets[1][1])
+        alg.SetMatrix(1, identity_matrix)
+        alg.SetBoxTolerance(box_tolerance)
+        alg.SetCellTolerance(cell_tolerance)
+        alg.SetNumberOfCellsPerNode(n_cells_per_node)
+        alg.SetCollisionModeToAllContacts()
+        pyvista.core.filters._update_alg(
+            alg, progress_bar, f'Computing collisions between meshes {i} and {j}'
+        )
+        if alg.GetNumberOfContacts():
+            cells_i = pyvista.convert_array(alg.GetContactCells(0))
+            cells_j = pyvista.convert_array(alg.GetContactCells(1))
+            contacts.append((int(i), int(j), subsets[0][0][cells_i], subsets[1][0][cells_j]))
+
+    return contacts
+
+
+def hausdorff_distance(mesh_a, mesh_b, return_statistics=False):
+    """Compute the Hausdorff distance between two surfaces.
+
+    The distance from each point of one surface to the other surface
+    is computed with :func:`PolyDataFilters.distance_to
+    <pyvista.PolyDataFilters.distance_to>` in both directions, and the
+    Hausdorff distance is the largest of these distances. The locators
+    of both surfaces are cached on them, so comparing many meshes to
+    the same reference only builds its locator once.
+
+    Parameters
+    ----------
+    mesh_a : pyvista.DataSet
+        First mesh. Meshes that are not :class:`pyvista.PolyData` are
+        compared through their surface.
+
+    mesh_b : pyvista.DataSet
+        Second mesh.
+
+    return_statistics : bool, default: False
+        Also return a ``dict`` of statistics of the distances in each
+        direction: ``'max_a_to_b'``, ``'mean_a_to_b'`` and
+        ``'rms_a_to_b'`` for the distances from the points of
+        ``mesh_a`` to ``mesh_b``, and the same ``'..._b_to_a'`` keys for
+        the other direction.
+
+    Returns
+    -------
+    float
+        Hausdorff distance between the meshes, measured at their points.
+
+    dict
+        Statistics of the distances. Only returned when
+        ``return_statistics=True``.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> sphere = pyvista.Sphere(radius=0.5)
+    >>> shifted = sphere.translate((0.1, 0, 0), inplace=False)
+    >>> f'{pyvista.hausdorff_distance(sphere, shifted):.3f}'
+    '0.100'
+
+    """
+    surfaces = [
+        mesh if isinstance(mesh, pyvista.PolyData) else mesh.extract_surface()
+        for mesh in (mesh_a, mesh_b)
+    ]
+    a_to_b = surfaces[0].distance_to(surfaces[1], signed=False, return_closest=False)
+    b_to_a = surfaces[1].distance_to(surfaces[0], signed=False, return_closest=False)
+    hausdorff = float(max(a_to_b.max(initial=0.0), b_to_a.max(initial=0.0)))
+    if not return_statistics:
+        return hausdorff
+    statistics = {}
+    for key, distances in (('a_to_b', a_to_b), ('b_to_a', b_to_a)):
+        statistics[f'max_{key}'] = float(distances.max(initial=0.0))
+        statistics[f'mean_{key}'] = float(distances.mean()) if distances.size else 0.0
+        statistics[f'rms_{key}'] = (
+            float(np.sqrt(np.mean(distances**2))) if distances.size else 0.0
+        )
+    return hausdorff, statistics
@@ -0,0 +1,353 @@
+"""Uniform spatial hashing for vectorized neighbor queries on point clouds."""
+import numpy as np
+
+# Approximate number of candidate point pairs evaluated per query chunk.
+_CANDIDATE_BUDGET = 1 << 22
+
+# Number of points binned at once when computing the cell keys.
+_CHUNK_SIZE = 1 << 20
+
+# Offsets of the 27 cells surrounding (and including) a cell.
+_NEIGHBOR_OFFSETS = np.stack(
+    np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing='ij'), axis=-1
+).reshape(-1, 3)
+
+
+class SpatialHash:
+    """Bin a point cloud into the cubic cells of a uniform grid.
+
+    Points are sorted by the flat index of the cell containing them, so
+    the points of each occupied cell are contiguous in :attr:`order`.
+    Neighbor queries gather the points of the 27 cells around each
+    query point with vectorized lookups in the sorted cell keys, which
+    keeps the cost linear in the number of points for a fixed density.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(N, 3)`` array of points.
+
+    cell_size : float
+        Edge length of the cubic cells.
+
+    Examples
+    --------
+    Count the neighbors within ``0.1`` of each point of a sphere.
+
+    >>> import pyvista
+    >>> from pyvista.utilities.spatial_hash import SpatialHash
+    >>> sphere = pyvista.Sphere()
+    >>> spatial_hash = SpatialHash(sphere.points, 0.1)
+    >>> spatial_hash.count_within(0.1).max()
+    34
+
+    """
+
+    def __init__(self, points, cell_size):
+        """Bin the points."""
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('`points` must be an (N, 3) array.')
+        cell_size = float(cell_size)
+        if not cell_size > 0:
+            raise ValueError('`cell_size` must be positive.')
+        self.points = points
+        self.cell_size = cell_size
+        self.n_points = points.shape[0]
+
+        if self.n_points:
+            self.origin = points.min(axis=0).astype(np.float64)
+            upper = points.max(axis=0).astype(np.float64)
+            self.dims = np.floor((upper - self.origin) / cell_size).astype(np.int64) + 1
+        else:
+            self.origin = np.zeros(3)
+            self.dims = np.ones(3, dtype=np.int64)
+        if np.prod(self.dims.astype(np.float64)) >= 2.0**62:
+            raise ValueError('`cell_size` is too small for the extent of the points.')
+
+        keys = np.empty(self.n_points, dtype=np.int64)
+        for start in range(0, self.n_points, _CHUNK_SIZE):
+            chunk = slice(start, start + _CHUNK_SIZE)
+            keys[chunk] = self._keys(self.cell_index(points[chunk]))
+        self.order = np.argsort(keys, kind='stable')
+        keys = keys[self.order]
+        self.cell_start = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        self.cell_keys = keys[self.cell_start]
+        self.cell_count = np.diff(np.r_[self.cell_start, self.n_points])
+        # coordinates of the sorted points stored per axis for fast gathers
+        self._sorted_coords = np.ascontiguousarray(points[self.order].T)
+
+    @property
+    def n_cells(self):
+        """Return the number of occupied cells.
+
+        Returns
+        -------
+        int
+            Number of cells containing at least one point.
+
+        """
+        return self.cell_keys.size
+
+    def cell_index(self, points):
+        """Return the integer ``(i, j, k)`` index of the cell containing each point.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            ``(N, 3)`` array of points. Points outside of the hashed
+            points' bounds are given indices outside of :attr:`dims`.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(N, 3)`` array of cell indices.
+
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        return np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+
+    def _keys(self, ijk):
+        """Return the flat index of each cell index."""
+        return (ijk[:, 0] * self.dims[1] + ijk[:, 1]) * self.dims[2] + ijk[:, 2]
+
+    def _chunk_size(self):
+        """Return the number of query points processed at once."""
+        occupancy = self.n_points / max(self.n_cells, 1)
+        return max(int(_CANDIDATE_BUDGET / (_NEIGHBOR_OFFSETS.shape[0] * occupancy)), 1)
+
+    def _candidates(self, ijk):
+        """Return the sorted positions of the points surrounding each cell, grouped by query."""
+        cell = (ijk[:, np.newaxis] + _NEIGHBOR_OFFSETS).reshape(-1, 3)
+        inside = np.all((cell >= 0) & (cell < self.dims), axis=1)
+        keys = self._keys(cell)
+        pos = np.searchsorted(self.cell_keys, keys)
+        pos[pos == self.n_cells] = 0
+        found = inside & (self.cell_keys[pos] == keys)
+        counts = np.where(found, self.cell_count[pos], 0)
+
+        first = self.cell_start[pos] - (np.cumsum(counts) - counts)
+        positions = np.repeat(first, counts) + np.arange(counts.sum())
+        return counts.reshape(ijk.shape[0], -1).sum(axis=1), positions
+
+    def _query(self, points, self_positions=None):
+        """Return the candidate pairs and their squared distances for a chunk of query points.
+
+        ``self_positions`` are the sorted positions of the query points
+        when they belong to the hash. Their distance to themselves is
+        set to infinity.
+
+        """
+        points = np.asarray(points, dtype=np.float64)
+        counts, position = self._candidates(self.cell_index(points))
+        distance = np.zeros(position.size)
+        for axis in range(3):
+            delta = np.repeat(points[:, axis], counts) - self._sorted_coords[axis].take(position)
+            distance += delta * delta
+        query = np.repeat(np.arange(points.shape[0]), counts)
+        if self_positions is not None:
+            distance[position == np.repeat(self_positions, counts)] = np.inf
+        return query, position, distance
+
+    def _query_order(self, points, query_ids):
+        """Return the order in which to process query points and their sorted positions.
+
+        Processing the query points cell by cell keeps the candidate
+        lookups local in memory.
+
+        """
+        if query_ids is None:
+            keys = self._keys(self.cell_index(points))
+            return np.argsort(keys, kind='stable'), None
+        positions = np.empty(self.n_points, dtype=np.intp)
+        positions[self.order] = np.arange(self.n_points)
+        positions = positions[query_ids]
+        return np.argsort(positions, kind='stable'), positions
+
+    def count_within(self, radius, points=None):
+        """Count the hashed points within a distance of each query point.
+
+        Parameters
+        ----------
+        radius : float
+            Search radius. Must not exceed :attr:`cell_size`.
+
+        points : numpy.ndarray, optional
+            ``(M, 3)`` array of query points. Defaults to the hashed
+            points themselves, in which case each point is not counted
+            as its own neighbor.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(M,)`` array of neighbor counts.
+
+        """
+        if radius > self.cell_size:
+            raise ValueError('`radius` must not exceed the cell size of the hash.')
+        if points is None:
+            points = self.points
+            order, positions = self.order, np.arange(self.n_points)
+        else:
+            points = np.asarray(points).reshape(-1, 3)
+            order, positions = self._query_order(points, None)
+        counts = np.zeros(points.shape[0], dtype=np.int64)
+        if not self.n_points:
+            return counts
+        chunk_size = self._chunk_size()
+        for start in range(0, points.shape[0], chunk_size):
+            rows = order[start : start + chunk_size]
+            query, _, distance = self._query(
+                points[rows], None if positions is None else positions[start : start + chunk_size]
+            )
+            counts[rows] = np.bincount(query[distance <= radius**2], minlength=rows.size)
+        return counts
+
+    def pairs_within(self, radius):
+        """Return the pairs of hashed points within a distance of each other.
+
+        Parameters
+        ----------
+        radius : float
+            Search radius. Must not exceed :attr:`cell_size`.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(M, 2)`` array of the indices of each pair of points, with
+            the smallest index first.
+
+        """
+        if radius > self.cell_size:
+            raise ValueError('`radius` must not exceed the cell size of the hash.')
+        pairs = [np.empty((0, 2), dtype=np.intp)]
+        chunk_size = self._chunk_size()
+        for start in range(0, self.n_points, chunk_size):
+            rows = self.order[start : start + chunk_size]
+            query, position, distance = self._query(self.points[rows])
+            first, second = rows[query], self.order[position]
+            close = (distance <= radius**2) & (first < second)
+            pairs.append(np.column_stack((first[close], second[close])))
+        return np.concatenate(pairs)
+
+    def _k_nearest(self, points, k, query_ids=None):
+        """Return the ``k`` nearest candidates of each query point.
+
+        ``query_ids`` are the indices of the query points in the hash
+        when they belong to it, which excludes them from their own
+        neighbors.
+
+        """
+        distances = np.full((points.shape[0], k), np.inf)
+        indices = np.full((points.shape[0], k), -1, dtype=np.intp)
+        n_candidates = np.zeros(points.shape[0], dtype=np.int64)
+        if not self.n_points:
+            return distances, indices, n_candidates
+        order, positions = self._query_order(points, query_ids)
+        chunk_size = self._chunk_size()
+        for start in range(0, points.shape[0], chunk_size):
+            rows = order[start : start + chunk_size]
+            self_positions = None if positions is None else positions[rows]
+            query, position, distance = self._query(points[rows], self_positions)
+            counts = np.bincount(query, minlength=rows.size)
+            n_candidates[rows] = counts if positions is None else counts - 1
+
+            # the candidates are grouped by query point, so they fill the
+            # leading columns of padded rows in order
+            width = max(counts.max(initial=0), k)
+            filled = np.arange(width) < counts[:, np.newaxis]
+            dist = np.full((rows.size, width), np.inf)
+            ind = np.zeros((rows.size, width), dtype=np.intp)
+            dist[filled] = distance
+            ind[filled] = position
+            if width > k:
+                nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+                dist = np.take_along_axis(dist, nearest, axis=1)
+                ind = np.take_along_axis(ind, nearest, axis=1)
+            nearest = np.argsort(dist, axis=1)
+            dist = np.take_along_axis(dist, nearest, axis=1)
+            ind = self.order[np.take_along_axis(ind, nearest, axis=1)]
+            ind[np.isinf(dist)] = -1
+            distances[rows] = np.sqrt(dist)
+            indices[rows] = ind
+        return distances, indices, n_candidates
+
+
+def nearest_neighbors(points, k, query_points=None):
+    """Return the ``k`` nearest neighbors of a set of points.
+
+    The points are hashed into cells about as wide as the distance to
+    the ``k``-th neighbor at the average density of the points.
+    The search is exact whenever the ``k``-th neighbor lies within one
+    cell of the query point, and the remaining (sparse) query points
+    are searched again on hashes with twice the cell size until every
+    query point is resolved.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        ``(N, 3)`` array of points to search.
+
+    k : int
+        Number of neighbors to return.
+
+    query_points : numpy.ndarray, optional
+        ``(M, 3)`` array of query points. Defaults to ``points``, in
+        which case a point is not returned as its own neighbor.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(M, k)`` array of distances sorted in increasing order.
+        Missing neighbors, when there are fewer than ``k`` candidate
+        points, have an infinite distance.
+
+    numpy.ndarray
+        ``(M, k)`` array of the indices of the neighbors in ``points``.
+        Missing neighbors have an index of ``-1``.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista.utilities.spatial_hash import nearest_neighbors
+    >>> points = pyvista.Plane(i_resolution=4, j_resolution=4).points
+    >>> distances, indices = nearest_neighbors(points, 4)
+    >>> distances[0]
+    array([0.25      , 0.25      , 0.35355339, 0.5       ])
+
+    """
+    points = np.asarray(points)
+    k = int(k)
+    if k < 1:
+        raise ValueError('`k` must be a positive integer.')
+    self_query = query_points is None
+    query_points = points if self_query else np.asarray(query_points).reshape(-1, 3)
+    n_available = points.shape[0] - 1 if self_query else points.shape[0]
+
+    distances = np.full((query_points.shape[0], k), np.inf)
+    indices = np.full((query_points.shape[0], k), -1, dtype=np.intp)
+    if not points.shape[0] or not query_points.shape[0]:
+        return distances, indices
+
+    # size the cells to about the radius of a ball holding ``k`` points
+    # at the average density of the points within their bounds
+    extent = np.ptp(points, axis=0).astype(np.float64)
+    spanned = extent[extent > 0]
+    if spanned.size:
+        cell_size = 0.75 * (np.prod(spanned) * k / points.shape[0]) ** (1 / spanned.size)
+        cell_size = max(cell_size, extent.max() / 2**20)
+    else:
+        cell_size = 1.0
+
+    pending = np.arange(query_points.shape[0])
+    while pending.size:
+        spatial_hash = SpatialHash(points, cell_size)
+        dist, ind, n_candidates = spatial_hash._k_nearest(
+            query_points[pending], k, pending if self_query else None
+        )
+        resolved = (dist[:, -1] <= cell_size) | (n_candidates >= n_available)
+        distances[pending[resolved]] = dist[resolved]
+        indices[pending[resolved]] = ind[resolved]
+        pending = pending[~resolved]
+        cell_size *= 2
+    return distances, indices
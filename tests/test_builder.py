@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+import pyvista
+from pyvista import _vtk
+
+
+def append_with_vtk(meshes, polydata=True):
+    alg = _vtk.vtkAppendPolyData() if polydata else _vtk.vtkAppendFilter()
+    for mesh in meshes:
+        alg.AddInputData(mesh)
+    alg.Update()
+    return pyvista.wrap(alg.GetOutput())
+
+
+@pytest.fixture()
+def parts():
+    sphere = pyvista.Sphere()
+    sphere.cell_data['ids'] = np.arange(sphere.n_cells)
+    line = pyvista.Line()
+    line.cell_data['ids'] = [-1]
+    cloud = pyvista.PolyData(np.random.default_rng(0).random((3, 3)))
+    cloud.cell_data['ids'] = [-2, -3, -4]
+    other = pyvista.Sphere(center=(2, 0, 0))
+    other.cell_data['ids'] = np.arange(other.n_cells) + sphere.n_cells
+    return [sphere, line, cloud, other]
+
+
+def test_mesh_builder_polydata(parts):
+    builder = pyvista.MeshBuilder()
+    assert builder.extend(parts) is builder
+    assert len(builder) == 4
+    assert builder.n_points == sum(part.n_points for part in parts)
+    assert builder.n_cells == sum(part.n_cells for part in parts)
+
+    mesh = builder.build()
+    expected = append_with_vtk(parts)
+    assert isinstance(mesh, pyvista.PolyData)
+    assert np.array_equal(mesh.points, expected.points)
+    assert np.array_equal(mesh.verts, expected.verts)
+    assert np.array_equal(mesh.lines, expected.lines)
+    assert np.array_equal(mesh.faces, expected.faces)
+    assert np.array_equal(mesh.cell_data['ids'], expected.cell_data['ids'])
+    assert mesh.cell_data.active_scalars_name == 'ids'
+
+    builder.clear()
+    assert not len(builder)
+    assert not builder.build().n_points
+
+
+def test_mesh_builder_unstructured(parts):
+    meshes = parts + [
+        pyvista.UniformGrid(dimensions=(3, 3, 3)),
+        pyvista.Plane().cast_to_unstructured_grid(),
+    ]
+    mesh = pyvista.MeshBuilder().extend(meshes).build()
+    expected = append_with_vtk(meshes, polydata=False)
+    assert isinstance(mesh, pyvista.UnstructuredGrid)
+    assert np.allclose(mesh.points, expected.points)
+    assert np.array_equal(mesh.cells, expected.cells)
+    assert np.array_equal(mesh.celltypes, expected.celltypes)
+
+
+def test_mesh_builder_arrays():
+    first = pyvista.Plane()
+    first['a'] = np.arange(first.n_points, dtype=np.int32)
+    first['b'] = np.ones(first.n_points)
+    second = pyvista.Plane(center=(2, 0, 0))
+    second['a'] = np.arange(second.n_points) * 0.5
+
+    mesh = pyvista.MeshBuilder().extend([first, second]).build()
+    assert 'b' not in mesh.point_data
+    assert mesh['a'].dtype == np.float64
+    assert np.array_equal(mesh['a'][first.n_points :], second['a'])
+
+    mesh = pyvista.MeshBuilder(arrays='union').extend([first, second]).build()
+    assert np.isnan(mesh['b'][first.n_points :]).all()
+    mesh = pyvista.MeshBuilder(arrays='union', fill_value=-1).extend([first, second]).build()
+    assert np.all(mesh['b'][first.n_points :] == -1)
+
+    with pytest.raises(ValueError, match='"a"'):
+        pyvista.MeshBuilder(arrays='strict').extend([first, second]).build()
+    with pytest.raises(ValueError, match='`arrays`'):
+        pyvista.MeshBuilder(arrays='foo')
+    with pytest.raises(ValueError, match='`tolerance`'):
+        pyvista.MeshBuilder(tolerance=-1)
+
+
+def test_mesh_builder_merge_points():
+    first = pyvista.Cube()
+    first['data'] = np.zeros(first.n_points)
+    second = pyvista.Cube(center=(1, 0, 0))
+    second['data'] = np.ones(second.n_points)
+
+    mesh = pyvista.MeshBuilder(merge_points=True).extend([first, second]).build()
+    assert mesh.n_points == 12
+    assert mesh.n_cells == 12
+    # the first point of the shared face keeps its data
+    assert mesh['data'].sum() == 4
+    assert np.allclose(mesh.cell_centers().points[:6], first.cell_centers().points)
+
+    shifted = pyvista.Cube(center=(1.0005, 0, 0))
+    builder = pyvista.MeshBuilder(merge_points=True).extend([first, shifted])
+    assert builder.build().n_points == 16
+    builder.tolerance = 0.001
+    assert builder.build().n_points == 12
@@ -788,3 +788,26 @@ def test_activate_plotting_scalars(multiblock_poly):
     for block in multiblock_poly:
         data = np.array(['a'] * block.n_points)
         block.point_data.set_array(data, 'data')
+
+
+def test_multi_block_describe():
+    volume = pyvista.Wavelet()
+    slices = pyvista.MultiBlock([volume.slice(normal='x'), None, volume.slice_along_axis(3, 'y')])
+    name = volume.active_scalars_name
+    values = np.concatenate([slices[0][name]] + [block[name] for block in slices[2]])
+
+    stats = slices.describe(name, preference='point', n_threads=2)
+    assert stats['count'] == values.size
+    assert np.isclose(stats['mean'], values.mean())
+    assert np.isclose(stats['std'], values.std())
+    assert (stats['min'], stats['max']) == slices.get_data_range(name)
+    assert np.array_equal(stats['histogram'], np.histogram(values, 256)[0])
+
+    # modifying a nested block invalidates the statistics
+    slices[2][1][name][:] = 0
+    assert slices.describe(name, preference='point')['min'] == 0
+
+    slices.append(pyvista.Sphere())
+    with pytest.raises(KeyError):
+        slices.describe(name)
+    assert slices.describe(name, allow_missing=True)['count'] == values.size
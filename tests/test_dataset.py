@@ -303,6 +303,111 @@ def test_transform_should_fail_given_wrong_numpy_shape(array, grid):
         grid.transform(array)
 
 
+def _transform_chain(mesh):
+    mesh.rotate_z(30, inplace=True)
+    mesh.translate((1, 2, 3), inplace=True)
+    mesh.scale((2, 1, 0.5), inplace=True)
+    mesh.rotate_vector((1, 1, 0), 20, inplace=True)
+
+
+def test_transform_stack():
+    mesh = pyvista.Sphere().compute_normals()
+    mesh['vectors'] = np.random.random((mesh.n_points, 3))
+    mesh.point_data.active_vectors_name = 'vectors'
+    expected = mesh.copy()
+    _transform_chain(expected)
+
+    points = mesh.points.copy()
+    with mesh.transform_stack() as stacked:
+        assert stacked is mesh
+        _transform_chain(mesh)
+        # nothing is applied before leaving the context
+        assert np.array_equal(mesh.GetPoints().GetData(), points)
+    assert mesh._pending_transform is None
+    assert np.allclose(mesh.points, expected.points, atol=1e-5)
+    assert np.allclose(mesh['vectors'], expected['vectors'], atol=1e-5)
+    assert np.allclose(mesh['Normals'], expected['Normals'], atol=1e-5)
+
+
+def test_transform_stack_flush():
+    mesh = pyvista.Sphere()
+    expected = mesh.copy()
+    expected.translate((1, 0, 0), inplace=True)
+    with mesh.transform_stack():
+        mesh.translate((1, 0, 0), inplace=True)
+        # accessing the geometry applies the pending transforms
+        assert mesh.bounds == expected.bounds
+        assert mesh.center == expected.center
+        # non-inplace transforms see the pending transforms
+        copy = mesh.rotate_x(90)
+        mesh.rotate_x(90, inplace=True)
+        with mesh.transform_stack():
+            mesh.flip_y(inplace=True)
+        # transforms with a different ``transform_all_input_vectors`` are
+        # not composed
+        mesh.translate((0, 1, 0), transform_all_input_vectors=True, inplace=True)
+    expected.rotate_x(90, inplace=True)
+    assert np.allclose(copy.points, expected.points, atol=1e-6)
+    expected.flip_y(inplace=True)
+    expected.translate((0, 1, 0), inplace=True)
+    assert np.allclose(mesh.points, expected.points, atol=1e-6)
+
+
+def _vtk_transform_filter(mesh, trans, transform_all_input_vectors):
+    alg = vtk.vtkTransformFilter()
+    alg.SetInputData(mesh)
+    alg.SetTransform(trans)
+    alg.SetTransformAllInputVectors(transform_all_input_vectors)
+    alg.Update()
+    return pyvista.wrap(alg.GetOutput())
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+@pytest.mark.parametrize('transform_all_input_vectors', [False, True])
+@pytest.mark.parametrize('inplace', [False, True])
+def test_transform_should_match_vtk_transform_filter(dtype, transform_all_input_vectors, inplace):
+    mesh = pyvista.Sphere().compute_normals(cell_normals=True)
+    mesh.points = mesh.points.astype(dtype)
+    mesh['vectors'] = np.random.random((mesh.n_points, 3)).astype(dtype)
+    mesh.point_data.active_vectors_name = 'vectors'
+    mesh['other'] = np.random.random((mesh.n_points, 3))
+    mesh.cell_data['cell_vectors'] = np.random.random((mesh.n_cells, 3))
+    mesh.cell_data.active_vectors_name = 'cell_vectors'
+
+    trans = vtk.vtkTransform()
+    trans.RotateWXYZ(30, 1, 2, 3)
+    trans.Scale(2, 0.5, 1.5)
+    trans.Translate(1, 2, 3)
+    expected = _vtk_transform_filter(mesh, trans, transform_all_input_vectors)
+
+    shallow = mesh.copy(deep=False)
+    original = mesh.copy()
+    result = mesh.transform(
+        trans, transform_all_input_vectors=transform_all_input_vectors, inplace=inplace
+    )
+    assert (result is mesh) == inplace
+    assert result.points.dtype == dtype
+    assert np.allclose(result.points, expected.points, atol=1e-5)
+    for data, expected_data in (
+        (result.point_data, expected.point_data),
+        (result.cell_data, expected.cell_data),
+    ):
+        assert sorted(data.keys()) == sorted(expected_data.keys())
+        for name in expected_data.keys():
+            assert data[name].dtype == expected_data[name].dtype
+            assert np.allclose(data[name], expected_data[name], atol=1e-5)
+        assert data.active_vectors_name == expected_data.active_vectors_name
+        assert data.active_normals_name == expected_data.active_normals_name
+
+    # datasets sharing the arrays of the input are left untouched
+    assert np.array_equal(shallow.points, original.points)
+    for name in original.point_data.keys():
+        assert np.array_equal(shallow.point_data[name], original.point_data[name])
+    if not inplace:
+        assert np.array_equal(mesh.points, original.points)
+        assert np.array_equal(mesh['Normals'], original['Normals'])
+
+
 @pytest.mark.parametrize('axis_amounts', [[1, 1, 1], [0, 0, 0], [-1, -1, -1]])
 def test_translate_should_translate_grid(grid, axis_amounts):
     grid_copy = grid.copy()
@@ -619,3 +619,79 @@ def test_complex(plane, dtype_str):
     assert plane.point_data[name].dtype == dtype
     plane.point_data[name] = plane.point_data[name].real
     assert np.issubdtype(plane.point_data[name].dtype, real_type)
+
+
+@mark.parametrize('n_threads', [1, 3])
+def test_describe(uniform, monkeypatch, n_threads):
+    monkeypatch.setattr(pyvista.utilities.arrays, '_DESCRIBE_CHUNK_SIZE', 100)
+    values = uniform['Spatial Point Data']
+    values[::7] = np.nan
+    finite = values[np.isfinite(values)]
+
+    stats = uniform.point_data.describe(
+        'Spatial Point Data', bins=50, quantiles=(0, 0.1, 0.5, 1), n_threads=n_threads
+    )
+    counts, edges = np.histogram(finite, 50)
+    assert stats['count'] == finite.size
+    assert np.isclose(stats['min'], finite.min())
+    assert np.isclose(stats['max'], finite.max())
+    assert np.isclose(stats['mean'], finite.mean())
+    assert np.isclose(stats['std'], finite.std())
+    assert np.array_equal(stats['histogram'], counts)
+    assert np.allclose(stats['bin_edges'], edges)
+    width = edges[1] - edges[0]
+    for q, value in stats['quantiles'].items():
+        assert abs(value - np.quantile(finite, q)) <= width
+
+    stats = uniform.point_data.describe('Spatial Point Data', component=0)
+    assert np.isclose(stats['max'], finite.max())
+
+
+def test_describe_cached(hexbeam):
+    hexbeam.point_data['data'] = np.arange(hexbeam.n_points, dtype=float)
+    stats = hexbeam.point_data.describe('data')
+    stats['histogram'][:] = 0
+    cached = hexbeam.point_data.describe('data')
+    assert cached['histogram'].sum() == hexbeam.n_points
+    assert cached['min'] == 0
+    assert hexbeam._describe_cache[(FieldAssociation.POINT, 'data')][1] is not None
+
+    # modifying the array invalidates the statistics
+    hexbeam.point_data['data'][:] += 1
+    assert hexbeam.point_data.describe('data')['min'] == 1
+    data = hexbeam.point_data['data']
+    data += 10
+    assert hexbeam.point_data.describe('data')['min'] == 11
+    view = data[5:]
+    view += 10
+    data.Modified()
+    assert hexbeam.point_data.describe('data')['max'] == data.max()
+    hexbeam.point_data['data'] = np.full(hexbeam.n_points, 5.0)
+    stats = hexbeam.point_data.describe('data', quantiles=(0.5,))
+    assert stats['std'] == 0
+    assert stats['quantiles'] == {0.5: 5.0}
+    assert np.allclose(stats['bin_edges'][[0, -1]], [4.5, 5.5])
+
+    # vectors are described by their magnitude
+    hexbeam.point_data['vectors'] = np.tile([3.0, 4.0, 0.0], (hexbeam.n_points, 1))
+    assert hexbeam.point_data.describe('vectors')['mean'] == 5
+    assert hexbeam.point_data.describe('vectors', component=-2)['mean'] == 4
+
+
+def test_describe_raises(hexbeam):
+    hexbeam.point_data['data'] = np.full(hexbeam.n_points, np.nan)
+    stats = hexbeam.point_data.describe('data')
+    assert stats['count'] == 0
+    assert np.isnan(stats['mean'])
+
+    with raises(KeyError):
+        hexbeam.point_data.describe('not-an-array')
+    with raises(ValueError, match='bins'):
+        hexbeam.point_data.describe('data', bins=0)
+    with raises(ValueError, match='quantiles'):
+        hexbeam.point_data.describe('data', quantiles=(50,))
+    with raises(ValueError, match='n_threads'):
+        hexbeam.point_data.describe('data', n_threads=0)
+    hexbeam.field_data['text'] = ['a', 'b']
+    with raises(TypeError, match='describe'):
+        hexbeam.field_data.describe('text')
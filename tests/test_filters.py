@@ -319,6 +319,61 @@ def test_slice_along_axis(datasets):
         dataset.slice_along_axis(axis='u')
 
 
+@pytest.mark.parametrize('generate_triangles', [False, True])
+def test_slice_along_axis_single_pass(hexbeam, generate_triangles):
+    hexbeam.cell_data['cell_ids'] = np.arange(hexbeam.n_cells)
+    slices = hexbeam.slice_along_axis(n=4, axis='z', generate_triangles=generate_triangles)
+    assert slices.keys() == ['slice0', 'slice1', 'slice2', 'slice3']
+    origin = list(hexbeam.center)
+    tolerance = (hexbeam.bounds[5] - hexbeam.bounds[4]) * 0.01
+    for slc, z in zip(
+        slices, np.linspace(hexbeam.bounds[4] + tolerance, hexbeam.bounds[5] - tolerance, 4)
+    ):
+        origin[2] = z
+        expected = hexbeam.slice('z', origin, generate_triangles=generate_triangles)
+        assert slc.n_cells == expected.n_cells
+        assert np.isclose(slc.area, expected.area)
+        assert np.allclose(slc.points[:, 2], z)
+        assert np.array_equal(np.sort(slc['cell_ids']), np.sort(expected['cell_ids']))
+        assert slc.point_data.keys() == expected.point_data.keys()
+        assert slc.point_data.active_scalars_name == expected.point_data.active_scalars_name
+
+
+def test_slice_along_axis_uniform(uniform):
+    uniform.cell_data.clear()
+    slices = uniform.slice_along_axis(n=3, axis='y', generate_triangles=True)
+    for slc in slices:
+        origin = list(uniform.center)
+        origin[1] = slc.center[1]
+        expected = uniform.slice('y', origin)
+        assert slc.n_points == expected.n_points
+        assert np.isclose(slc.area, expected.area)
+        assert np.allclose(
+            np.sort(slc['Spatial Point Data']), np.sort(expected['Spatial Point Data'])
+        )
+        assert slc.is_all_triangles
+
+    # quads are kept unless triangles are requested
+    slices = uniform.slice_along_axis(n=3, axis='y')
+    assert all(slc.n_cells == 81 for slc in slices)
+    assert not any(slc.is_all_triangles for slc in slices)
+
+
+@pytest.mark.parametrize('point_data', [False, True])
+def test_slice_uniform_without_active_scalars(point_data):
+    grid = pyvista.UniformGrid(dimensions=(10, 10, 10))
+    if point_data:
+        grid.point_data.set_array(np.arange(grid.n_points), 'data')
+        assert grid.point_data.active_scalars_name is None
+    for generate_triangles, n_cells in ((False, 81), (True, 162)):
+        slices = grid.slice_orthogonal(generate_triangles=generate_triangles)
+        assert [slc.n_cells for slc in slices] == [n_cells] * 3
+        slices = grid.slice_along_axis(n=3, generate_triangles=generate_triangles)
+        assert [slc.n_cells for slc in slices] == [n_cells] * 3
+        if point_data:
+            assert all('data' in slc.point_data for slc in slices)
+
+
 def test_slice_along_axis_composite(composite):
     # Now test composite data structures
     output = composite.slice_along_axis(progress_bar=True)
@@ -425,6 +480,47 @@ def test_threshold_multicomponent():
         mesh.threshold(value=0.5, scalars="data", component_mode="component", component=0.5)
 
 
+def test_threshold_multi(hexbeam):
+    hexbeam['x'] = hexbeam.points[:, 0]
+    hexbeam.cell_data['z'] = hexbeam.cell_centers().points[:, 2]
+    criteria = [
+        {'scalars': 'x', 'value': 0.5},
+        {'scalars': 'z', 'value': 2.0, 'method': 'lower'},
+    ]
+    result = hexbeam.threshold_multi(criteria)
+    expected = hexbeam.threshold(0.5, scalars='x').threshold(2.0, scalars='z', method='lower')
+    assert result.n_cells == expected.n_cells
+    assert np.allclose(
+        np.sort(result['VTKorigID']), np.sort(expected.point_data['VTKorigID'])
+    )
+    assert 'vtkOriginalCellIds' not in result.cell_data
+
+    either = hexbeam.threshold_multi(criteria, combine='or')
+    assert either.n_cells > result.n_cells
+
+    for all_scalars in [True, False]:
+        for invert in [True, False]:
+            single = hexbeam.threshold_multi(
+                {'scalars': 'x', 'value': (0.2, 0.6), 'invert': invert}, all_scalars=all_scalars
+            )
+            expected = hexbeam.threshold(
+                (0.2, 0.6), scalars='x', invert=invert, all_scalars=all_scalars
+            )
+            assert single.n_cells == expected.n_cells
+
+    result = hexbeam.threshold_multi(criteria, pass_arrays=[])
+    assert sorted(result.array_names) == ['x', 'z']
+
+    with pytest.raises(ValueError, match='At least one'):
+        hexbeam.threshold_multi([])
+    with pytest.raises(ValueError, match='combine'):
+        hexbeam.threshold_multi(criteria, combine='xor')
+    with pytest.raises(ValueError, match='scalars'):
+        hexbeam.threshold_multi([{'value': 0.5}])
+    with pytest.raises(TypeError):
+        hexbeam.threshold_multi([{'scalars': 'x', 'not_a_key': 1}])
+
+
 def test_threshold_percent(datasets):
     percents = [25, 50, [18.0, 85.0], [19.0, 80.0], 0.70]
     inverts = [False, True, False, True, False]
@@ -658,6 +754,110 @@ def test_contour_errors(uniform):
         uniform.contour(rng=[2, 1])
 
 
+@pytest.mark.parametrize('n_contours', [1, 3, 20])
+@pytest.mark.parametrize('to_unstructured', [False, True])
+def test_contour_auto(n_contours, to_unstructured):
+    grid = pyvista.UniformGrid(dimensions=(20, 20, 20))
+    grid['dist'] = np.linalg.norm(grid.points - grid.center, axis=1)
+    grid['other'] = grid.points[:, 0]
+    if to_unstructured:
+        grid = grid.cast_to_unstructured_grid()
+    values = np.linspace(2, 8, n_contours)
+    expected = grid.contour(values, scalars='dist', compute_normals=True)
+    out = grid.contour(values, scalars='dist', compute_normals=True, method='auto')
+    assert out.n_points == pytest.approx(expected.n_points, rel=0.05)
+    assert out.area == pytest.approx(expected.area, rel=0.01)
+    assert set(out.point_data.keys()) == set(expected.point_data.keys())
+    assert np.allclose(np.sort(np.unique(out['dist'].round(6))), values)
+    idx = out.find_closest_point(expected.points[0])
+    assert np.allclose(out['other'][idx], expected['other'][0], atol=0.1)
+
+
+@pytest.mark.parametrize('method', ['auto', 'contour', 'flying_edges'])
+def test_contour_pass_arrays(uniform, method):
+    uniform['other'] = uniform.points[:, 0]
+    out = uniform.contour(scalars='Spatial Point Data', method=method, pass_arrays=['other'])
+    assert set(out.point_data.keys()) == {'Spatial Point Data', 'other'}
+    assert 'other' in uniform.point_data
+    assert 'Spatial Cell Data' in uniform.cell_data
+
+    out = uniform.contour(scalars='Spatial Point Data', method=method, pass_arrays=[])
+    assert out.point_data.keys() == ['Spatial Point Data']
+
+    with pytest.raises(KeyError, match='not found'):
+        uniform.contour(scalars='Spatial Point Data', pass_arrays=['missing'])
+
+
+@pytest.mark.parametrize(
+    'method, kwargs',
+    [
+        ('clip', {}),
+        ('slice', {}),
+        ('slice_along_axis', {'n': 3}),
+        ('threshold', {'value': 0.0, 'scalars': 'Spatial Point Data'}),
+        ('extract_surface', {}),
+        ('cell_data_to_point_data', {}),
+        ('point_data_to_cell_data', {}),
+    ],
+)
+def test_pass_arrays(uniform, method, kwargs):
+    uniform['other'] = uniform.points[:, 0]
+    names = set(uniform.point_data.keys() + uniform.cell_data.keys())
+
+    out = getattr(uniform, method)(pass_arrays=['Spatial Cell Data'], **kwargs)
+    if isinstance(out, pyvista.MultiBlock):
+        out = out.combine()
+    kept = set(out.point_data.keys() + out.cell_data.keys()) - {'vtkOriginalPointIds'}
+    kept -= {'vtkOriginalCellIds'}
+    assert 'other' not in kept
+    assert 'Spatial Cell Data' in kept
+    if method == 'threshold':
+        assert 'Spatial Point Data' in kept
+    assert set(uniform.point_data.keys() + uniform.cell_data.keys()) == names
+
+    with pytest.raises(KeyError, match='not found'):
+        getattr(uniform, method)(pass_arrays=['missing'], **kwargs)
+
+
+def test_pass_arrays_multiblock(uniform):
+    sphere = pyvista.Sphere()
+    sphere['other'] = sphere.points[:, 0]
+    blocks = pyvista.MultiBlock([uniform, sphere])
+    out = blocks.clip(pass_arrays=['Spatial Point Data', 'other'])
+    assert out[0].point_data.keys() == ['Spatial Point Data']
+    assert out[0].cell_data.keys() == []
+    assert 'other' in out[1].point_data
+    assert 'Normals' not in out[1].point_data
+
+    with pytest.raises(KeyError, match='not found'):
+        blocks.clip(pass_arrays=['missing'])
+
+
+@pytest.mark.parametrize('generate_triangles', [False, True])
+def test_pass_arrays_slice_uniform(generate_triangles):
+    grid = pyvista.Wavelet()
+    grid['b'] = grid.points[:, 0]
+    kwargs = {'generate_triangles': generate_triangles}
+    expected = grid.slice_orthogonal(**kwargs)
+    slices = grid.slice_orthogonal(pass_arrays=['b'], **kwargs)
+    assert [slc.n_cells for slc in slices] == [slc.n_cells for slc in expected]
+    assert all(slc.point_data.keys() == ['b'] for slc in slices)
+
+    expected = grid.slice_along_axis(n=3, **kwargs)
+    slices = grid.slice_along_axis(n=3, pass_arrays=['b'], **kwargs)
+    assert [slc.n_cells for slc in slices] == [slc.n_cells for slc in expected]
+    for slc, exp in zip(slices, expected):
+        assert np.allclose(np.sort(slc['b']), np.sort(exp['b']))
+
+
+def test_sample_pass_arrays(uniform):
+    mesh = pyvista.Sphere(center=uniform.center, radius=uniform.length / 4)
+    result = mesh.sample(uniform, pass_arrays=['Spatial Point Data'])
+    assert 'Spatial Point Data' in result.point_data
+    assert 'Spatial Cell Data' not in result.point_data
+    assert 'Spatial Cell Data' in uniform.cell_data
+
+
 def test_elevation():
     dataset = examples.load_uniform()
     # Test default params
@@ -1011,6 +1211,37 @@ def test_split_and_connectivity():
         assert np.allclose(body.volume, volumes[i], rtol=0.1)
 
 
+def test_label_connected_regions():
+    dataset = examples.load_uniform()
+    dataset.set_active_scalars('Spatial Cell Data')
+    threshed = dataset.threshold_percent([0.15, 0.50], invert=True)
+
+    cell_labels, point_labels, sizes, bounds = threshed.label_connected_regions()
+    conn = threshed.connectivity()
+    assert np.array_equal(cell_labels, conn.cell_data['RegionId'])
+    cells = threshed.cell_connectivity.reshape(-1, 8)
+    assert np.all(point_labels[cells] == cell_labels[:, np.newaxis])
+
+    bodies = threshed.split_bodies()
+    assert np.array_equal(sizes, [body.n_cells for body in bodies])
+    assert np.allclose(bounds, [body.bounds for body in bodies])
+
+
+def test_label_connected_regions_datasets(datasets):
+    for dataset in datasets:
+        cell_labels, point_labels, sizes, bounds = dataset.label_connected_regions()
+        assert cell_labels.shape == (dataset.n_cells,)
+        assert point_labels.shape == (dataset.n_points,)
+        assert sizes.sum() == dataset.n_cells
+        assert bounds.shape == (sizes.size, 6)
+
+    # points without cells are not labeled
+    mesh = pyvista.PolyData(np.random.random((10, 3)), lines=[2, 0, 1])
+    cell_labels, point_labels, sizes, bounds = mesh.label_connected_regions()
+    assert np.array_equal(cell_labels, [0])
+    assert np.array_equal(point_labels, [0, 0] + [-1] * 8)
+
+
 def test_warp_by_scalar():
     data = examples.load_uniform()
     warped = data.warp_by_scalar(progress_bar=True)
@@ -1259,6 +1490,57 @@ def test_streamlines_from_source_structured_grids():
     assert all([stream.n_points, stream.n_cells])
 
 
+@pytest.mark.parametrize('interpolator_type', ['point', 'cell'])
+@pytest.mark.parametrize('n_threads', [1, 3])
+def test_streamlines_batched(uniform_vec, interpolator_type, n_threads):
+    mesh = uniform_vec.cast_to_unstructured_grid()
+    seeds = np.random.default_rng(0).uniform(0, 0.5, size=(20, 3))
+    offsets, points, time, reason, seed_ids = mesh.streamlines_batched(
+        seeds, 'vectors', n_threads=n_threads, interpolator_type=interpolator_type
+    )
+    expected = mesh.streamlines_from_source(
+        pyvista.PolyData(seeds), 'vectors', interpolator_type=interpolator_type
+    )
+    expected_points = np.concatenate([expected.get_cell(i).points for i in range(expected.n_cells)])
+    assert offsets.size == expected.n_lines + 1
+    assert offsets[-1] == points.shape[0] == time.size
+    assert np.allclose(np.sort(points, axis=0), np.sort(expected_points, axis=0))
+    assert np.array_equal(np.sort(reason), np.sort(expected['ReasonForTermination']))
+    assert np.array_equal(np.sort(seed_ids), np.sort(expected['SeedIds']))
+    # streamlines start at their seed
+    assert np.allclose(points[offsets[:-1]], seeds[seed_ids])
+    assert np.allclose(time[offsets[:-1]], 0)
+
+    # the streamlines are ordered by seed whatever the number of threads
+    assert np.all(np.diff(seed_ids) >= 0)
+    single = mesh.streamlines_batched(seeds, 'vectors', interpolator_type=interpolator_type)
+    for array, expected_array in zip((offsets, points, time, reason, seed_ids), single):
+        assert np.array_equal(array, expected_array)
+
+
+def test_streamlines_batched_seeds(uniform_vec):
+    source = pyvista.PolyData([[0.1, 0.1, 0.1], [100.0, 0.0, 0.0]])
+    offsets, points, time, reason, seed_ids = uniform_vec.streamlines_batched(
+        source, 'vectors', integration_direction='forward'
+    )
+    assert np.array_equal(seed_ids, [0])
+    assert offsets.size == 2
+
+    offsets, points, time, reason, seed_ids = uniform_vec.streamlines_batched(
+        [[100.0, 0.0, 0.0]], 'vectors'
+    )
+    assert offsets.tolist() == [0]
+    assert points.shape == (0, 3)
+    assert time.size == reason.size == seed_ids.size == 0
+
+    with pytest.raises(ValueError, match='seeds'):
+        uniform_vec.streamlines_batched([0, 0, 0])
+    with pytest.raises(ValueError, match='n_threads'):
+        uniform_vec.streamlines_batched(source, n_threads=0)
+    with pytest.raises(ValueError):
+        uniform_vec.streamlines_batched(source, integrator_type=42)
+
+
 def mesh_2D_velocity():
     mesh = pyvista.Plane(i_resolution=100, j_resolution=100)
     velocity = np.zeros([mesh.n_points, 3])
@@ -1402,6 +1684,17 @@ def test_sample_over_multiple_lines():
     assert name in sampled_multiple_lines.array_names  # is name in sampled result
 
 
+def test_sample_over_lines(uniform):
+    uniform['z'] = uniform.points[:, 2]
+    starts = [[1, 1, 0], [2, 3, 1]]
+    ends = [[1, 1, 9], [5, 3, 5]]
+    arrays, distance = uniform.sample_over_lines(starts, ends, resolution=4, progress_bar=True)
+    assert arrays['z'].shape == distance.shape == (2, 5)
+    assert np.allclose(arrays['z'][0], np.linspace(0, 9, 5))
+    assert np.allclose(distance[1], np.linspace(0, 5, 5))
+    assert np.all(arrays['vtkValidPointMask'] == 1)
+
+
 def test_sample_over_circular_arc():
     """Test that we get a circular arc."""
 
@@ -1654,6 +1947,73 @@ def test_extract_points():
     assert sub_surf_nocells.cells[0] == 1
 
 
+def _assert_same_extraction(fast, reference):
+    assert fast.n_points == reference.n_points
+    assert fast.n_cells == reference.n_cells
+    assert np.allclose(fast.points, reference.points)
+    assert np.array_equal(fast.celltypes, reference.celltypes)
+    assert np.array_equal(fast.cell_connectivity, reference.cell_connectivity)
+    for data, reference_data in [
+        (fast.point_data, reference.point_data),
+        (fast.cell_data, reference.cell_data),
+    ]:
+        assert data.keys() == reference_data.keys()
+        assert data.active_scalars_name == reference_data.active_scalars_name
+        for name in data.keys():
+            assert np.array_equal(data[name], reference_data[name])
+
+
+@pytest.mark.parametrize('mask', [True, False])
+def test_extract_cells_fast(uniform, mask):
+    # uniform grids are extracted by VTK, unstructured grids with NumPy
+    grid = uniform.cast_to_unstructured_grid()
+    ind = np.random.default_rng(0).random(grid.n_cells) > 0.5
+    if not mask:
+        ind = np.flatnonzero(ind)[::-1]
+    _assert_same_extraction(grid.extract_cells(ind), uniform.extract_cells(ind))
+    _assert_same_extraction(grid.extract_cells([3, 3, 1]), uniform.extract_cells([3, 3, 1]))
+
+
+@pytest.mark.parametrize('adjacent_cells', [True, False])
+@pytest.mark.parametrize('include_cells', [True, False])
+def test_extract_points_fast(uniform, adjacent_cells, include_cells):
+    grid = uniform.cast_to_unstructured_grid()
+    ind = uniform.points[:, 2] > uniform.center[2]
+    kwargs = {'adjacent_cells': adjacent_cells, 'include_cells': include_cells}
+    _assert_same_extraction(
+        grid.extract_points(ind, **kwargs), uniform.extract_points(ind, **kwargs)
+    )
+
+
+def test_extract_cells_polydata_cell_types():
+    mesh = pyvista.PolyData(np.random.random((20, 3)))
+    mesh.faces = [3, 0, 1, 2, 4, 3, 4, 5, 6, 5, 7, 8, 9, 10, 11]
+    mesh.verts = [1, 12, 2, 13, 14]
+    mesh.lines = [2, 15, 16, 3, 16, 17, 18]
+    mesh.strips = [4, 0, 1, 2, 19]
+    mesh.cell_data['ids'] = np.arange(mesh.n_cells)
+    ind = [0, 1, 2, 3, 4, 5, 6, 7]
+    extracted = mesh.extract_cells(ind)
+    expected = [
+        pyvista.CellType.VERTEX,
+        pyvista.CellType.POLY_VERTEX,
+        pyvista.CellType.LINE,
+        pyvista.CellType.POLY_LINE,
+        pyvista.CellType.TRIANGLE,
+        pyvista.CellType.QUAD,
+        pyvista.CellType.POLYGON,
+        pyvista.CellType.TRIANGLE_STRIP,
+    ]
+    assert extracted.celltypes.tolist() == expected
+    assert np.array_equal(extracted['ids'], ind)
+    assert np.array_equal(extracted['vtkOriginalCellIds'], ind)
+    assert np.array_equal(extracted.points, mesh.points)
+
+    extracted = mesh.extract_cells([3, 5])
+    assert np.array_equal(extracted['vtkOriginalPointIds'], [3, 4, 5, 6, 16, 17, 18])
+    assert extracted.points.dtype == mesh.points.dtype
+
+
 def test_slice_along_line_composite(composite):
     # Now test composite data structures
     a = [composite.bounds[0], composite.bounds[2], composite.bounds[4]]
@@ -2105,6 +2465,49 @@ def test_image_threshold_between(in_value, out_value):
     )
 
 
+@pytest.mark.parametrize(
+    'method, kwargs',
+    [
+        ('gaussian_smooth', dict(std_dev=(1, 2, 1.5), radius_factor=2)),
+        ('median_smooth', dict(kernel_size=(5, 3, 4))),
+        ('image_dilate_erode', dict(kernel_size=(5, 5, 3))),
+        ('image_threshold', dict(threshold=[0.2, 0.6])),
+    ],
+)
+def test_image_filters_tiled(method, kwargs, tmpdir):
+    volume = pyvista.UniformGrid(dimensions=(23, 31, 17), spacing=(0.5, 1, 2), origin=(1, 2, 3))
+    rng = np.random.default_rng(0)
+    volume['other'] = rng.random((volume.n_points, 3))
+    volume['data'] = (rng.random(volume.n_points) > 0.7).astype(np.float32)
+    volume.set_active_scalars('data')
+    expected = getattr(volume, method)(**kwargs)
+
+    for tile_kwargs in [dict(tile_size=7), dict(tile_size=(5, 9, 4), workers=3)]:
+        tiled = getattr(volume, method)(**kwargs, **tile_kwargs)
+        assert isinstance(tiled, pyvista.UniformGrid)
+        assert tiled.array_names == expected.array_names
+        assert tiled.active_scalars_name == expected.active_scalars_name == 'data'
+        assert tiled['data'].dtype == expected['data'].dtype
+        assert np.array_equal(tiled['data'], expected['data'])
+
+    filename = str(tmpdir.join('output.npy'))
+    tiled = getattr(volume, method)(**kwargs, memmap=filename)
+    assert np.array_equal(tiled['data'], expected['data'])
+    assert np.array_equal(np.load(filename).ravel(), expected['data'])
+
+
+def test_image_filters_tiled_invalid():
+    volume = pyvista.UniformGrid(dimensions=(5, 5, 5))
+    volume.cell_data['cell_data'] = np.zeros(volume.n_cells)
+    with pytest.raises(ValueError, match='point data'):
+        volume.median_smooth(scalars='cell_data', tile_size=2)
+    volume.point_data['point_data'] = np.zeros(volume.n_points)
+    with pytest.raises(ValueError, match='`tile_size`'):
+        volume.median_smooth(scalars='point_data', tile_size=0)
+    with pytest.raises(ValueError, match='`workers`'):
+        volume.median_smooth(scalars='point_data', workers=0)
+
+
 def test_extract_subset_structured():
     structured = examples.load_structured()
     voi = structured.extract_subset([0, 3, 1, 4, 0, 1])
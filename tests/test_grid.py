@@ -1007,6 +1007,176 @@ def test_fft_high_pass(noise_2d):
     assert not np.allclose(out[name], 0)
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.int32])
+def test_fft_numpy_engine(noise_2d, dtype):
+    name = noise_2d.active_scalars_name
+    noise_2d.spacing = (0.5, 2, 1)
+    noise_2d[name] = (noise_2d[name] * 100).astype(dtype)
+    noise_2d.field_data['field'] = [1]
+    single = dtype == np.float32
+    complex_dtype = np.complex64 if single else np.complex128
+    atol = 1e-3 if single else 1e-8
+
+    expected = noise_2d.fft()
+    noise_fft = noise_2d.fft(engine='numpy', workers=2)
+    assert noise_fft[name].dtype == complex_dtype
+    assert noise_fft.array_names == expected.array_names
+    assert noise_fft.active_scalars_name == name
+    assert np.allclose(noise_fft[name], expected[name], atol=atol * 100)
+
+    for cutoff, order in [((1, 1, 1), 1), ((0.3, 0.2, 0), 3)]:
+        for method in ('low_pass', 'high_pass'):
+            out = getattr(noise_fft, method)(*cutoff, order=order, engine='numpy')
+            assert out[name].dtype == complex_dtype
+            assert np.allclose(
+                out[name], getattr(expected, method)(*cutoff, order=order)[name], atol=atol * 100
+            )
+
+    full_pass = noise_fft.rfft(engine='numpy', output_scalars_name='out')
+    assert full_pass['out'].dtype == complex_dtype
+    assert np.allclose(full_pass['out'].real, noise_2d[name], atol=atol)
+
+    with pytest.raises(ValueError, match='`engine`'):
+        noise_2d.fft(engine='fftw')
+
+
+def test_fft_numpy_engine_releases_weights(noise_2d, monkeypatch):
+    from pyvista.core.filters import uniform_grid
+
+    butterworth_weights = uniform_grid._butterworth_weights
+    references = []
+
+    def weights(*args):
+        result = butterworth_weights(*args)
+        references.append(weakref.ref(result))
+        return result
+
+    monkeypatch.setattr(uniform_grid, '_butterworth_weights', weights)
+    noise_fft = noise_2d.fft(engine='numpy')
+    noise_fft.low_pass(1, 1, 1, engine='numpy')
+    noise_fft.high_pass(1, 1, 1, engine='numpy')
+    # the weights are as large as the grid and must not outlive the filter
+    assert len(references) == 2
+    assert all(reference() is None for reference in references)
+
+
+@pytest.mark.parametrize(
+    'grid',
+    [
+        pyvista.UniformGrid(dimensions=(20, 15, 10), spacing=(0.5, 1, 2), origin=(1, 2, 3)),
+        pyvista.UniformGrid(dimensions=(20, 15, 1)),
+        pyvista.RectilinearGrid(
+            np.cumsum(np.arange(1, 21)), -np.cumsum(np.arange(1, 16)), np.linspace(0, 1, 8)
+        ),
+    ],
+)
+def test_grid_find_analytic(grid):
+    rng = np.random.default_rng(0)
+    bounds = np.array(grid.bounds).reshape(3, 2)
+    points = rng.uniform(bounds[:, 0] - 0.2, bounds[:, 1] + 0.2, size=(500, 3))
+    points[::2, 2] = grid.bounds[4]
+
+    expected = pyvista.DataSet.find_containing_cell(grid, points)
+    assert np.array_equal(grid.find_containing_cell(points), expected)
+    assert grid.find_containing_cell(points[0]) == expected[0]
+
+    expected = [pyvista.DataSet.find_closest_point(grid, point) for point in points]
+    assert np.array_equal(grid.find_closest_point(points), expected)
+    assert grid.find_closest_point(points[1]) == expected[1]
+    assert len(grid.find_closest_point(points[0], n=3)) == 3
+
+    for _ in range(10):
+        low = rng.uniform(bounds[:, 0], bounds[:, 1])
+        query = np.column_stack((low, low + rng.random(3) * bounds.ptp(axis=1) / 4)).ravel()
+        expected = np.sort(pyvista.DataSet.find_cells_within_bounds(grid, query))
+        assert np.array_equal(grid.find_cells_within_bounds(query), expected)
+    with pytest.raises(TypeError):
+        grid.find_cells_within_bounds([0, 1])
+
+
+@pytest.mark.parametrize('grid_type', ['uniform', 'structured'])
+def test_structured_ids(grid_type):
+    grid = pyvista.UniformGrid(dimensions=(4, 5, 6))
+    if grid_type == 'structured':
+        grid = grid.cast_to_structured_grid()
+
+    coords = np.argwhere(np.ones(grid.dimensions, dtype=bool))
+    ind = grid.point_id(coords)
+    assert np.allclose(grid.points[ind], coords)
+    assert np.array_equal(grid.point_coords(ind), coords)
+    assert grid.point_id((1, 2, 3)) == 69
+    assert grid.point_coords(69) == (1, 2, 3)
+
+    centers = grid.cell_centers().points
+    coords = grid.cell_coords(np.arange(grid.n_cells))
+    assert np.allclose(centers, coords + 0.5)
+    assert np.array_equal(grid.cell_id(coords), np.arange(grid.n_cells))
+    assert grid.cell_id((2, 3, 4)) == grid.n_cells - 1
+
+    assert grid.point_id((4, 0, 0)) is None
+    assert grid.point_coords(grid.n_points) is None
+    assert grid.cell_id([(0, 0, 0), (3, 0, 0)]) is None
+    assert grid.cell_coords([-1]) is None
+
+
+@pytest.mark.parametrize('reduction', ['mean', 'max', 'nearest'])
+def test_build_pyramid(reduction):
+    grid = pyvista.UniformGrid(dimensions=(9, 8, 4), spacing=(0.5, 1, 2), origin=(1, 2, 3))
+    values = np.random.default_rng(0).random(grid.n_points)
+    grid.point_data['values'] = values
+    grid.point_data['labels'] = np.arange(grid.n_points, dtype=np.int32) % 7
+    grid.point_data['mask'] = values > 0.5
+    grid.set_active_scalars('values')
+
+    pyramid = grid.build_pyramid(reduction=reduction)
+    assert isinstance(pyramid, pyvista.ImagePyramid)
+    assert [level.dimensions for level in pyramid] == [
+        (9, 8, 4),
+        (4, 4, 2),
+        (2, 2, 1),
+        (1, 1, 1),
+    ]
+    level = pyramid[1]
+    assert np.allclose(level.spacing, (1, 2, 4))
+    shift = 0 if reduction == 'nearest' else 0.5
+    assert np.allclose(level.origin, np.array((1, 2, 3)) + shift * np.array(grid.spacing))
+    assert level.point_data.active_scalars_name == 'values'
+    assert level['labels'].dtype == np.int32
+    assert level['mask'].dtype == np.bool_
+
+    blocks = values.reshape(4, 8, 9)[:, :, :8].reshape(2, 2, 4, 2, 4, 2)
+    if reduction == 'mean':
+        expected = blocks.mean(axis=(1, 3, 5))
+    elif reduction == 'max':
+        expected = blocks.max(axis=(1, 3, 5))
+    else:
+        expected = blocks[:, 0, :, 0, :, 0]
+    assert np.allclose(level['values'], expected.ravel())
+
+    assert len(grid.build_pyramid(levels=2, reduction=reduction)) == 2
+
+
+def test_build_pyramid_2d(tmpdir):
+    grid = pyvista.UniformGrid(dimensions=(16, 8, 1))
+    grid.point_data['values'] = np.arange(grid.n_points, dtype=float)
+    filename = str(tmpdir.join('pyramid.vtm'))
+    pyramid = grid.build_pyramid(factor=4, filename=filename)
+    assert [level.dimensions for level in pyramid] == [(16, 8, 1), (4, 2, 1), (1, 2, 1)]
+    assert pyramid.finest_level(10).dimensions == (4, 2, 1)
+    with pytest.raises(ValueError, match='No level'):
+        pyramid.finest_level(0)
+
+    loaded = pyvista.ImagePyramid(pyvista.read(filename))
+    assert loaded.finest_level(10) == pyramid[1]
+
+    with pytest.raises(ValueError, match='`reduction`'):
+        grid.build_pyramid(reduction='median')
+    with pytest.raises(ValueError, match='`factor`'):
+        grid.build_pyramid(factor=1)
+    with pytest.raises(ValueError, match='`levels`'):
+        grid.build_pyramid(levels=0)
+
+
 @pytest.mark.parametrize('binary', [True, False])
 @pytest.mark.parametrize('extension', ['.vtk', '.vtr'])
 def test_save_rectilinear(extension, binary, tmpdir):
@@ -1091,6 +1261,60 @@ def test_grid_points():
     )
 
 
+@pytest.mark.parametrize(
+    'grid',
+    [
+        pyvista.UniformGrid(dimensions=(4, 5, 6), spacing=(0.5, 1, 2), origin=(1, 2, 3)),
+        pyvista.RectilinearGrid(
+            np.array([0, 1, 3.0]), np.array([0, 2.5]), np.array([-1, 0, 4, 5.0])
+        ),
+    ],
+)
+def test_implicit_points(grid):
+    expected = np.array([grid.GetPoint(i) for i in range(grid.n_points)])
+    points = grid.implicit_points
+    assert isinstance(points, pyvista.ImplicitPoints)
+    assert points.shape == expected.shape == grid.points.shape
+    assert len(points) == grid.n_points
+    assert points.dtype == np.float64
+    assert np.array_equal(np.asarray(points), expected)
+    assert np.array_equal(grid.points, expected)
+
+    assert np.array_equal(points[5], expected[5])
+    assert np.array_equal(points[-1], expected[-1])
+    assert np.array_equal(points[3:-2:4], expected[3:-2:4])
+    assert np.array_equal(points[[0, -1, 7]], expected[[0, -1, 7]])
+    mask = expected[:, 0] > 0.5
+    assert np.array_equal(points[mask], expected[mask])
+    for column in (0, -1, [0, 2], slice(1, None)):
+        assert np.array_equal(points[:, column], expected[:, column])
+        assert np.array_equal(points[::3, column], expected[::3, column])
+
+    chunks = list(points.iter_chunks(7))
+    assert all(len(chunk) == 7 for chunk in chunks[:-1])
+    assert np.array_equal(np.vstack(chunks), expected)
+
+    with pytest.raises(IndexError):
+        points[grid.n_points]
+    with pytest.raises(IndexError):
+        points[[0, grid.n_points]]
+    with pytest.raises(IndexError):
+        points[mask[1:]]
+    with pytest.raises(IndexError):
+        points[0.5]
+    with pytest.raises(ValueError):
+        next(points.iter_chunks(0))
+
+
+def test_implicit_points_extent():
+    grid = pyvista.UniformGrid(dimensions=(3, 3, 3), origin=(1, 0, 0))
+    grid.extent = (2, 4, 0, 2, 1, 3)
+    expected = np.array([grid.GetPoint(i) for i in range(grid.n_points)])
+    assert np.allclose(grid.points, expected)
+    assert np.allclose(grid.x, expected[:, 0])
+    assert np.allclose(grid.implicit_points[[4, 20]], expected[[4, 20]])
+
+
 def test_grid_extract_selection_points(struct_grid):
     grid = pyvista.UnstructuredGrid(struct_grid)
     sub_grid = grid.extract_points([0])
@@ -108,6 +108,18 @@ def test_filters_return_pointset(sphere):
     assert isinstance(clipped, pyvista.PointSet)
 
 
+def test_point_cloud_filters_return_pointset(pointset):
+    pointset.point_data['data'] = np.arange(pointset.n_points)
+    for cloud in (
+        pointset.voxel_down_sample(0.5),
+        pointset.remove_radius_outliers(0.5, min_neighbors=0),
+        pointset.remove_statistical_outliers(n_neighbors=3),
+        pointset.estimate_normals(n_neighbors=3),
+    ):
+        assert isinstance(cloud, pyvista.PointSet)
+        assert 'data' in cloud.point_data
+
+
 @pytest.mark.parametrize("force_float,expected_data_type", [(False, np.int64), (True, np.float32)])
 def test_pointset_force_float(force_float, expected_data_type):
     np_points = np.array([[1, 2, 3]], np.int64)
@@ -139,6 +151,24 @@ def test_translate():
     assert np.allclose(pset.center, [5, 5, 5])
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_translate_inplace_dtype(dtype):
+    pset = pyvista.PointSet(np.array([[1, 2, 3], [2, 3, 4]], dtype=dtype))
+    points = pset.points
+    assert pset.bounds == (1, 2, 2, 3, 3, 4)
+    pset.translate((4, 3, 2), inplace=True)
+    assert pset.points.dtype == dtype
+    assert np.shares_memory(pset.points, points)
+    assert pset.bounds == (5, 6, 5, 6, 5, 6)
+
+
+def test_translate_inplace_int():
+    pset = pyvista.PointSet(np.array([[1, 2, 3]]), force_float=False)
+    with pytest.warns(UserWarning, match='converted to'):
+        pset.translate((0.5, 0, 0), inplace=True)
+    assert np.allclose(pset.points, [[1.5, 2, 3]])
+
+
 def test_scale():
     np_points = np.array([1, 2, 3], dtype=float)
     pset = pyvista.PointSet(np_points)
@@ -229,6 +229,97 @@ def test_geodesic_distance(sphere):
     assert isinstance(distance_use_scalar_weights, float)
 
 
+def test_geodesic_distance_field(sphere):
+    pytest.importorskip('scipy')
+    distance, nearest = sphere.geodesic_distance_field(0)
+    assert distance[0] == 0
+    assert np.all(nearest == 0)
+    for end in [10, sphere.n_points - 1]:
+        assert np.isclose(distance[end], sphere.geodesic_distance(0, end))
+
+    # the nearest pole is the source of each point
+    distance, nearest = sphere.geodesic_distance_field([0, 1])
+    assert np.array_equal(nearest == 0, sphere.points[:, 2] < 0)
+
+    heat, nearest_heat = sphere.geodesic_distance_field([0, 1], method='heat')
+    assert np.array_equal(nearest, nearest_heat)
+    assert np.allclose(heat, distance, atol=0.1)
+
+    # unreachable points
+    mesh = sphere + pyvista.Sphere(center=(2, 0, 0))
+    distance, nearest = mesh.geodesic_distance_field(0)
+    assert np.isinf(distance[sphere.n_points :]).all()
+    assert np.all(nearest[sphere.n_points :] == -1)
+
+
+def test_geodesic_distance_field_fail(sphere, plane):
+    pytest.importorskip('scipy')
+    with pytest.raises(IndexError):
+        sphere.geodesic_distance_field([0, sphere.n_points])
+    with pytest.raises(ValueError):
+        sphere.geodesic_distance_field([])
+    with pytest.raises(ValueError):
+        sphere.geodesic_distance_field(0, method='foo')
+    with pytest.raises(NotAllTrianglesError):
+        plane.geodesic_distance_field(0, method='heat')
+
+
+def test_voxel_down_sample():
+    rng = np.random.default_rng(0)
+    cloud = pyvista.PolyData(rng.random((1000, 3)))
+    cloud['ids'] = np.arange(cloud.n_points)
+    cloud['vectors'] = cloud.points * 2
+    cloud.point_data.active_scalars_name = 'ids'
+    down = cloud.voxel_down_sample(0.5)
+    assert down.n_points == 8
+    assert down.n_verts == 8
+    assert down.point_data.active_scalars_name == 'ids'
+    assert np.allclose(down['vectors'], down.points * 2)
+
+    # each output point is the centroid of the points in its voxel
+    voxel = np.floor((cloud.points - cloud.points.min(axis=0)) / 0.5).astype(int)
+    octant = voxel @ [4, 2, 1]
+    for i in range(8):
+        assert np.allclose(down.points[i], cloud.points[octant == i].mean(axis=0), atol=1e-6)
+        assert np.isclose(down['ids'][i], np.arange(cloud.n_points)[octant == i].mean())
+
+    assert not pyvista.PolyData(np.empty((0, 3))).voxel_down_sample(1).n_points
+    with pytest.raises(ValueError):
+        cloud.voxel_down_sample(0)
+
+
+def test_remove_outliers(sphere):
+    outliers = np.array([[2.0, 2, 2], [-2, 0, 1], [0, 3, 0]])
+    cloud = pyvista.PolyData(np.vstack((sphere.points, outliers)))
+    cloud['data'] = np.arange(cloud.n_points)
+
+    clean = cloud.remove_radius_outliers(0.3, min_neighbors=2)
+    assert np.array_equal(clean['data'], np.arange(sphere.n_points))
+    assert np.allclose(clean.points, sphere.points)
+    assert cloud.remove_radius_outliers(0.3, min_neighbors=0).n_points == cloud.n_points
+
+    clean = cloud.remove_statistical_outliers(n_neighbors=8)
+    assert np.array_equal(clean['data'], np.arange(sphere.n_points))
+    assert cloud.remove_statistical_outliers(std_ratio=np.inf).n_points == cloud.n_points
+    assert pyvista.PolyData([0.0, 0, 0]).remove_statistical_outliers().n_points == 1
+
+
+def test_estimate_normals():
+    sphere = pyvista.Sphere(theta_resolution=60, phi_resolution=60)
+    cloud = pyvista.PolyData(sphere.points)
+    with_normals = cloud.estimate_normals(viewpoint=(0, 0, 0))
+    assert 'Normals' not in cloud.point_data
+    assert with_normals.point_data.active_normals_name == 'Normals'
+    assert np.allclose(with_normals['Normals'], -2 * cloud.points, atol=0.1)
+
+    cloud.estimate_normals(n_neighbors=8, inplace=True)
+    dots = np.abs(np.einsum('ij,ij->i', cloud['Normals'], 2 * cloud.points))
+    assert np.allclose(dots, 1, atol=0.01)
+
+    plane = pyvista.PolyData(pyvista.Plane().points).estimate_normals(viewpoint=(0, 0, 1))
+    assert np.allclose(plane['Normals'], [0, 0, 1])
+
+
 def test_ray_trace(sphere):
     points, ind = sphere.ray_trace([0, 0, 0], [1, 1, 1])
     assert np.any(points)
@@ -261,6 +352,74 @@ def test_multi_ray_trace(sphere):
         mesh.multi_ray_trace(origins, directions)
 
 
+def test_batch_ray_trace(sphere):
+    origins = [[1, 0, 1], [0.3, 0.05, 1], [0.2, 0.05, 1], [0.1, 0.05, 1]]
+    directions = [[0, 0, -1]] * 4
+    points, ind_r, ind_c, dist = sphere.batch_ray_trace(origins, directions)
+    assert np.array_equal(ind_r, [1, 1, 2, 2, 3, 3])
+    assert np.all(np.diff(dist[::2]) < 0)
+
+    points, ind_r, ind_c, dist = sphere.batch_ray_trace(origins, directions, first_point=True)
+    assert np.array_equal(ind_r, [1, 2, 3])
+    assert np.allclose(points[:, :2], np.array(origins)[1:, :2])
+    assert np.allclose(dist, 1 - points[:, 2])
+
+    # compare against the obbTree
+    for ray, cell, point in zip(ind_r, ind_c, points):
+        end = np.array(origins[ray]) + [0, 0, -2]
+        point_obb, cell_obb = sphere.ray_trace(origins[ray], end, first_point=True)
+        assert np.allclose(point, point_obb)
+        assert cell == cell_obb[0]
+
+    points, ind_r, ind_c, dist = sphere.batch_ray_trace(origins, directions, max_distance=0.1)
+    assert not ind_r.size
+
+    # the hierarchy is cached until the mesh is modified
+    bvh = sphere.bvh
+    assert sphere.bvh is bvh
+    sphere.points[:] *= 2
+    assert sphere.bvh is not bvh
+
+    with pytest.raises(NotAllTrianglesError):
+        pyvista.Cylinder().batch_ray_trace(origins, directions)
+
+
+def test_distance_to(sphere):
+    cloud = pyvista.PolyData(np.random.default_rng(0).normal(size=(500, 3)) * 0.4)
+    distances, closest, cells = cloud.distance_to(sphere)
+    expected = cloud.compute_implicit_distance(sphere)['implicit_distance']
+    assert np.allclose(distances, expected)
+    assert np.allclose(np.linalg.norm(cloud.points - closest, axis=1), np.abs(distances))
+    # the closest points lie on their cells
+    for i in range(0, 500, 50):
+        cell = sphere.get_cell(cells[i])
+        assert cell.bounds[0] - 1e-6 <= closest[i, 0] <= cell.bounds[1] + 1e-6
+
+    unsigned = cloud.distance_to(sphere, signed=False, return_closest=False)
+    assert np.allclose(unsigned, np.abs(expected))
+
+
+def test_distance_to_cached_locator(sphere):
+    cloud = pyvista.PolyData([[0.0, 0.0, 1.0]])
+    reference_count = sphere.GetReferenceCount()
+    assert cloud.distance_to(sphere, return_closest=False)[0] == pytest.approx(0.5, abs=1e-3)
+    # the cached locator does not hold a reference to the surface
+    assert sphere.GetReferenceCount() == reference_count
+    locator = sphere._distance_locator
+    cloud.distance_to(sphere)
+    assert sphere._distance_locator is locator
+    # the locator follows the modifications of the surface
+    sphere.points[:] *= 2
+    assert cloud.distance_to(sphere, return_closest=False)[0] == pytest.approx(0.0, abs=1e-3)
+
+    # meshes that are not triangulated surfaces are converted
+    cube = pyvista.Cube()
+    distances = cloud.distance_to(cube, return_closest=False)
+    assert distances[0] == pytest.approx(0.5)
+    grid = pyvista.UniformGrid(dimensions=(3, 3, 3), spacing=(0.5, 0.5, 0.5), origin=(-0.5,) * 3)
+    assert cloud.distance_to(grid, return_closest=False)[0] == pytest.approx(0.5)
+
+
 @skip_plotting
 def test_plot_curvature(sphere):
     sphere.plot_curvature(off_screen=True)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+import pyvista
+
+
+@pytest.fixture()
+def tetra_source():
+    source = pyvista.UniformGrid(dimensions=(8, 8, 8)).triangulate()
+    source['linear'] = source.points @ [1.0, 2.0, 3.0]
+    source['vectors'] = source.points
+    source.cell_data['cell_ids'] = np.arange(source.n_cells)
+    return source
+
+
+def test_sampler_probe(tetra_source):
+    sampler = pyvista.Sampler(tetra_source)
+    assert sampler.kernel == 'probe'
+    rng = np.random.default_rng(0)
+    points = rng.random((200, 3)) * 9 - 1
+    inside = np.all((points >= 0) & (points <= 7), axis=1)
+
+    values = sampler.sample_points(points)
+    assert set(values) == {'linear', 'vectors', 'cell_ids', 'vtkValidPointMask'}
+    assert np.array_equal(values['vtkValidPointMask'].astype(bool), inside)
+    assert np.allclose(values['linear'][inside], points[inside] @ [1.0, 2.0, 3.0])
+    assert np.allclose(values['vectors'][inside], points[inside])
+    assert np.all(values['linear'][~inside] == 0)
+
+    expected = tetra_source.probe(pyvista.PolyData(points))
+    assert np.allclose(values['linear'], expected['linear'])
+
+    threaded = sampler.sample_points(points, n_threads=3)
+    for name, array in values.items():
+        assert np.array_equal(threaded[name], array)
+
+
+def test_sampler_sample(tetra_source):
+    sampler = pyvista.Sampler(tetra_source, arrays=['linear'])
+    assert sampler.source.point_data.keys() == ['linear']
+    assert 'cell_ids' in tetra_source.cell_data
+
+    target = pyvista.UniformGrid(dimensions=(3, 3, 3), spacing=(3, 3, 3))
+    target['existing'] = np.zeros(target.n_points)
+    out = sampler.sample(target)
+    assert isinstance(out, pyvista.UniformGrid)
+    assert set(out.point_data.keys()) == {'existing', 'linear', 'vtkValidPointMask'}
+    assert np.allclose(out['linear'], target.points @ [1.0, 2.0, 3.0])
+    assert 'linear' not in target.point_data
+
+
+@pytest.mark.parametrize('kernel', ['gaussian', 'shepard', 'linear', 'voronoi'])
+def test_sampler_point_kernels(kernel):
+    cloud = pyvista.PolyData(np.random.default_rng(0).random((500, 3)))
+    cloud['values'] = np.full(cloud.n_points, 2.0)
+    sampler = pyvista.Sampler(cloud, kernel=kernel, radius=0.3, null_value=-1.0)
+    values = sampler.sample_points([[0.5, 0.5, 0.5], [5.0, 5.0, 5.0]])
+    assert values['values'][0] == pytest.approx(2.0)
+    if kernel != 'voronoi':
+        assert values['values'][1] == -1.0
+        assert values['vtkValidPointMask'].tolist() == [1, 0]
+
+    if kernel == 'gaussian':
+        target = pyvista.Plane(center=(0.5, 0.5, 0.5))
+        expected = target.interpolate(cloud, radius=0.3)
+        assert np.allclose(sampler.sample(target)['values'], expected['values'])
+
+
+def test_sampler_errors(tetra_source):
+    with pytest.raises(TypeError, match='PyVista mesh'):
+        pyvista.Sampler(np.zeros((3, 3)))
+    with pytest.raises(ValueError, match='not supported'):
+        pyvista.Sampler(tetra_source, kernel='cubic')
+    with pytest.raises(KeyError):
+        pyvista.Sampler(tetra_source, arrays=['missing'])
+    sampler = pyvista.Sampler(tetra_source)
+    with pytest.raises(ValueError, match=r'\(n, 3\)'):
+        sampler.sample_points(np.zeros((4, 2)))
+    with pytest.raises(ValueError, match='n_threads'):
+        sampler.sample_points(np.zeros((4, 3)), n_threads=0)
+    with pytest.raises(TypeError, match='PyVista mesh'):
+        sampler.sample(np.zeros((4, 3)))
+
+
+def test_sampler_sample_over_lines(tetra_source):
+    sampler = pyvista.Sampler(tetra_source)
+    rng = np.random.default_rng(0)
+    starts = rng.random((30, 3)) * 7
+    ends = rng.random((30, 3)) * 7
+    arrays, distance = sampler.sample_over_lines(starts, ends, 5, n_threads=2)
+    assert arrays['linear'].shape == (30, 6)
+    assert arrays['vectors'].shape == (30, 6, 3)
+    assert distance.shape == (30, 6)
+    assert np.allclose(distance[:, -1], np.linalg.norm(ends - starts, axis=1))
+    assert np.allclose(arrays['vectors'][:, 0], starts)
+    assert np.allclose(arrays['vectors'][:, -1], ends)
+
+    expected = tetra_source.sample_over_line(starts[3], ends[3], resolution=5)
+    assert np.allclose(arrays['linear'][3], expected['linear'])
+
+    with pytest.raises(ValueError, match='starts'):
+        sampler.sample_over_lines(starts[0], ends[0], 5)
+    with pytest.raises(ValueError, match='ends'):
+        sampler.sample_over_lines(starts, ends[:3], 5)
+    with pytest.raises(ValueError, match='resolution'):
+        sampler.sample_over_lines(starts, ends, 0)
+
+
+def test_sampler_flat_surface():
+    plane = pyvista.Plane()
+    plane['y'] = plane.points[:, 1]
+    line = pyvista.Line((-0.5, -0.25, 0), (0.5, -0.25, 0), 4)
+    out = pyvista.Sampler(plane).sample(line)
+    assert np.all(out['vtkValidPointMask'] == 1)
+    assert np.allclose(out['y'], -0.25)
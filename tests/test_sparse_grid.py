@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import pyvista
+
+
+@pytest.fixture()
+def sphere_grid():
+    grid = pyvista.UniformGrid(dimensions=(30, 25, 20), spacing=(0.5, 1, 2), origin=(1, 2, 3))
+    center = np.array(grid.center)
+    distance = np.linalg.norm(np.asarray(grid.implicit_points) - center, axis=1) - 8
+    grid.point_data['distance'] = np.clip(distance, -2, 2)
+    grid.point_data['vectors'] = np.random.default_rng(0).random((grid.n_points, 3))
+    grid.point_data['vectors'][distance >= 2] = 2
+    grid.set_active_scalars('distance')
+    return grid
+
+
+def test_sparse_voxel_grid_round_trip(sphere_grid):
+    sparse = pyvista.SparseVoxelGrid.from_uniform_grid(sphere_grid, block_size=4, background=2)
+    assert sparse.dimensions == sphere_grid.dimensions
+    assert np.allclose(sparse.origin, sphere_grid.origin)
+    assert 0 < sparse.n_blocks < np.prod(np.ceil(np.array(sphere_grid.dimensions) / 4))
+    assert sparse.block_indices.shape == (sparse.n_blocks, 3)
+    assert sorted(sparse.array_names) == ['distance', 'vectors']
+
+    dense = sparse.to_uniform_grid()
+    assert np.array_equal(dense['distance'], sphere_grid['distance'])
+    assert np.array_equal(dense['vectors'], sphere_grid['vectors'])
+
+
+def test_sparse_voxel_grid_lookup(sphere_grid):
+    sparse = pyvista.SparseVoxelGrid.from_uniform_grid(sphere_grid, block_size=4, background=2)
+    ijk = np.random.default_rng(1).integers(0, sphere_grid.dimensions, size=(100, 3))
+    flat = ijk[:, 0] + 30 * (ijk[:, 1] + 25 * ijk[:, 2])
+    assert np.array_equal(sparse.values_at_index(ijk, 'distance'), sphere_grid['distance'][flat])
+    assert np.array_equal(sparse.values_at_index(ijk, 'vectors'), sphere_grid['vectors'][flat])
+
+    points = sphere_grid.points[flat] + 0.1
+    assert np.array_equal(
+        sparse.values_at_points(points, 'distance'), sphere_grid['distance'][flat]
+    )
+    assert sparse.values_at_points([[-100, 0, 0]], 'distance')[0] == 2
+
+    with pytest.raises(IndexError):
+        sparse.values_at_index([[30, 0, 0]], 'distance')
+    assert sparse.active_scalars_name == 'distance'
+    assert np.array_equal(sparse.values_at_index(ijk), sphere_grid['distance'][flat])
+    with pytest.raises(KeyError):
+        sparse.values_at_index([[0, 0, 0]], 'missing')
+
+
+def test_sparse_voxel_grid_set_values():
+    sparse = pyvista.SparseVoxelGrid((50, 50, 50), block_size=10, background=-1)
+    assert sparse.n_blocks == 0
+    sparse.set_values_at_index([[0, 0, 0], [5, 5, 5], [49, 49, 49]], [1, 2, 3], 'labels')
+    assert sparse.n_blocks == 2
+    sparse.set_values_at_index([[25, 25, 25]], [1.5], 'other')
+    assert sparse.n_blocks == 3
+    assert np.array_equal(sparse.values_at_index([[5, 5, 5], [25, 25, 25]], 'labels'), [2, -1])
+    assert sparse.values_at_index([[0, 0, 0]], 'other')[0] == -1
+
+    grid = sparse.to_uniform_grid()
+    assert grid['labels'].sum() == 1 + 2 + 3 - (grid.n_points - 3)
+    assert sparse.nbytes < grid['labels'].nbytes
+
+    with pytest.raises(ValueError, match='`scalars`'):
+        pyvista.SparseVoxelGrid((10, 10, 10)).values_at_index([[0, 0, 0]])
+    with pytest.raises(ValueError, match='`block_size`'):
+        pyvista.SparseVoxelGrid((10, 10, 10), block_size=0)
+
+
+def test_sparse_voxel_grid_extract(sphere_grid):
+    sparse = pyvista.SparseVoxelGrid.from_uniform_grid(sphere_grid, block_size=4, background=2)
+    blocks = sparse.to_multiblock()
+    assert len(blocks) == sparse.n_blocks
+    ugrid = sparse.to_unstructured_grid()
+    assert ugrid.n_cells == sum(block.n_cells for block in blocks)
+    assert ugrid.n_cells < sphere_grid.n_cells
+    assert np.allclose(ugrid.bounds, sphere_grid.bounds, atol=4 * max(sphere_grid.spacing))
+
+
+def test_sparse_voxel_grid_filters(sphere_grid):
+    sparse = pyvista.SparseVoxelGrid.from_uniform_grid(sphere_grid, block_size=4, background=2)
+    thresholded = sparse.threshold(1.5, invert=True)
+    expected = sphere_grid.threshold(1.5, invert=True, preference='point')
+    assert thresholded.n_cells == expected.n_cells
+
+    surface = sparse.contour([0.0])
+    expected = sphere_grid.contour([0.0])
+    assert surface.n_points
+    assert np.isclose(surface.area, expected.area)
@@ -312,6 +312,17 @@ def test_get_sg_image_scraper():
 def test_voxelize(uniform):
     vox = pyvista.voxelize(uniform, 0.5)
     assert vox.n_cells
+    assert np.all(vox.celltypes == pyvista.CellType.HEXAHEDRON)
+    assert vox.volume > 0
+
+
+def test_voxelize_flat_lattice():
+    # a lattice with a single z plane has pixels, converted to quads
+    box = pyvista.Box(bounds=(0, 1, 0, 1, 0, 0.05))
+    vox = pyvista.voxelize(box, density=0.2)
+    assert vox.n_cells
+    assert np.all(vox.celltypes == pyvista.CellType.QUAD)
+    assert np.isclose(vox.area, 0.64)
 
 
 def test_voxelize_non_uniform_density(uniform):
@@ -336,6 +347,28 @@ def test_voxelize_throws_point_cloud(hexbeam):
         pyvista.voxelize(mesh)
 
 
+def test_voxelize_volume():
+    sphere = pyvista.Sphere()
+    grid = pyvista.voxelize_volume(sphere, density=0.02)
+    assert isinstance(grid, pyvista.UniformGrid)
+    assert grid.dimensions == (50, 50, 50)
+    assert grid['Occupancy'].dtype == np.uint8
+
+    # points away from the surface match the enclosed points
+    selected = grid.select_enclosed_points(sphere, tolerance=0.0)['SelectedPoints']
+    radius = np.linalg.norm(grid.points, axis=1)
+    far = np.abs(radius - 0.5) > 0.02
+    assert np.array_equal(grid['Occupancy'][far], selected[far])
+    assert np.array_equal(grid['Occupancy'][far], radius[far] < 0.5)
+
+    # slabs processed separately and in parallel give the same mask
+    slabs = pyvista.voxelize_volume(sphere, density=0.02, slab_size=3, workers=2)
+    assert np.array_equal(slabs['Occupancy'], grid['Occupancy'])
+
+    with pytest.raises(RuntimeError, match='not closed'):
+        pyvista.voxelize_volume(pyvista.Plane())
+
+
 def test_report():
     report = pyvista.Report(gpu=True)
     assert report is not None
@@ -703,6 +736,58 @@ def test_merge(sphere, cube, datasets):
     assert np.allclose(merged['data'], 0)
 
 
+def test_collide_many():
+    meshes = [pyvista.Sphere(center=(0.9 * i, 0, 0)) for i in range(4)]
+    meshes.append(pyvista.Cube(center=(0, 5, 0)))
+    meshes.append(pyvista.UniformGrid(dimensions=(3, 3, 3), origin=(-0.5, 5.4, -0.5)))
+
+    contacts = pyvista.collide_many(meshes)
+    assert [(i, j) for i, j, _, _ in contacts] == [(0, 1), (1, 2), (2, 3), (4, 5)]
+
+    # contact cells match the pairwise collision filter
+    collision, n_contacts = meshes[0].collision(meshes[1])
+    i, j, cells_i, cells_j = contacts[0]
+    assert cells_i.size == cells_j.size == n_contacts
+    assert np.array_equal(np.sort(cells_i), np.sort(collision.field_data['ContactCells']))
+
+    assert pyvista.collide_many([]) == []
+    assert pyvista.collide_many(meshes[:1]) == []
+
+    # the triangulated surfaces and their hierarchies are reused across calls
+    cube, grid = meshes[4], meshes[5]
+    surface, bvh = cube._triangulated_surface, cube._triangulated_surface.bvh
+    sphere_bvh = meshes[0].bvh
+    assert grid._triangulated_surface.is_all_triangles
+    pyvista.collide_many(meshes)
+    assert cube._triangulated_surface is surface
+    assert cube._triangulated_surface.bvh is bvh
+    assert meshes[0].bvh is sphere_bvh
+    cube.points[:] += [0, 10, 0]
+    contacts = pyvista.collide_many(meshes)
+    assert cube._triangulated_surface is not surface
+    assert [(i, j) for i, j, _, _ in contacts] == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_hausdorff_distance():
+    sphere = pyvista.Sphere(radius=0.5)
+    shifted = sphere.translate((0.1, 0, 0), inplace=False)
+    assert pyvista.hausdorff_distance(sphere, shifted) == pytest.approx(0.1, abs=1e-3)
+    assert pyvista.hausdorff_distance(sphere, sphere) == pytest.approx(0.0, abs=1e-6)
+
+    larger = pyvista.Sphere(radius=0.6)
+    hausdorff, statistics = pyvista.hausdorff_distance(sphere, larger, return_statistics=True)
+    assert hausdorff == pytest.approx(0.1, abs=1e-3)
+    assert statistics['max_a_to_b'] <= hausdorff
+    assert statistics['max_b_to_a'] <= hausdorff
+    assert statistics['mean_a_to_b'] <= statistics['rms_a_to_b'] <= statistics['max_a_to_b']
+
+    cube = pyvista.UniformGrid(dimensions=(2, 2, 2), origin=(-0.5, -0.5, -0.5))
+    assert pyvista.hausdorff_distance(cube, pyvista.Cube()) == pytest.approx(0.0)
+
+    # the cached locators do not keep the meshes alive
+    assert sphere.GetReferenceCount() == larger.GetReferenceCount() == 1
+
+
 def test_color():
     name, name2 = "blue", "b"
     i_rgba, f_rgba = (0, 0, 255, 255), (0.0, 0.0, 1.0, 1.0)